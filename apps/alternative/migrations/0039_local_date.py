@@ -0,0 +1,61 @@
+import zoneinfo
+
+from django.conf import settings
+from django.db import migrations, models
+
+MODELS = ["Value", "Flow"]
+
+
+def fill_local_dates(apps, schema_editor):
+    time_zone = zoneinfo.ZoneInfo(settings.TIME_ZONE)
+    for name in MODELS:
+        model = apps.get_model("alternative", name)
+        objs = list(model.objects.only("date"))
+        for obj in objs:
+            obj.local_date = obj.date.astimezone(time_zone).date()
+        model.objects.bulk_update(objs, ["local_date"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alternative", "0038_alternative_is_archived"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="value",
+            name="local_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="flow",
+            name="local_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(fill_local_dates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="value",
+            name="local_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name="flow",
+            name="local_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="flow",
+            index=models.Index(
+                fields=["alternative", "local_date"],
+                name="alternative_alterna_e539ef_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="value",
+            index=models.Index(
+                fields=["alternative", "local_date"],
+                name="alternative_alterna_14e036_idx",
+            ),
+        ),
+    ]
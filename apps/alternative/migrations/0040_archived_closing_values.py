@@ -0,0 +1,96 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def freeze_archived_alternatives(apps, schema_editor):
+    # the closing values of the depots that already have archived alternatives
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("""
+            insert into alternative_closingvalue (depot_id, day, value)
+            select
+                depot_id,
+                day,
+                round(sum(sum(delta)) over (partition by depot_id order by day), 2)
+            from (
+                select
+                    a.depot_id,
+                    v.local_date as day,
+                    v.value - coalesce(
+                        lag(v.value) over (
+                            partition by v.alternative_id order by v.local_date
+                        ),
+                        0
+                    ) as delta
+                from (
+                    select
+                        alternative_id,
+                        local_date,
+                        value,
+                        row_number() over (
+                            partition by alternative_id, local_date
+                            order by date desc
+                        ) as position
+                    from alternative_value
+                ) v
+                join alternative_alternative a on a.id = v.alternative_id
+                where v.position = 1 and a.is_archived
+            )
+            group by depot_id, day
+            """)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alternative", "0039_local_date"),
+        ("overview", "0004_alter_bucket_wanted_percentage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClosingValue",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("value", models.DecimalField(decimal_places=2, max_digits=15)),
+            ],
+            options={
+                "ordering": ["day"],
+                "abstract": False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name="alternative",
+            index=models.Index(
+                condition=models.Q(("is_archived", False)),
+                fields=["depot"],
+                name="alternative_active_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="closingvalue",
+            name="depot",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="closing_values",
+                to="alternative.depot",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="closingvalue",
+            constraint=models.UniqueConstraint(
+                fields=("depot", "day"), name="alternative_closingvalue_unique"
+            ),
+        ),
+        migrations.RunPython(freeze_archived_alternatives, migrations.RunPython.noop),
+    ]
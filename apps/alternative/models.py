@@ -7,12 +7,17 @@ from django.utils import timezone
 
 import apps.core.return_calculation as rc
 import apps.core.utils as utils
+from apps.core.models import ArchivableMixin, ClosingSeries
+from apps.core.models import ClosingValue as CoreClosingValue
+from apps.core.models import DataVersionMixin
 from apps.core.models import Depot as CoreDepot
+from apps.core.models import LocalDateMixin, LocalDateQuerySet
 from apps.overview.models import Bucket
 from apps.users.models import StandardUser
 
 
 class Depot(CoreDepot):
+    DATA_VERSION_FIELDS = ("name", "is_active", "value")
     user = models.ForeignKey(
         StandardUser,
         editable=False,
@@ -46,7 +51,10 @@ class Depot(CoreDepot):
 
     def get_value_df(self):
         if not hasattr(self, "value_df"):
-            self.value_df = utils.sum_up_value_dfs_from_items(self.alternatives.all())
+            # the archived alternatives are summed up in their closing values
+            items = list(self.alternatives.filter(is_archived=False))
+            items.append(ClosingSeries(ClosingValue, self.pk))
+            self.value_df = utils.sum_up_value_dfs_from_items(items)
         return self.value_df
 
     # setters
@@ -59,28 +67,84 @@ class Depot(CoreDepot):
         self.save()
 
     def calculate_value(self):
+        # the latest value of every alternative of this depot
         statement = """
             select sum(value) as value
-            from alternative_value v
-            left join alternative_alternative a on v.alternative_id = a.id
-            where depot_id = {}
-            and (date, alternative_id) in (
-                select max(date) as date, v.alternative_id
+            from (
+                select
+                    v.value,
+                    row_number() over (
+                        partition by v.alternative_id order by v.date desc
+                    ) as position
                 from alternative_value v
-                group by v.alternative_id
+                join alternative_alternative a on v.alternative_id = a.id
+                where a.depot_id = {} and not a.is_archived
             )
+            where position = 1
             """.format(
-            self.pk
-        )
+                self.pk
+            )
         self.value = self.__get_number_from_database(statement)
+        closing = ClosingValue.get_last_value(self.pk)
+        if closing is not None:
+            self.value = (self.value or 0) + float(closing)
 
     def reset_all(self):
-        for alternative in self.alternatives.all():
+        # the stats of archived alternatives do not change anymore
+        for alternative in self.alternatives.filter(is_archived=False):
             alternative.reset()
         self.reset()
 
 
-class Alternative(models.Model):
+class ClosingValue(CoreClosingValue):
+    # the value of the archived alternatives is the running sum of the changes
+    # of their last value of every day
+    STATEMENT = """
+        select
+            depot_id,
+            day,
+            round(sum(sum(delta)) over (order by day), 2)
+        from (
+            select
+                a.depot_id,
+                v.local_date as day,
+                v.value - coalesce(
+                    lag(v.value) over (
+                        partition by v.alternative_id order by v.local_date
+                    ),
+                    0
+                ) as delta
+            from (
+                select
+                    alternative_id,
+                    local_date,
+                    value,
+                    row_number() over (
+                        partition by alternative_id, local_date order by date desc
+                    ) as position
+                from alternative_value
+            ) v
+            join alternative_alternative a on a.id = v.alternative_id
+            where v.position = 1 and a.depot_id = %s and a.is_archived
+        )
+        group by day
+    """
+
+    depot = models.ForeignKey(
+        Depot, on_delete=models.CASCADE, related_name="closing_values"
+    )
+
+    class Meta(CoreClosingValue.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["depot", "day"], name="alternative_closingvalue_unique"
+            )
+        ]
+
+
+class Alternative(ArchivableMixin, DataVersionMixin, models.Model):
+    CLOSING = ClosingValue
+
     name = models.CharField(max_length=200)
     depot = models.ForeignKey(
         Depot, on_delete=models.CASCADE, related_name="alternatives"
@@ -105,6 +169,14 @@ class Alternative(models.Model):
 
     class Meta:
         unique_together = ("depot", "name")
+        # the depots only work with their active alternatives
+        indexes = [
+            models.Index(
+                fields=["depot"],
+                condition=models.Q(is_archived=False),
+                name="alternative_active_idx",
+            )
+        ]
 
     def __str__(self):
         return "{}".format(self.name)
@@ -155,19 +227,23 @@ class Alternative(models.Model):
 
     def get_value_df(self):
         if not hasattr(self, "value_df"):
+            # the last value of every day
             statement = """
-                select date(date) as date,
-                       value      as value
-                from alternative_value v
-                where v.alternative_id = {}
-                  and v.date in (
-                    select max(date)
+                select date, value
+                from (
+                    select
+                        local_date as date,
+                        value,
+                        row_number() over (
+                            partition by local_date order by date desc
+                        ) as position
                     from alternative_value
                     where alternative_id = {}
-                    group by date(date)
                 )
+                where position = 1
+                order by date
             """.format(
-                self.pk, self.pk
+                self.pk
             )
             # get the flow df
             self.value_df = utils.get_df_from_database(statement, ["date", "value"])
@@ -177,12 +253,12 @@ class Alternative(models.Model):
         if not hasattr(self, "flow_df"):
             statement = """
                 select 
-                    date(date) as date,
+                    local_date as date,
                     sum(flow) as flow
                 from alternative_flow f
                 join alternative_alternative a on f.alternative_id=a.id
                 where a.id = {}
-                group by date(date)
+                group by local_date
             """.format(
                 self.pk
             )
@@ -227,17 +303,21 @@ class Alternative(models.Model):
             self.profit = float(value.value) - float(self.invested_capital)
 
 
-class Value(models.Model):
+class Value(LocalDateMixin, models.Model):
     alternative = models.ForeignKey(
         Alternative, related_name="values", on_delete=models.CASCADE
     )
     date = models.DateTimeField()
+    local_date = models.DateField(editable=False)
     value = models.DecimalField(
         decimal_places=2, max_digits=15, validators=[MinValueValidator(0)]
     )
 
+    objects = LocalDateQuerySet.as_manager()
+
     class Meta:
         unique_together = ("alternative", "date")
+        indexes = [models.Index(fields=["alternative", "local_date"])]
 
     def __str__(self):
         return "{}: {} {}".format(self.alternative, self.get_date(), self.value)
@@ -257,18 +337,24 @@ class Value(models.Model):
     # setters
     def reset_deps(self):
         self.alternative.reset()
+        if self.alternative.is_archived:
+            ClosingValue.freeze(self.alternative.depot_id)  # type: ignore
         self.alternative.depot.reset()
 
 
-class Flow(models.Model):
+class Flow(LocalDateMixin, models.Model):
     alternative = models.ForeignKey(
         Alternative, related_name="flows", on_delete=models.CASCADE
     )
     date = models.DateTimeField()
+    local_date = models.DateField(editable=False)
     flow = models.DecimalField(decimal_places=2, max_digits=15)
 
+    objects = LocalDateQuerySet.as_manager()
+
     class Meta:
         unique_together = ("alternative", "date")
+        indexes = [models.Index(fields=["alternative", "local_date"])]
 
     def __str__(self):
         return "{}: {} {}".format(self.alternative, self.get_date(), self.flow)
@@ -1,8 +1,10 @@
+from datetime import UTC, date, datetime
+
 from django.test import Client, TestCase
 from django.urls import reverse_lazy
 
 from apps.alternative.forms import FlowForm, ValueForm
-from apps.alternative.models import Alternative, Depot
+from apps.alternative.models import Alternative, ClosingValue, Depot, Value
 from apps.users.models import StandardUser as User
 
 
@@ -106,3 +108,82 @@ class GeneralTestCase(TestCase):
     #     self.create_value("2020-05-05T13:31", 100)
     #     with self.assertRaises(ValueError):
     #         self.create_flow("2020-05-05T13:31", 100)
+
+
+class LocalDateTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="dummy")  # type: ignore
+        self.depot = Depot.objects.create(name="Test Depot", user=self.user)
+        self.alternative = Alternative.objects.create(
+            depot=self.depot, name="Test Alternative"
+        )
+
+    def create_value(self, date: datetime, value: int) -> Value:
+        return Value.objects.create(
+            alternative=self.alternative, date=date, value=value
+        )
+
+    def test_local_date_is_the_day_in_berlin(self):
+        # 23:30 utc is already the next day in berlin, in summer and in winter
+        summer = self.create_value(datetime(2025, 7, 1, 23, 30, tzinfo=UTC), 1)
+        winter = self.create_value(datetime(2025, 1, 1, 23, 30, tzinfo=UTC), 1)
+        assert summer.local_date == date(2025, 7, 2)
+        assert winter.local_date == date(2025, 1, 2)
+
+    def test_value_df_has_the_last_value_of_every_day(self):
+        self.create_value(datetime(2025, 7, 1, 10, tzinfo=UTC), 10)
+        self.create_value(datetime(2025, 7, 1, 20, tzinfo=UTC), 20)
+        self.create_value(datetime(2025, 7, 1, 23, tzinfo=UTC), 30)
+        # the saves cache the df of the first value on the alternative
+        df = Alternative.objects.get(pk=self.alternative.pk).get_value_df()
+        assert df.loc[:, "value"].tolist() == [20, 30]
+        self.depot.calculate_value()
+        assert self.depot.value == 30
+
+
+class ArchivedAlternativeTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="dummy")  # type: ignore
+        self.depot = Depot.objects.create(name="Test Depot", user=self.user)
+        self.alternatives = [
+            Alternative.objects.create(depot=self.depot, name=name)
+            for name in ["First", "Second", "Third"]
+        ]
+        values = [(1, 0, 100), (1, 1, 50), (3, 0, 120), (4, 2, 10), (6, 0, 0)]
+        for day, index, value in values:
+            for hour in [8, 18]:
+                Value.objects.create(
+                    alternative=self.alternatives[index],
+                    date=datetime(2025, 7, day, hour, tzinfo=UTC),
+                    value=value + hour,
+                )
+
+    def get_depot(self) -> Depot:
+        depot = Depot.objects.get(pk=self.depot.pk)
+        depot.calculate_value()
+        return depot
+
+    def archive(self, alternative: Alternative):
+        alternative.is_archived = True
+        alternative.save()
+
+    def test_archived_alternatives_are_read_from_the_closing_values(self):
+        depot = self.get_depot()
+        value, df = depot.value, depot.get_value_df()
+        self.archive(self.alternatives[0])
+        self.archive(self.alternatives[2])
+        closing = ClosingValue.objects.filter(depot=self.depot)
+        assert [c.value for c in closing] == [118, 138, 166, 46]
+        depot = self.get_depot()
+        assert depot.value == value
+        assert depot.get_value_df().equals(df)
+
+    def test_values_of_archived_alternatives_update_the_closing_values(self):
+        self.archive(self.alternatives[0])
+        Value.objects.create(
+            alternative=self.alternatives[0],
+            date=datetime(2025, 7, 8, tzinfo=UTC),
+            value=1000,
+        )
+        assert ClosingValue.objects.filter(depot=self.depot).last().value == 1000
+        assert self.get_depot().value == 1000 + 68 + 28
@@ -1,3 +1,4 @@
+from django.utils.functional import SimpleLazyObject
 from django.views import generic
 
 from apps.alternative.models import Alternative, Depot
@@ -24,7 +25,8 @@ class DetailDepotView(GetUserMixin, TabContextMixin, generic.DetailView):
         if not show_archived:
             alternatives = alternatives.filter(is_archived=False)
         context["alternatives"] = alternatives
-        context["stats"] = self.object.get_stats()
+        # the stats are only calculated if they are not in the fragment cache
+        context["stats"] = SimpleLazyObject(self.object.get_stats)
         return context
 
 
@@ -1,28 +1,103 @@
-from django.http import JsonResponse
+from django.http import HttpResponseBadRequest, JsonResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.gzip import gzip_page
 
+from apps.banking.models import RESOLUTIONS, Account, Category, Change, get_changes_page
+from apps.core.charts import ChartDataResponse
+from apps.core.utils import parse_date
 from apps.users.mixins import GetUserMixin
 
 
-class IncomeAndExpenditureData(GetUserMixin, View):
+class ChartDataView(GetUserMixin, View):
+    default_resolution: str
+
     def get_queryset(self):
         return self.get_user().banking_depots.all()
 
+    def get_data(self, instance, resolution, date_from, date_to):
+        raise NotImplementedError()
+
     def get(self, request, pk):
         instance = self.get_queryset().get(pk=pk)
 
-        data = instance.get_income_and_expenditure_data()
+        resolution = request.GET.get("resolution", self.default_resolution)
+        if resolution not in RESOLUTIONS:
+            return HttpResponseBadRequest(
+                "resolution needs to be one of {}.".format(", ".join(RESOLUTIONS))
+            )
+        try:
+            date_from = parse_date(request.GET.get("from"))
+            date_to = parse_date(request.GET.get("to"))
+        except ValueError:
+            return HttpResponseBadRequest("from or to is invalid.")
+
+        data = self.get_data(instance, resolution, date_from, date_to)
+
+        return ChartDataResponse(data)
+
+
+@method_decorator(gzip_page, name="dispatch")
+class IncomeAndExpenditureData(ChartDataView):
+    default_resolution = "month"
+
+    def get_data(self, instance, resolution, date_from, date_to):
+        return instance.get_income_and_expenditure_data(resolution, date_from, date_to)
+
+
+@method_decorator(gzip_page, name="dispatch")
+class BalanceData(ChartDataView):
+    default_resolution = "week"
+
+    def get_data(self, instance, resolution, date_from, date_to):
+        return instance.get_balance_data(resolution, date_from, date_to)
 
-        return JsonResponse(data, safe=False)
 
+def serialize_change(change: Change) -> dict:
+    return {
+        "pk": change.pk,
+        "date": timezone.localtime(change.date).strftime("%d.%m.%Y %H:%M"),
+        "account": str(change.account),
+        "category": str(change.category),
+        "description": change.get_description(),
+        "change": str(change.change),
+        "balance": str(change.running_balance),  # type: ignore
+        "edit_url": reverse("banking:edit_change", args=[change.pk]),
+        "delete_url": reverse("banking:delete_change", args=[change.pk]),
+    }
+
+
+class ChangesData(GetUserMixin, View):
+    partition: str
 
-class BalanceData(GetUserMixin, View):
     def get_queryset(self):
-        return self.get_user().banking_depots.all()
+        raise NotImplementedError()
 
     def get(self, request, pk):
         instance = self.get_queryset().get(pk=pk)
+        changes = instance.changes.select_related("account", "category")
+        try:
+            page, next_cursor = get_changes_page(
+                changes, self.partition, request.GET.get("before")  # type: ignore
+            )
+        except ValueError:
+            return HttpResponseBadRequest("before is not a valid cursor.")
+        return JsonResponse(
+            {"changes": [serialize_change(c) for c in page], "next": next_cursor}
+        )
 
-        data = instance.get_balance_data()
 
-        return JsonResponse(data, safe=False)
+class AccountChangesData(ChangesData):
+    partition = "account"
+
+    def get_queryset(self):
+        return Account.objects.filter(depot__in=self.get_user().banking_depots.all())
+
+
+class CategoryChangesData(ChangesData):
+    partition = "category"
+
+    def get_queryset(self):
+        return Category.objects.filter(depot__in=self.get_user().banking_depots.all())
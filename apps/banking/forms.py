@@ -11,6 +11,7 @@ from apps.banking.models import (
     Account,
     Category,
     Change,
+    ChangeRollup,
     ComdirectImport,
     ComdirectImportChange,
     CsvImport,
@@ -230,6 +231,10 @@ class CsvImportForm(forms.ModelForm):
             )
         account.changes.all().delete()
         Change.objects.bulk_create(changes)
+        ChangeRollup.rebuild([account])
+        # bulk_create skips the balance reset that Change.save does
+        account.depot.set_balances_to_none()
+        account.depot.reset_balance()
 
 
 class ComdirectStartLoginForm(forms.ModelForm):
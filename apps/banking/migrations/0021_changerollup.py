@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def fill_rollups(apps, schema_editor):
+    Change = apps.get_model("banking", "Change")
+    ChangeRollup = apps.get_model("banking", "ChangeRollup")
+    sums = (
+        Change.objects.annotate(day=TruncDate("date"))
+        .values("account_id", "category_id", "day")
+        .annotate(sum=Sum("change"), count=Count("id"))
+    )
+    ChangeRollup.objects.bulk_create(
+        ChangeRollup(
+            account_id=row["account_id"],
+            category_id=row["category_id"],
+            day=row["day"],
+            change=row["sum"],
+            count=row["count"],
+        )
+        for row in sums
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("banking", "0020_alter_csvimport_account"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeRollup",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "change",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=15),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="banking.account",
+                    ),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollups",
+                        to="banking.category",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["category", "day"],
+                        name="banking_cha_categor_fd3401_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "category", "day"),
+                        name="banking_changerollup_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_rollups, migrations.RunPython.noop),
+    ]
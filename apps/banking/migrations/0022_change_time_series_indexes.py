@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("banking", "0021_changerollup"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="change",
+            name="account",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="changes",
+                to="banking.account",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="change",
+            name="category",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="changes",
+                to="banking.category",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="change",
+            index=models.Index(
+                fields=["account", "date"], name="banking_cha_account_0f1d91_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="change",
+            index=models.Index(
+                fields=["category", "date"], name="banking_cha_categor_56d2f3_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+import zoneinfo
+
+from django.conf import settings
+from django.db import migrations, models
+
+MODELS = ["Change"]
+
+
+def fill_local_dates(apps, schema_editor):
+    time_zone = zoneinfo.ZoneInfo(settings.TIME_ZONE)
+    for name in MODELS:
+        model = apps.get_model("banking", name)
+        objs = list(model.objects.only("date"))
+        for obj in objs:
+            obj.local_date = obj.date.astimezone(time_zone).date()
+        model.objects.bulk_update(objs, ["local_date"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("banking", "0022_change_time_series_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="change",
+            name="local_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(fill_local_dates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="change",
+            name="local_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="change",
+            index=models.Index(
+                fields=["account", "local_date"], name="banking_cha_account_f0f1c2_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def freeze_archived_accounts(apps, schema_editor):
+    # the closing values of the depots that already have archived accounts
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("""
+            insert into banking_closingvalue (depot_id, day, value)
+            select
+                a.depot_id,
+                c.local_date,
+                round(
+                    sum(sum(c.change)) over (
+                        partition by a.depot_id order by c.local_date
+                    ),
+                    2
+                )
+            from banking_change c
+            join banking_account a on a.id = c.account_id
+            where a.is_archived
+            group by a.depot_id, c.local_date
+            """)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("banking", "0023_local_date"),
+        ("overview", "0004_alter_bucket_wanted_percentage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClosingValue",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("value", models.DecimalField(decimal_places=2, max_digits=15)),
+            ],
+            options={
+                "ordering": ["day"],
+                "abstract": False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name="account",
+            index=models.Index(
+                condition=models.Q(("is_archived", False)),
+                fields=["depot"],
+                name="banking_account_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                condition=models.Q(("is_archived", False)),
+                fields=["depot"],
+                name="banking_category_active_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="closingvalue",
+            name="depot",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="closing_values",
+                to="banking.depot",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="closingvalue",
+            constraint=models.UniqueConstraint(
+                fields=("depot", "day"), name="banking_closingvalue_unique"
+            ),
+        ),
+        migrations.RunPython(freeze_archived_accounts, migrations.RunPython.noop),
+    ]
@@ -1,24 +1,31 @@
 import hashlib
 import json
 from datetime import date, datetime
+from datetime import timezone as dt_timezone
 from decimal import Decimal
-from typing import TYPE_CHECKING, Literal, TypedDict, Union
+from typing import TYPE_CHECKING, Iterable, Literal, TypedDict, Union
 from uuid import uuid4
 
-import pandas as pd
 import requests
 from django.contrib.sessions.backends.base import SessionBase
 from django.db import connection, models, transaction
+from django.db.models import Count, F, Q, Sum, Window
+from django.db.models.functions import TruncMonth, TruncYear
 from django.utils import timezone
 from pydantic import BaseModel
 
 import apps.banking.duplicated_code as banking_duplicated_code
 from apps.banking.utils import format_currency_amount_to_de
 from apps.core import utils
+from apps.core.cache import get_or_set_for_user
+from apps.core.charts import ChartData
 from apps.core.functional import list_create, list_map, list_sort
 from apps.core.models import Account as CoreAccount
+from apps.core.models import ArchivableMixin, ClosingSeries
+from apps.core.models import ClosingValue as CoreClosingValue
+from apps.core.models import DataVersionMixin
 from apps.core.models import Depot as CoreDepot
-from apps.core.utils import turn_dict_of_dicts_into_list_of_dicts
+from apps.core.models import LocalDateMixin, LocalDateQuerySet
 from apps.overview.models import Bucket
 from apps.users.models import StandardUser
 
@@ -26,7 +33,27 @@ if TYPE_CHECKING:
     from django.db.models.query import QuerySet
 
 
+# the sqlite expressions that turn a day into the first day of its period
+RESOLUTIONS = {
+    "day": "date({0})",
+    "week": "date({0}, '-6 days', 'weekday 1')",
+    "month": "date({0}, 'start of month')",
+    "quarter": (
+        "date({0}, 'start of month', "
+        "printf('-%d months', (cast(strftime('%m', {0}) as integer) - 1) % 3))"
+    ),
+    "year": "date({0}, 'start of year')",
+}
+
+
+class Statements(TypedDict):
+    months: list[str]
+    data: dict[str, list[float]]
+
+
 class Depot(CoreDepot):
+    # the most money moved accounts are not shown, the cron recomputes them
+    DATA_VERSION_FIELDS = ("name", "is_active", "balance")
     user = models.ForeignKey(
         StandardUser,
         editable=False,
@@ -57,17 +84,22 @@ class Depot(CoreDepot):
         categories: QuerySet["Category"]
 
     # getters
-    def get_date_name_value_chart_data(self, statement):
+    def get_date_name_value_chart_data(self, statement) -> ChartData:
         cursor = connection.cursor()
         assert str(self.pk) in statement
         cursor.execute(statement)
-        data = {}
+        # the statement is ordered by date, one array per name
+        dates: list[str] = []
+        series: dict[str, list[float | None]] = {}
         for dt, name, value in cursor.fetchall():
-            if dt not in data:
-                data[dt] = {}
-            data[dt][name] = value
-        data = turn_dict_of_dicts_into_list_of_dicts(data, "date")
-        return data
+            if not dates or dates[-1] != dt:
+                dates.append(dt)
+                for values in series.values():
+                    values.append(None)
+            if name not in series:
+                series[name] = [None] * len(dates)
+            series[name][-1] = value
+        return dates, series
 
     def get_accounts(self):
         return self.accounts.all()
@@ -75,33 +107,60 @@ class Depot(CoreDepot):
     def get_total_value(self) -> float:
         return float(self.balance or 0)
 
-    def get_income_and_expenditure_data(self):
-        statement = (
-            "select "
-            "strftime('%Y-%m', banking_change.date) as date, "
-            "banking_category.name ,"
-            "round(sum(banking_change.change)) as change "
-            "from banking_change "
-            "join banking_category on banking_category.id = banking_change.category_id "
-            "where banking_category.depot_id = {} "
-            "group by banking_category.name, strftime('%Y-%m', banking_change.date) "
-            "order by date"
-        ).format(self.pk)
+    def get_income_and_expenditure_data(
+        self,
+        resolution: str = "month",
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> ChartData:
+        period = RESOLUTIONS[resolution].format("r.day")
+        statement = """
+            select {period} as date, c.name, round(sum(r.change)) as change
+            from banking_changerollup r
+            join banking_category c on c.id = r.category_id
+            where c.depot_id = {pk}
+            and r.day >= '{date_from}' and r.day <= '{date_to}'
+            group by c.name, {period}
+            order by date
+        """.format(
+            period=period,
+            pk=self.pk,
+            date_from=date_from or date.min,
+            date_to=date_to or date.max,
+        )
         data = self.get_date_name_value_chart_data(statement)
         return data
 
-    def get_balance_data(self):
-        statement = (
-            "select "
-            "strftime('%Y-%W', banking_change.date) as date, "
-            "banking_account.name as name, "
-            "round(avg(banking_change.balance)) as balance "
-            "from banking_change "
-            "join banking_account on banking_account.id = banking_change.account_id "
-            "where depot_id={} "
-            "group by strftime('%Y-%W', banking_change.date), banking_account.name "
-            "order by date"
-        ).format(self.pk)
+    def get_balance_data(
+        self,
+        resolution: str = "week",
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> ChartData:
+        # the balance at the end of every period is the running sum over all
+        # periods, so the window is applied after the sum
+        period = RESOLUTIONS[resolution].format("r.day")
+        statement = """
+            select date, name, round(balance) from (
+                select
+                    {period} as date,
+                    a.name as name,
+                    sum(sum(r.change)) over (
+                        partition by r.account_id order by {period}
+                    ) as balance
+                from banking_changerollup r
+                join banking_account a on a.id = r.account_id
+                where a.depot_id = {pk} and not a.is_archived
+                group by r.account_id, {period}
+            )
+            where date >= '{date_from}' and date <= '{date_to}'
+            order by date
+        """.format(
+            period=period,
+            pk=self.pk,
+            date_from=date_from or date.min,
+            date_to=date_to or date.max,
+        )
         data = self.get_date_name_value_chart_data(statement)
         return data
 
@@ -116,7 +175,10 @@ class Depot(CoreDepot):
 
     def get_value_df(self):
         if not hasattr(self, "value_df"):
-            self.value_df = utils.sum_up_value_dfs_from_items(self.accounts.all())
+            # the archived accounts are summed up in their closing values
+            items = list(self.accounts.filter(is_archived=False))
+            items.append(ClosingSeries(ClosingValue, self.pk))
+            self.value_df = utils.sum_up_value_dfs_from_items(items)
         return self.value_df
 
     def get_stats(self):
@@ -146,50 +208,47 @@ class Depot(CoreDepot):
                 max_account = (account, changes_count)
         return max_account[0] if max_account else None
 
-    def _get_statements_df(self):
-        changes = (
-            Change.objects.filter(
-                account__in=self.accounts.all(),
-            )
-            .filter(date__gte=timezone.now() - timezone.timedelta(days=365))
-            .values_list("date", "category__name", "change")
-            .order_by("category__changes_count")
-        )
-        df = pd.DataFrame(changes, columns=["date", "category", "change"])
-        df["month"] = pd.to_datetime(df["date"]).dt.to_period("M")
-        monthly_summary = (
-            df.groupby(["month", "category"])["change"].sum().reset_index()
+    def calculate_statements(self, since: date) -> Statements:
+        # one grouped query returns the month x category matrix, ordered so
+        # that the rows and columns come out in the order they are shown
+        rows = (
+            ChangeRollup.objects.filter(account__depot=self, day__gte=since)
+            .annotate(month=TruncMonth("day"))
+            .values_list("month", "category__name")
+            .annotate(total=Sum("change"))
+            .order_by("-month", "category__name")
         )
-        monthly_summary = monthly_summary.sort_values("month", ascending=False)
-        monthly_summary["month"] = monthly_summary["month"].dt.strftime("%B %y")
-        return monthly_summary
-
-    def get_statements(self):
-        df = self._get_statements_df()
-        months = df["month"].unique().tolist()
-        categories = df["category"].unique().tolist()
-
-        result = {"months": months, "data": {}}
-
-        for category in categories:
-            result["data"][category] = [0.0] * len(months)
-
-        for _, row in df.iterrows():
-            month = row["month"]
-            category = row["category"]
-            amount = float(row["change"])
-
-            month_index = months.index(month)
-            result["data"][category][month_index] = amount
+        months: dict[date, int] = {}
+        data: dict[str, list[float]] = {}
+        for month, category, total in rows:
+            if month not in months:
+                months[month] = len(months)
+                for values in data.values():
+                    values.append(0.0)
+            if category not in data:
+                data[category] = [0.0] * len(months)
+            data[category][months[month]] = float(total)
+        return {
+            "months": [month.strftime("%B %y") for month in months],
+            "data": dict(sorted(data.items())),
+        }
 
-        return result
+    def get_statements(self) -> Statements:
+        today = timezone.localdate()
+        since = today - timezone.timedelta(days=365)
+        # the key contains the day as the statements cover the last year
+        name = "banking_statements:{}:{}".format(self.pk, today)
+        return get_or_set_for_user(
+            self.user, name, lambda: self.calculate_statements(since)
+        )
 
     # setters
     def set_balances_to_none(self):
+        # the balances of archived accounts and categories are frozen
         Depot.objects.filter(pk=self.pk).update(balance=None)
-        accounts = Account.objects.filter(depot=self)
+        accounts = Account.objects.filter(depot=self, is_archived=False)
         accounts.update(balance=None)
-        Category.objects.filter(depot=self).update(balance=None)
+        Category.objects.filter(depot=self, is_archived=False).update(balance=None)
         Change.objects.filter(account__in=accounts).update(balance=None)
 
     def calculate_changes_count(self):
@@ -202,13 +261,45 @@ class Depot(CoreDepot):
 
     def set_balance(self):
         changes = Change.objects.filter(
-            account__in=self.accounts.all(), category__in=self.categories.all()
+            account__in=self.accounts.filter(is_archived=False),
+            category__in=self.categories.all(),
         )
-        banking_duplicated_code.set_balance(self, changes)
+        balance = changes.aggregate(Sum("change"))["change__sum"] or 0
+        self.balance = balance + (ClosingValue.get_last_value(self.pk) or 0)
+        self.save()
+
+
+class ClosingValue(CoreClosingValue):
+    # the balance of the archived accounts is the running sum of their changes
+    STATEMENT = """
+        select
+            a.depot_id,
+            c.local_date,
+            round(sum(sum(c.change)) over (order by c.local_date), 2)
+        from banking_change c
+        join banking_account a on a.id = c.account_id
+        where a.depot_id = %s and a.is_archived
+        group by c.local_date
+    """
+
+    depot = models.ForeignKey(
+        Depot, on_delete=models.CASCADE, related_name="closing_values"
+    )
 
+    class Meta(CoreClosingValue.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["depot", "day"], name="banking_closingvalue_unique"
+            )
+        ]
 
-class Account(CoreAccount):
+
+class Account(ArchivableMixin, CoreAccount):
     TYPE = "Banking"
+    CLOSING = ClosingValue
+    # the balance and the changes count are cached values that are filled
+    # while rendering and by the cron
+    DATA_VERSION_FIELDS = ("name", "bucket", "is_archived")
     depot = models.ForeignKey(Depot, on_delete=models.CASCADE, related_name="accounts")
     is_archived = models.BooleanField(default=False)
     DEFAULT_DATE_CHOICES = (
@@ -241,6 +332,14 @@ class Account(CoreAccount):
 
     class Meta:
         ordering = ["-changes_count"]
+        # the depots only work with their active accounts
+        indexes = [
+            models.Index(
+                fields=["depot"],
+                condition=Q(is_archived=False),
+                name="banking_account_active_idx",
+            )
+        ]
 
     def __str__(self):
         return f"{self.name}"
@@ -308,12 +407,12 @@ class Account(CoreAccount):
                     unbounded preceding and current row) as amount
                 from (
                     select
-                        date(date) as date,
+                        local_date as date,
                         sum(change) as change
                     from banking_change
                     where account_id={}
-                    group by date(date)
-                    order by date
+                    group by local_date
+                    order by local_date
                 );
             """.format(
                 self.pk
@@ -329,7 +428,9 @@ class YearBalance(TypedDict):
     balance: float
 
 
-class Category(models.Model):
+class Category(DataVersionMixin, models.Model):
+    # the names of the categories are part of the cached statements
+    DATA_VERSION_FIELDS = ("name", "is_archived")
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     depot = models.ForeignKey(
@@ -347,6 +448,16 @@ class Category(models.Model):
 
     if TYPE_CHECKING:
         changes: QuerySet["Change"]
+        _monthly_sums: dict[date, Decimal]
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["depot"],
+                condition=Q(is_archived=False),
+                name="banking_category_active_idx",
+            )
+        ]
 
     def __str__(self):
         return self.name
@@ -414,9 +525,12 @@ class Category(models.Model):
     def get_month(self, month: date) -> str:
         if self.monthly_budget is None:
             return "-"
-        amount = self.changes.filter(
-            date__year=month.year, date__month=month.month
-        ).aggregate(total=models.Sum("change"))["total"]
+        if hasattr(self, "_monthly_sums"):
+            amount = self._monthly_sums.get(month)
+        else:
+            amount = self.changes.filter(
+                date__year=month.year, date__month=month.month
+            ).aggregate(total=models.Sum("change"))["total"]
         if amount is None or amount >= 0:
             return "✓"
         _amount = abs(amount)
@@ -436,13 +550,14 @@ class Category(models.Model):
         return Category.objects.filter(depot=depot)
 
 
-class Change(models.Model):
+class Change(LocalDateMixin, models.Model):
     account = models.ForeignKey(
-        Account, on_delete=models.CASCADE, related_name="changes"
+        Account, on_delete=models.CASCADE, related_name="changes", db_index=False
     )
     date = models.DateTimeField()
+    local_date = models.DateField(editable=False)
     category = models.ForeignKey(
-        Category, related_name="changes", on_delete=models.PROTECT
+        Category, related_name="changes", on_delete=models.PROTECT, db_index=False
     )
     description = models.TextField(blank=True)
     change = models.DecimalField(decimal_places=2, max_digits=15)
@@ -451,9 +566,20 @@ class Change(models.Model):
         max_digits=15, decimal_places=2, null=True, blank=True
     )
 
+    objects = LocalDateQuerySet.as_manager()
+
     if TYPE_CHECKING:
         comdirect_import_changes: QuerySet["ComdirectImportChange"]
 
+    class Meta:
+        # balances and pages are always read per account or category in
+        # date order, the composite indexes replace the foreign key indexes
+        indexes = [
+            models.Index(fields=["account", "date"]),
+            models.Index(fields=["category", "date"]),
+            models.Index(fields=["account", "local_date"]),
+        ]
+
     def __init__(self, *args, **kwargs):
         super(Change, self).__init__(*args, **kwargs)
 
@@ -461,33 +587,46 @@ class Change(models.Model):
         return "{} - {}".format(self.get_date(self.account.depot.user), self.change)
 
     def save(self, *args, **kwargs):
-        something_changed = False
-
-        if self.pk is not None:
-            change = Change.objects.get(pk=self.pk)
-
-            if (
-                change.account != self.account
-                or change.category != self.category
-                or change.date != self.date
-                or change.change != self.change
-            ):
+        # the rollup is only right if the removal of the old change, the save
+        # and the addition of the new change happen together
+        with transaction.atomic():
+            something_changed = False
+            change = None
+
+            if self.pk is not None:
+                change = Change.objects.get(pk=self.pk)
+
+                if (
+                    change.account != self.account
+                    or change.category != self.category
+                    or change.date != self.date
+                    or change.change != self.change
+                ):
+                    something_changed = True
+                    change.set_balances_of_affected_objects_to_null()
+                    ChangeRollup.add(change, -1)
+
+            elif self.pk is None:
                 something_changed = True
-                change.set_balances_of_affected_objects_to_null()
 
-        elif self.pk is None:
-            something_changed = True
+            super().save(*args, **kwargs)
 
-        super().save(*args, **kwargs)
-
-        if something_changed:
-            self.set_balances_of_affected_objects_to_null()
+            if something_changed:
+                if change is not None and change.account_id != self.account_id:
+                    change.freeze_closing_values()
+                self.freeze_closing_values()
+                self.set_balances_of_affected_objects_to_null()
+                ChangeRollup.add(self, 1)
 
     def delete(self, using=None, keep_parents=False):
         self.set_balances_of_affected_objects_to_null()
         with transaction.atomic():
             self.comdirect_import_changes.update(is_deleted=True)
+            ChangeRollup.add(self, -1)
             ret = super().delete(using=using, keep_parents=keep_parents)
+        if self.account.is_archived:
+            self.freeze_closing_values()
+            self.account.depot.reset_balance()
         return ret
 
     # getters
@@ -515,15 +654,171 @@ class Change(models.Model):
         return description
 
     # setters
+    def freeze_closing_values(self):
+        if self.account.is_archived:
+            ClosingValue.freeze(self.account.depot_id)  # type: ignore
+
     def set_balances_of_affected_objects_to_null(self):
         Category.objects.filter(pk=self.category.pk).update(balance=None)
         Account.objects.filter(pk=self.account.pk).update(balance=None)
         Change.objects.filter(account=self.account, date__gte=self.date).update(
             balance=None
         )
+        # the depot balance can stay the same while the account balances
+        # change, the reset from none makes the save bump the data version
+        Depot.objects.filter(pk=self.account.depot.pk).update(balance=None)
         Depot.objects.get(pk=self.account.depot.pk).reset_balance()
 
 
+CHANGES_PAGE_SIZE = 100
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def encode_change_cursor(change: Change) -> str:
+    # exact microseconds, a float timestamp would lose precision
+    microseconds = (change.date - EPOCH) // timezone.timedelta(microseconds=1)
+    return "{}_{}".format(microseconds, change.pk)
+
+
+def decode_change_cursor(cursor: str) -> tuple[datetime, int]:
+    # raises a value error if the cursor is invalid
+    microseconds, pk = cursor.split("_")
+    try:
+        date = EPOCH + timezone.timedelta(microseconds=int(microseconds))
+    except OverflowError:
+        raise ValueError("the cursor date is out of range")
+    return date, int(pk)
+
+
+def get_changes_page(
+    changes: "QuerySet[Change]",
+    partition: Literal["account", "category"],
+    cursor: str | None = None,
+    size: int = CHANGES_PAGE_SIZE,
+) -> tuple[list[Change], str | None]:
+    """
+    Returns the changes that come after the cursor, newest first, and the
+    cursor of the next page. Every change is annotated with the running
+    balance of its account or category. The cursor only removes newer
+    changes, so the running balances stay correct on every page.
+    """
+    changes = changes.annotate(
+        running_balance=Window(
+            Sum("change"),
+            partition_by=[F(partition)],
+            order_by=[F("date").asc(), F("pk").asc()],
+        )
+    )
+    if cursor is not None:
+        date, pk = decode_change_cursor(cursor)
+        changes = changes.filter(Q(date__lt=date) | Q(date=date, pk__lt=pk))
+    page = list(changes.order_by("-date", "-pk")[: size + 1])
+    next_cursor = encode_change_cursor(page[size - 1]) if len(page) > size else None
+    return page[:size], next_cursor
+
+
+class ChangeRollup(models.Model):
+    # query optimization, the changes summed up per account, category and day
+    # for the charts, kept up to date by Change.save and Change.delete
+    account = models.ForeignKey(
+        Account, on_delete=models.CASCADE, related_name="rollups"
+    )
+    category = models.ForeignKey(
+        Category, on_delete=models.CASCADE, related_name="rollups"
+    )
+    day = models.DateField()
+    change = models.DecimalField(decimal_places=2, max_digits=15, default=0)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "category", "day"],
+                name="banking_changerollup_unique",
+            )
+        ]
+        indexes = [models.Index(fields=["category", "day"])]
+
+    def __str__(self):
+        return "{} - {} - {}".format(self.day, self.category_id, self.change)
+
+    @staticmethod
+    def add(change: "Change", sign: int):
+        rollup, _ = ChangeRollup.objects.get_or_create(
+            account_id=change.account_id,  # type: ignore
+            category_id=change.category_id,  # type: ignore
+            day=change.local_date,
+        )
+        ChangeRollup.objects.filter(pk=rollup.pk).update(
+            change=F("change") + sign * Decimal(str(change.change)),
+            count=F("count") + sign,
+        )
+        ChangeRollup.objects.filter(pk=rollup.pk, count__lte=0).delete()
+
+    @staticmethod
+    def rebuild(accounts: "QuerySet[Account] | list[Account]"):
+        # needed after changes were created with bulk_create
+        ChangeRollup.objects.filter(account__in=accounts).delete()
+        sums = (
+            Change.objects.filter(account__in=accounts)
+            .values("account_id", "category_id", day=F("local_date"))
+            .annotate(sum=Sum("change"), count=Count("id"))
+        )
+        ChangeRollup.objects.bulk_create(
+            ChangeRollup(
+                account_id=row["account_id"],
+                category_id=row["category_id"],
+                day=row["day"],
+                change=row["sum"],
+                count=row["count"],
+            )
+            for row in sums
+        )
+
+
+def get_category_sums(
+    categories: "Iterable[Category]",
+    resolution: Literal["month", "year"],
+    since: date | None = None,
+) -> dict[int, dict[date, Decimal]]:
+    """
+    Returns the sums of the changes per category and month or year, keyed by
+    the first day of the period, with a single grouped query.
+    """
+    trunc = TruncMonth if resolution == "month" else TruncYear
+    rollups = ChangeRollup.objects.filter(category__in=list(categories))
+    if since is not None:
+        rollups = rollups.filter(day__gte=since)
+    rows = (
+        rollups.annotate(period=trunc("day"))
+        .values_list("category_id", "period")
+        .annotate(total=Sum("change"))
+        .order_by()
+    )
+    sums: dict[int, dict[date, Decimal]] = {}
+    for category_id, period, total in rows:
+        sums.setdefault(category_id, {})[period] = total
+    return sums
+
+
+def prefetch_yearly_sums(categories: "Iterable[Category]"):
+    categories = list(categories)
+    sums = get_category_sums(categories, "year")
+    for category in categories:
+        years = sorted(sums.get(category.pk, {}).items(), reverse=True)
+        category._sums = [
+            YearBalance(year=period.year, balance=total)  # type: ignore
+            for period, total in years
+        ]
+
+
+def prefetch_monthly_sums(categories: "Iterable[Category]", months: list[date]):
+    categories = list(categories)
+    sums = get_category_sums(categories, "month", since=min(months, default=None))
+    for category in categories:
+        category._monthly_sums = sums.get(category.pk, {})
+
+
 class CsvImport(models.Model):
     account = models.OneToOneField(
         Account, on_delete=models.CASCADE, related_name="csv_import"
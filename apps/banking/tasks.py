@@ -14,3 +14,4 @@ def calculate_change_counts():
     for category in categories:
         category.calculate_changes_count()
         category.save()
+    return len(accounts) + len(depots) + len(categories)
@@ -1,11 +1,29 @@
+import json
 from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
 
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
 from django.utils import timezone
 
 from apps.banking.forms import AccountForm, CategoryForm, ChangeForm, DepotForm
-from apps.banking.models import Account, Category, Change, Depot
+from apps.banking.models import (
+    Account,
+    Category,
+    Change,
+    ChangeRollup,
+    ClosingValue,
+    Depot,
+    get_changes_page,
+    prefetch_monthly_sums,
+    prefetch_yearly_sums,
+)
+from apps.banking.tasks import calculate_change_counts
+from apps.banking.utils import get_12_recent_months
 from apps.core.functional import list_sort
 from apps.users.models import StandardUser as User
 
@@ -72,6 +90,10 @@ class ViewsTestCase(TestCase):
             "{}?tab=charts".format(reverse_lazy("banking:index"))
         )
         self.assertEqual(response.status_code, 200)
+        response = self.client.get(
+            "{}?tab=statements".format(reverse_lazy("banking:index"))
+        )
+        self.assertEqual(response.status_code, 200)
 
     def test_account_view(self):
         self.client = Client()
@@ -106,6 +128,177 @@ class ViewsTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
 
 
+class CategorySumsTestCase(TestCase):
+    def setUp(self):
+        self.user: User = User.objects.create_user(username="dummy")  # type: ignore
+        self.user.set_password("test")
+        self.user.save()
+        self.depot = self.user.create_random_banking_data()
+        self.depot.categories.update(monthly_budget=100)
+        self.client = Client()
+        self.client.login(username="dummy", password="test")
+
+    def count_queries(self, tab: str) -> int:
+        url = reverse_lazy("banking:index")
+        # the first request calculates the cached balances
+        self.client.get(url, {"tab": tab})
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, {"tab": tab})
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_queries_do_not_grow_with_the_categories(self):
+        budgets = self.count_queries("budgets")
+        categories = self.count_queries("categories")
+        account = self.depot.accounts.get(name="Bank #1")
+        for i in range(5):
+            category = create_category(self.depot, "Extra #{}".format(i))
+            category.monthly_budget = 100
+            category.save()
+            create_change(self.depot, account.pk, category.pk, timezone.now())
+        assert self.count_queries("budgets") == budgets
+        assert self.count_queries("categories") == categories
+
+    def test_prefetched_sums_match_the_queries(self):
+        months = get_12_recent_months()
+        categories = list(self.depot.categories.all())
+        prefetch_yearly_sums(categories)
+        prefetch_monthly_sums(categories, months)
+        for category in categories:
+            fresh = Category.objects.get(pk=category.pk)
+            assert category.get_stats() == fresh.get_stats()
+            assert category.get_latest_years_sum() == fresh.get_latest_years_sum()
+            for month in months:
+                assert category.get_month(month) == fresh.get_month(month)
+
+
+class StatementsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user: User = User.objects.create_user(username="dummy")  # type: ignore
+        self.depot = self.user.create_random_banking_data()
+
+    def test_statements_match_the_changes(self):
+        statements = self.depot.get_statements()
+        for category in self.depot.categories.all():
+            total = sum(c.change for c in category.changes.all())
+            assert sum(statements["data"][category.name]) == float(total)
+            assert len(statements["data"][category.name]) == len(statements["months"])
+
+    def test_statements_are_cached_until_the_data_changes(self):
+        statements = self.depot.get_statements()
+        with self.assertNumQueries(0):
+            assert self.depot.get_statements() == statements
+        category = self.depot.categories.get(name="Category #1")
+        category.name = "Renamed"
+        category.save()
+        self.user.refresh_from_db()
+        depot = Depot.objects.get(pk=self.depot.pk)
+        assert "Renamed" in depot.get_statements()["data"]
+
+    def test_cached_values_do_not_change_the_data_version(self):
+        version = User.objects.get(pk=self.user.pk).data_version
+        for item in [*self.depot.accounts.all(), *self.depot.categories.all()]:
+            item.balance = None
+            item.get_balance()
+            item.calculate_changes_count()
+        assert User.objects.get(pk=self.user.pk).data_version == version
+        account = self.depot.accounts.first()
+        account.is_archived = True
+        account.save()
+        assert User.objects.get(pk=self.user.pk).data_version > version
+
+    def test_depot_only_bumps_the_data_version_if_its_values_change(self):
+        self.depot.get_balance()
+        version = User.objects.get(pk=self.user.pk).data_version
+        self.depot.reset_balance()
+        calculate_change_counts()
+        assert User.objects.get(pk=self.user.pk).data_version == version
+        # the depot balance stays the same if a change moves to another account
+        change = Change.objects.filter(account__depot=self.depot).first()
+        change.account = self.depot.accounts.exclude(pk=change.account_id).first()
+        change.save()
+        assert User.objects.get(pk=self.user.pk).data_version > version
+
+
+class ChangesPageTestCase(TestCase):
+    def setUp(self):
+        self.user: User = User.objects.create_user(username="dummy")  # type: ignore
+        self.user.set_password("test")
+        self.user.save()
+        self.depot = self.user.create_random_banking_data()
+        self.account = self.depot.accounts.get(name="Bank #1")
+        # changes with the same date need the pk to be ordered
+        date = timezone.now() - timedelta(days=5)
+        category = self.depot.categories.first()
+        for _ in range(3):
+            Change.objects.create(
+                account=self.account, category=category, date=date, change=1
+            )
+        self.client = Client()
+        self.client.login(username="dummy", password="test")
+
+    def test_pages_cover_all_changes_with_running_balances(self):
+        expected = list(self.account.changes.order_by("date", "pk"))
+        balance, balances = Decimal(0), {}
+        for change in expected:
+            balance += change.change
+            balances[change.pk] = balance
+        seen, cursor = [], None
+        while True:
+            page, cursor = get_changes_page(
+                self.account.changes.all(), "account", cursor, size=4
+            )
+            for change in page:
+                assert change.running_balance == balances[change.pk]
+            seen += page
+            if cursor is None:
+                break
+        assert [c.pk for c in seen] == [c.pk for c in reversed(expected)]
+
+    def test_json_endpoint(self):
+        url = reverse_lazy("banking:api_account_changes", args=[self.account.pk])
+        data = self.client.get(url).json()
+        pks, cursor = [c["pk"] for c in data["changes"]], data["next"]
+        while cursor is not None:
+            data = self.client.get(url, {"before": cursor}).json()
+            pks += [c["pk"] for c in data["changes"]]
+            cursor = data["next"]
+        assert pks == list(
+            self.account.changes.order_by("-date", "-pk").values_list("pk", flat=True)
+        )
+        assert self.client.get(url, {"before": "x"}).status_code == 400
+        response = self.client.get(url, {"before": "99999999999999999999_1"})
+        assert response.status_code == 400
+
+    def test_pages_render(self):
+        Change.objects.bulk_create(
+            Change(
+                account=self.account,
+                category=self.depot.categories.first(),
+                date=timezone.now() - timedelta(days=i),
+                change=1,
+            )
+            for i in range(150)
+        )
+        url = reverse_lazy("banking:account", args=[self.account.pk])
+        response = self.client.get(url, {"tab": "changes"})
+        cursor = response.context["next_cursor"]
+        assert cursor is not None
+        assert 'data-next="{}"'.format(cursor) in response.content.decode()
+        assert 'const column = "category"' in response.content.decode()
+        response = self.client.get(url, {"tab": "changes", "before": cursor})
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(
+            url, {"tab": "changes", "before": "99999999999999999999_1"}
+        )
+        self.assertEqual(response.status_code, 400)
+        category = self.depot.categories.first()
+        url = reverse_lazy("banking:category", args=[category.pk])
+        response = self.client.get(url, {"tab": "changes", "before": cursor})
+        self.assertEqual(response.status_code, 200)
+
+
 class BalanceUpdateTestCase(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(username="dummy")  # type: ignore
@@ -184,3 +377,173 @@ class BalanceUpdateTestCase(TestCase):
         e = {"n": "e", "s": [-4, 1, 2]}
         res = list_sort([a, b, c, d, e], lambda x: x["s"], reverse=True)
         assert res == [b, a, c, e, d]
+
+
+class ChangeRollupTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="dummy")  # type: ignore
+        self.depot = create_depot(self.user, "Depot")
+        self.account = create_account(self.depot, "Account")
+        self.category = create_category(self.depot, "Category")
+
+    def get_sums(self) -> dict:
+        return {
+            (r.category_id, r.day): (r.change, r.count)  # type: ignore
+            for r in ChangeRollup.objects.all()
+        }
+
+    def test_rollup_follows_save_and_delete(self):
+        date = timezone.now() - timedelta(days=3)
+        day = timezone.localdate(date)
+        change = create_change(
+            self.depot, self.account, self.category, date=date, change=10
+        )
+        create_change(self.depot, self.account, self.category, date=date, change=5)
+        assert self.get_sums() == {(self.category.pk, day): (15, 2)}
+
+        other = create_category(self.depot, "Other")
+        change.category = other
+        change.change = 7
+        change.save()
+        assert self.get_sums() == {
+            (self.category.pk, day): (5, 1),
+            (other.pk, day): (7, 1),
+        }
+
+        change.delete()
+        assert self.get_sums() == {(self.category.pk, day): (5, 1)}
+
+    def test_rollup_is_unchanged_by_a_failing_save(self):
+        date = timezone.now() - timedelta(days=3)
+        change = create_change(
+            self.depot, self.account, self.category, date=date, change=10
+        )
+        sums = self.get_sums()
+        change.change = 7
+        with patch.object(Change, "freeze_closing_values", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                change.save()
+        assert self.get_sums() == sums
+        assert Change.objects.get(pk=change.pk).change == 10
+
+    def test_rebuild_matches_changes(self):
+        depot = self.user.create_random_banking_data()
+        rollups = ChangeRollup.objects.filter(category__depot=depot)
+        assert (
+            sum(r.count for r in rollups)
+            == Change.objects.filter(account__depot=depot).count()
+        )
+        assert sum(r.change for r in rollups) == sum(
+            c.change for c in Change.objects.filter(account__depot=depot)
+        )
+
+
+class ChartDataTestCase(TestCase):
+    def setUp(self):
+        self.user: User = User.objects.create_user(username="dummy")  # type: ignore
+        self.user.set_password("test")
+        self.user.save()
+        self.depot = self.user.create_random_banking_data()
+        self.client = Client()
+        self.client.login(username="dummy", password="test")
+
+    def get_data(self, name: str, **params) -> dict:
+        url = reverse_lazy(name, args=[self.depot.pk])
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_income_and_expenditure_data_is_columnar(self):
+        data = self.get_data("banking:api_depot_income_and_expenditure_data")
+        assert data["date"] == sorted(data["date"])
+        categories = set(self.depot.categories.values_list("name", flat=True))
+        assert set(data["series"].keys()) <= categories
+        for values in data["series"].values():
+            assert len(values) == len(data["date"])
+
+    def test_balance_data_is_columnar(self):
+        data = self.get_data("banking:api_depot_balance_data")
+        accounts = set(self.depot.accounts.values_list("name", flat=True))
+        assert set(data["series"].keys()) == accounts
+        for values in data["series"].values():
+            assert len(values) == len(data["date"])
+
+    def test_resolution_and_window(self):
+        total = sum(c.change for c in Change.objects.filter(account__depot=self.depot))
+        for resolution in ["day", "week", "month", "quarter", "year"]:
+            data = self.get_data(
+                "banking:api_depot_income_and_expenditure_data", resolution=resolution
+            )
+            values = [v for vs in data["series"].values() for v in vs if v]
+            assert abs(sum(values) - float(total)) < len(values)
+        data = self.get_data(
+            "banking:api_depot_income_and_expenditure_data", resolution="year"
+        )
+        assert all(date.endswith("-01-01") for date in data["date"])
+        today = timezone.localdate()
+        data = self.get_data(
+            "banking:api_depot_balance_data",
+            resolution="day",
+            **{"from": str(today - timedelta(days=10)), "to": str(today)},
+        )
+        assert all(date >= str(today - timedelta(days=10)) for date in data["date"])
+
+    def test_balance_is_the_final_balance(self):
+        data = self.get_data("banking:api_depot_balance_data", resolution="year")
+        for account in self.depot.accounts.all():
+            balance = sum(c.change for c in account.changes.all())
+            assert data["series"][account.name][-1] == round(balance)
+
+    def test_invalid_resolution(self):
+        url = reverse_lazy("banking:api_depot_balance_data", args=[self.depot.pk])
+        assert self.client.get(url, {"resolution": "hour"}).status_code == 400
+        assert self.client.get(url, {"from": "yesterday"}).status_code == 400
+
+
+class ArchivedAccountTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="dummy")  # type: ignore
+        self.depot = self.user.create_random_banking_data()
+        self.account = self.depot.accounts.first()
+
+    def get_depot(self) -> Depot:
+        return Depot.objects.get(pk=self.depot.pk)
+
+    def get_total(self) -> Decimal:
+        return sum(c.change for c in Change.objects.filter(account__depot=self.depot))
+
+    def archive(self, is_archived=True):
+        self.account.is_archived = is_archived
+        self.account.save()
+
+    def test_archived_accounts_are_read_from_the_closing_values(self):
+        depot = self.get_depot()
+        balance = depot.get_balance()
+        values = depot.get_value_df().loc[:, "value"].round(2).tolist()
+        self.archive()
+        closing = ClosingValue.objects.filter(depot=self.depot)
+        assert closing.last().value == sum(c.change for c in self.account.changes.all())
+        depot = self.get_depot()
+        depot.reset_balance()
+        assert depot.balance == balance == self.get_total()
+        assert depot.get_value_df().loc[:, "value"].round(2).tolist() == values
+        self.archive(False)
+        assert not closing.exists()
+
+    def test_changes_of_archived_accounts_update_the_closing_values(self):
+        self.archive()
+        change = Change.objects.create(
+            account=self.account,
+            category=self.depot.categories.first(),
+            date=timezone.now(),
+            change=100,
+        )
+        assert self.get_depot().get_balance() == self.get_total()
+        change.delete()
+        assert self.get_depot().get_balance() == self.get_total()
+
+    def test_archived_accounts_are_not_reset(self):
+        self.archive()
+        Account.objects.filter(pk=self.account.pk).update(balance=1)
+        self.depot.set_balances_to_none()
+        assert Account.objects.get(pk=self.account.pk).balance == 1
@@ -17,6 +17,17 @@ urlpatterns = [
         api.BalanceData.as_view(),
         name="api_depot_balance_data",
     ),
+    # changes
+    path(
+        "api/accounts/<int:pk>/changes/",
+        api.AccountChangesData.as_view(),
+        name="api_account_changes",
+    ),
+    path(
+        "api/categories/<int:pk>/changes/",
+        api.CategoryChangesData.as_view(),
+        name="api_category_changes",
+    ),
     # depots
     path("depots/add/", formviews.AddDepotView.as_view(), name="add_depot"),
     path("depots/delete/", formviews.DeleteDepotView.as_view(), name="delete_depot"),
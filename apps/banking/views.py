@@ -1,8 +1,20 @@
+from urllib.parse import urlencode
+
 from django.contrib.auth.decorators import login_required
+from django.core.exceptions import BadRequest
 from django.shortcuts import HttpResponse
+from django.utils.functional import SimpleLazyObject
 from django.views import generic
 
-from apps.banking.models import Account, Category, Depot
+from apps.banking.models import (
+    RESOLUTIONS,
+    Account,
+    Category,
+    Depot,
+    get_changes_page,
+    prefetch_monthly_sums,
+    prefetch_yearly_sums,
+)
 from apps.banking.utils import get_12_recent_months, get_latest_years
 from apps.core.functional import list_sort
 from apps.core.mixins import TabContextMixin
@@ -21,7 +33,8 @@ class IndexView(GetUserMixin, TabContextMixin, generic.DetailView):
         context = super(IndexView, self).get_context_data(**kwargs)
         context["user"] = self.get_user()
         if self.tab == "stats":
-            context["stats"] = self.object.get_stats()
+            # the stats are only calculated if they are not in the fragment cache
+            context["stats"] = SimpleLazyObject(self.object.get_stats)
         elif self.tab == "accounts":
             show_archived = self.request.GET.get("show_archived", False)
             accounts = self.object.accounts.all()
@@ -34,26 +47,50 @@ class IndexView(GetUserMixin, TabContextMixin, generic.DetailView):
                     monthly_budget=None
                 )
             )
+            months = get_12_recent_months()
+            prefetch_yearly_sums(categories)
+            prefetch_monthly_sums(categories, months)
             categories = list_sort(
                 categories, lambda c: c.get_latest_years_sum(), reverse=True
             )
             context["categories"] = categories
-            context["months"] = get_12_recent_months()
+            context["months"] = months
         elif self.tab == "categories":
             show_archived = self.request.GET.get("show_archived", False)
             categories = self.object.categories.all()
             if not show_archived:
                 categories = categories.filter(is_archived=False)
+            categories = list(categories)
+            prefetch_yearly_sums(categories)
             categories = list_sort(
-                list(categories), lambda c: c.get_latest_years_sum(), reverse=True
+                categories, lambda c: c.get_latest_years_sum(), reverse=True
             )
             context["categories"] = categories
             context["years"] = get_latest_years(5)
         elif self.tab == "statements":
             context["statements"] = self.object.get_statements()
+        elif self.tab == "charts":
+            resolution = self.request.GET.get("resolution")
+            context["resolutions"] = list(RESOLUTIONS)
+            context["resolution"] = resolution
+            # pass the chosen resolution and window on to the chart apis
+            context["chart_query"] = urlencode(
+                {
+                    key: self.request.GET[key]
+                    for key in ["resolution", "from", "to"]
+                    if key in self.request.GET
+                }
+            )
         return context
 
 
+def get_page(changes, partition, cursor: str | None):
+    try:
+        return get_changes_page(changes, partition, cursor)
+    except ValueError:
+        raise BadRequest("before is not a valid cursor.")
+
+
 class AccountView(GetUserMixin, TabContextMixin, generic.DetailView):
     template_name = "banking/account.j2"
     model = Account
@@ -64,15 +101,6 @@ class AccountView(GetUserMixin, TabContextMixin, generic.DetailView):
             depot__in=self.get_user().banking_depots.all()
         ).select_related("comdirect_import", "csv_import")
 
-    def get_show(self) -> int:
-        show = self.request.GET.get("show", 30)
-        return int(show)
-
-    def get_context_show(self, show: int) -> str | None:
-        if show >= self.object.changes.count():
-            return None
-        return str(show + 100)
-
     def get_context_data(self, **kwargs):
         context = super(AccountView, self).get_context_data(**kwargs)
         context["account"] = self.object
@@ -80,13 +108,10 @@ class AccountView(GetUserMixin, TabContextMixin, generic.DetailView):
         if self.tab == "stats":
             context["stats"] = self.object.get_stats()
         if self.tab == "changes":
-            show = self.get_show()
-            context["changes"] = list(
-                self.object.changes.order_by("-date", "-pk").select_related("category")[
-                    :show
-                ]
+            changes = self.object.changes.select_related("category")
+            context["changes"], context["next_cursor"] = get_page(
+                changes, "account", self.request.GET.get("before")
             )
-            context["show"] = self.get_context_show(show)
         if self.tab == "import" and hasattr(self.object, "comdirect_import"):
             context["import_type"] = "comdirect"
             comdirect_import = self.object.comdirect_import
@@ -115,9 +140,10 @@ class CategoryView(GetUserMixin, TabContextMixin, generic.DetailView):
         context["depot"] = self.object.depot
         context["category"] = self.object
         context["stats"] = self.object.get_stats()
-        context["changes"] = self.object.changes.order_by(
-            "-date", "-pk"
-        ).select_related("account")
+        changes = self.object.changes.select_related("account")
+        context["changes"], context["next_cursor"] = get_page(
+            changes, "category", self.request.GET.get("before")
+        )
         return context
 
 
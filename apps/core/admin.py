@@ -0,0 +1,54 @@
+from django.contrib import admin
+
+from apps.core.models import CronRun, FetcherStats, FetcherStatsMixin
+
+
+@admin.register(CronRun)
+class CronRunAdmin(admin.ModelAdmin):
+    list_display = ("job", "status", "started_at", "duration", "items", "throughput")
+    list_filter = ("job", "status")
+
+
+class PriceFetcherAdminMixin:
+    """
+    The admin of the price fetchers of the apps, the stats of a fetcher are
+    calculated once per row and kept on the object.
+    """
+
+    list_display = (
+        "__str__",
+        "fetcher_type",
+        "p50",
+        "p95",
+        "success_rate",
+        "last_success",
+        "circuit_state",
+        "failures",
+        "next_attempt_at",
+        "error",
+    )
+    list_filter = ("fetcher_type",)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related("attempts")  # type: ignore
+
+    def get_stats(self, obj: FetcherStatsMixin) -> FetcherStats:
+        if not hasattr(obj, "_admin_stats"):
+            obj._admin_stats = obj.get_stats()  # type: ignore
+        return obj._admin_stats  # type: ignore
+
+    @admin.display(description="p50 (s)")
+    def p50(self, obj: FetcherStatsMixin):
+        return self.get_stats(obj).p50
+
+    @admin.display(description="p95 (s)")
+    def p95(self, obj: FetcherStatsMixin):
+        return self.get_stats(obj).p95
+
+    @admin.display(description="Success rate")
+    def success_rate(self, obj: FetcherStatsMixin):
+        return self.get_stats(obj).success_rate
+
+    @admin.display(description="Last success")
+    def last_success(self, obj: FetcherStatsMixin):
+        return self.get_stats(obj).last_success
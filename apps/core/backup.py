@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import zlib
+from datetime import datetime
+
+from pydantic import BaseModel
+
+# sqlite changes its pages in place, chunks that are aligned to the pages of
+# the snapshot only change if one of their pages changed
+CHUNK_PAGES = 256
+COMPRESSION_LEVEL = 6
+
+
+class Snapshot(BaseModel):
+    name: str
+    created_at: datetime
+    page_size: int
+    size: int
+    chunks: list[str]
+
+
+class BackupStats(BaseModel):
+    name: str = ""
+    # bytes of the database and the compressed bytes of the new chunks
+    size: int = 0
+    written: int = 0
+    chunks: int = 0
+    new_chunks: int = 0
+    duration: float = 0
+
+    @property
+    def ratio(self) -> float:
+        return self.size / self.written if self.written else float("inf")
+
+    @property
+    def throughput(self) -> float:
+        return self.size / self.duration if self.duration else 0
+
+    def __str__(self):
+        return (
+            "{}: {} of {} chunks new, {:.1f} MiB stored as {:.2f} MiB "
+            "(ratio {:.1f}), {:.1f} MiB/s".format(
+                self.name,
+                self.new_chunks,
+                self.chunks,
+                self.size / 2**20,
+                self.written / 2**20,
+                self.ratio,
+                self.throughput / 2**20,
+            )
+        )
+
+
+class Repository:
+    """
+    A directory with the compressed chunks, named by the sha256 of their
+    content, and one manifest per snapshot that lists its chunks. A chunk is
+    stored once no matter how many snapshots contain it.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.chunks_directory = os.path.join(directory, "chunks")
+        self.snapshots_directory = os.path.join(directory, "snapshots")
+        os.makedirs(self.chunks_directory, exist_ok=True)
+        os.makedirs(self.snapshots_directory, exist_ok=True)
+
+    def get_chunk_path(self, digest: str) -> str:
+        return os.path.join(self.chunks_directory, digest[:2], digest)
+
+    def write_chunk(self, data: bytes) -> tuple[str, int]:
+        """
+        Stores the chunk if it is not stored yet, returns its digest and the
+        bytes that were written.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.get_chunk_path(digest)
+        if os.path.exists(path):
+            return digest, 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        compressed = zlib.compress(data, COMPRESSION_LEVEL)
+        # a chunk only appears once it is complete, an interrupted backup
+        # leaves no broken chunk behind
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as f:
+            f.write(compressed)
+        os.replace(f.name, path)
+        return digest, len(compressed)
+
+    def read_chunk(self, digest: str) -> bytes:
+        with open(self.get_chunk_path(digest), "rb") as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError("Chunk {} is corrupted.".format(digest))
+        return data
+
+    def get_snapshots(self) -> list[str]:
+        names = os.listdir(self.snapshots_directory)
+        return sorted(name[:-5] for name in names if name.endswith(".json"))
+
+    def read_snapshot(self, name: str) -> Snapshot:
+        if name == "latest":
+            snapshots = self.get_snapshots()
+            if not snapshots:
+                raise ValueError("There is no snapshot yet.")
+            name = snapshots[-1]
+        path = os.path.join(self.snapshots_directory, "{}.json".format(name))
+        if not os.path.exists(path):
+            raise ValueError("The snapshot '{}' does not exist.".format(name))
+        with open(path) as f:
+            return Snapshot(**json.load(f))
+
+    def write_snapshot(self, snapshot: Snapshot):
+        path = os.path.join(self.snapshots_directory, "{}.json".format(snapshot.name))
+        with open(path + ".tmp", "w") as f:
+            f.write(snapshot.model_dump_json())
+        os.replace(path + ".tmp", path)
+
+    def prune(self, keep: int) -> int:
+        """
+        Deletes all but the newest keep snapshots and the chunks that no
+        remaining snapshot needs, returns the number of deleted chunks.
+        """
+        snapshots = self.get_snapshots()
+        for name in snapshots[: max(len(snapshots) - keep, 0)]:
+            os.remove(os.path.join(self.snapshots_directory, "{}.json".format(name)))
+        needed = set()
+        for name in self.get_snapshots():
+            needed.update(self.read_snapshot(name).chunks)
+        deleted = 0
+        for directory, _, files in os.walk(self.chunks_directory):
+            for file in files:
+                if file not in needed:
+                    os.remove(os.path.join(directory, file))
+                    deleted += 1
+        return deleted
+
+
+def backup(
+    database: str, directory: str, chunk_pages: int = CHUNK_PAGES
+) -> BackupStats:
+    """
+    Takes a consistent snapshot of the database with the backup api of sqlite,
+    the database can be written to in the meantime, and stores the chunks of
+    the snapshot that are not stored yet.
+    """
+    start = time.perf_counter()
+    repository = Repository(directory)
+    created_at = datetime.now().astimezone()
+    stats = BackupStats(name=created_at.strftime("%Y%m%dT%H%M%S%f"))
+
+    with tempfile.TemporaryDirectory(dir=directory) as temporary:
+        path = os.path.join(temporary, "snapshot.sqlite3")
+        source = sqlite3.connect(database)
+        target = sqlite3.connect(path)
+        with target:
+            source.backup(target)
+        source.close()
+        page_size = target.execute("PRAGMA page_size").fetchone()[0]
+        target.close()
+
+        chunks = []
+        with open(path, "rb") as f:
+            while data := f.read(page_size * chunk_pages):
+                digest, written = repository.write_chunk(data)
+                chunks.append(digest)
+                stats.size += len(data)
+                stats.written += written
+                stats.new_chunks += 1 if written else 0
+
+    stats.chunks = len(chunks)
+    repository.write_snapshot(
+        Snapshot(
+            name=stats.name,
+            created_at=created_at,
+            page_size=page_size,
+            size=stats.size,
+            chunks=chunks,
+        )
+    )
+    stats.duration = time.perf_counter() - start
+    return stats
+
+
+def restore(directory: str, name: str, database: str) -> BackupStats:
+    """
+    Rebuilds the snapshot from its chunks and copies it into the database
+    with the backup api, open connections see the restored data afterwards.
+    """
+    start = time.perf_counter()
+    repository = Repository(directory)
+    snapshot = repository.read_snapshot(name)
+    stats = BackupStats(name=snapshot.name, chunks=len(snapshot.chunks))
+
+    with tempfile.TemporaryDirectory(dir=directory) as temporary:
+        path = os.path.join(temporary, "restore.sqlite3")
+        with open(path, "wb") as f:
+            for digest in snapshot.chunks:
+                data = repository.read_chunk(digest)
+                f.write(data)
+                stats.size += len(data)
+        if stats.size != snapshot.size:
+            raise ValueError("The snapshot '{}' is incomplete.".format(name))
+        source = sqlite3.connect(path)
+        target = sqlite3.connect(database)
+        with target:
+            source.backup(target)
+        source.close()
+        target.close()
+
+    stats.written = stats.size
+    stats.duration = time.perf_counter() - start
+    return stats
@@ -0,0 +1,29 @@
+from typing import Any, Callable, TypeVar
+
+from django.core.cache import cache
+
+from apps.users.models import StandardUser
+
+T = TypeVar("T")
+
+
+def get_or_set_for_user(user: StandardUser, name: str, compute: Callable[[], T]) -> T:
+    # the entries are versioned with the data version of the user, a change of
+    # the data makes the old entries of this user unreachable and the cache
+    # evicts them once it is full. date_joined is part of the key as a deleted
+    # user's pk can be reused by sqlite.
+    key = "{}:{}:{}".format(name, user.pk, user.date_joined.timestamp())
+    value = cache.get(key, version=user.data_version)
+    if value is None:
+        value = compute()
+        cache.set(key, value, version=user.data_version)
+    return value
+
+
+def get_or_set_fragment(obj: Any, name: str, render: Callable[[], str]) -> str:
+    # obj is a depot, the saves of the depot and of the objects shown in its
+    # fragments bump the data version of its user
+    if obj is None:
+        return render()
+    key = "fragment:{}:{}:{}".format(obj._meta.label_lower, obj.pk, name)
+    return get_or_set_for_user(obj.user, key, render)
@@ -0,0 +1,43 @@
+import json
+from typing import Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+from django.http import StreamingHttpResponse
+
+ChartData = tuple[Sequence[str | int], dict[str, Sequence[float | None]]]
+
+
+def get_chart_data_from_df(df: pd.DataFrame) -> ChartData:
+    # dates as milliseconds since the epoch, like pandas.to_json does
+    dates = df.index.to_numpy(dtype="datetime64[ms]").astype(np.int64).tolist()
+    series = {
+        str(column): df.loc[:, column].astype(float).round(2).tolist()
+        for column in df.columns
+    }
+    return dates, series
+
+
+def encode_values(values: Sequence[float | None]) -> str:
+    # nan is not valid json, the charts expect null for a missing value
+    return json.dumps([None if v is None or v != v else v for v in values])
+
+
+def encode_chart_data(
+    dates: Sequence[str | int], series: dict[str, Sequence[float | None]]
+) -> Iterator[str]:
+    """
+    Encodes the chart data as {"date": [...], "series": {"name": [...]}}, one
+    series at a time so that the response can be streamed.
+    """
+    yield '{"date":' + json.dumps(list(dates)) + ',"series":{'
+    for i, (name, values) in enumerate(series.items()):
+        assert len(values) == len(dates)
+        yield ("," if i else "") + json.dumps(name) + ":" + encode_values(values)
+    yield "}}"
+
+
+class ChartDataResponse(StreamingHttpResponse):
+    def __init__(self, data: ChartData, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(encode_chart_data(*data), **kwargs)
@@ -0,0 +1,163 @@
+import importlib
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Iterable
+
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
+from pydantic import BaseModel
+
+from apps.core.models import CronRun
+
+JOB_FUNCTION = Callable[[], int | None]
+
+
+class CronJob(BaseModel):
+    path: str
+    # seconds after which the run is given up and marked as timed out
+    timeout: int = 240
+    # minimum seconds between the start of two runs
+    interval: int = 0
+    # jobs with a higher priority are started first
+    priority: int = 0
+
+    @property
+    def function(self) -> JOB_FUNCTION:
+        module_name = ".".join(self.path.split(".")[:-1])
+        module = importlib.import_module(module_name)
+        function_name = self.path.split(".")[-1]
+        return getattr(module, function_name)
+
+
+def load_jobs(config: Iterable[str | dict]) -> list[CronJob]:
+    jobs = []
+    for item in config:
+        if isinstance(item, str):
+            jobs.append(CronJob(path=item))
+        else:
+            jobs.append(CronJob(**item))
+    return jobs
+
+
+def is_running(job: CronJob) -> bool:
+    # runs that are older than their timeout are stale, e.g. the container
+    # was killed while the job was running, and do not block a new run
+    since = timezone.now() - timedelta(seconds=job.timeout)
+    return CronRun.objects.filter(
+        job=job.path, status="RUNNING", started_at__gt=since
+    ).exists()
+
+
+def is_due(job: CronJob) -> bool:
+    if job.interval <= 0:
+        return True
+    last_start = CronRun.objects.filter(job=job.path).aggregate(Max("started_at"))[
+        "started_at__max"
+    ]
+    if last_start is None:
+        return True
+    return last_start <= timezone.now() - timedelta(seconds=job.interval)
+
+
+def get_jobs_to_be_run(jobs: list[CronJob]) -> list[CronJob]:
+    due = [job for job in jobs if is_due(job) and not is_running(job)]
+    return sorted(due, key=lambda job: -job.priority)
+
+
+def finish_run(run: CronRun, status: str, items=None, error: str = ""):
+    finished_at = timezone.now()
+    duration = (finished_at - run.started_at).total_seconds()
+    # only a running run can be finished, this way a job that returns after
+    # its timeout does not overwrite the timeout status
+    CronRun.objects.filter(pk=run.pk, status="RUNNING").update(
+        status=status,
+        finished_at=finished_at,
+        duration=duration,
+        items=items,
+        error=error[:1000],
+    )
+
+
+class Worker(threading.Thread):
+    def __init__(self, job: CronJob, run: CronRun):
+        # daemon threads are killed when the command exits, which is what
+        # enforces the timeout of a job that never returns
+        super().__init__(daemon=True, name=job.path)
+        self.job = job
+        self.run_obj = run
+        self.exception: Exception | None = None
+
+    def run(self):
+        try:
+            items = self.job.function()
+            finish_run(self.run_obj, "SUCCESS", items=items)
+        except Exception as e:
+            self.exception = e
+            finish_run(self.run_obj, "FAILURE", error=str(e))
+        finally:
+            connection.close()
+
+
+class Scheduler:
+    def __init__(
+        self,
+        jobs: list[CronJob],
+        workers: int = 2,
+        duration: int | None = None,
+        log: Callable[[str], None] = print,
+        poll: float = 0.1,
+    ):
+        self.jobs = jobs
+        self.workers = max(workers, 1)
+        self.duration = duration
+        self.log = log
+        self.poll = poll
+
+    def start(self, job: CronJob) -> Worker:
+        run = CronRun.objects.create(job=job.path, started_at=timezone.now())
+        worker = Worker(job, run)
+        self.log(f"running {job.path}")
+        worker.start()
+        return worker
+
+    def run(self) -> list[Worker]:
+        start = time.monotonic()
+        pending = get_jobs_to_be_run(self.jobs)
+        active: list[tuple[Worker, float]] = []
+        # a thread can not be stopped, a timed out job keeps its worker until
+        # it returns so that no more than self.workers jobs run at once
+        timed_out: list[Worker] = []
+        done: list[Worker] = []
+        while pending or active:
+            for worker, deadline in list(active):
+                if not worker.is_alive():
+                    active.remove((worker, deadline))
+                    done.append(worker)
+                elif time.monotonic() > deadline:
+                    active.remove((worker, deadline))
+                    done.append(worker)
+                    timed_out.append(worker)
+                    finish_run(
+                        worker.run_obj,
+                        "TIMEOUT",
+                        error=f"timeout after {worker.job.timeout} seconds",
+                    )
+                    self.log(f"{worker.job.path} timed out")
+            timed_out = [worker for worker in timed_out if worker.is_alive()]
+            if pending and not active and len(timed_out) >= self.workers:
+                self.log("all workers are blocked by timed out jobs, stopping")
+                pending = []
+            while pending and len(active) + len(timed_out) < self.workers:
+                elapsed = time.monotonic() - start
+                if self.duration is not None and 0 <= self.duration < elapsed:
+                    self.log("duration limit reached, stopping")
+                    pending = []
+                    break
+                job = pending.pop(0)
+                worker = self.start(job)
+                active.append((worker, time.monotonic() + job.timeout))
+            if active:
+                time.sleep(self.poll)
+        return done
@@ -6,7 +6,20 @@ from pydantic import BaseModel
 T = TypeVar("T", bound=BaseModel)
 
 
+class FetchStats(BaseModel):
+    # seconds spent waiting for the source
+    duration: float = 0
+    # seconds spent extracting the price from the response
+    parse_duration: float = 0
+    bytes: int = 0
+
+
 class Fetcher(abc.ABC, Generic[T]):
+    def __init__(self):
+        # measurements of the last fetch by fetcher, fetch_single stores its
+        # measurement under the empty key
+        self.stats: dict[str, FetchStats] = {}
+
     @abc.abstractmethod
     def fetch_single(self, data: T) -> tuple[bool, str | float]:
         raise NotImplementedError()
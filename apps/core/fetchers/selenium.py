@@ -1,9 +1,10 @@
 import re
+import time
 
 from bs4 import BeautifulSoup
 from pydantic import BaseModel, HttpUrl
 
-from apps.core.fetchers.base import Fetcher
+from apps.core.fetchers.base import Fetcher, FetchStats
 from apps.core.selenium import get_chrome_driver
 
 
@@ -14,21 +15,28 @@ class SeleniumFetcherInput(BaseModel):
 
 class SeleniumFetcher(Fetcher):
     def fetch_single(self, data: SeleniumFetcherInput) -> tuple[bool, str | float]:
+        stats = self.stats[""] = FetchStats()
+        start = time.perf_counter()
         browser = get_chrome_driver()
         try:
             browser.get(str(data.website))
             browser.implicitly_wait(5)  # wait for the api requests to finish
             html = browser.page_source
         except Exception as e:
+            stats.duration = time.perf_counter() - start
             return (
                 False,
                 f"An error occured while trying to connect to {data.website}: {e}.",
             )
         finally:
             browser.quit()
+        stats.duration = time.perf_counter() - start
+        stats.bytes = len(html.encode())
 
+        start = time.perf_counter()
         soup = BeautifulSoup(html, features="html.parser")
         selection = soup.select_one(data.target)
+        stats.parse_duration = time.perf_counter() - start
 
         if not selection:
             return (
@@ -53,4 +61,5 @@ class SeleniumFetcher(Fetcher):
         for fetcher, input in data.items():
             result = self.fetch_single(input)
             results[fetcher] = result
+            self.stats[fetcher] = self.stats.pop("")
         return results
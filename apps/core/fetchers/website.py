@@ -6,7 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 from pydantic import BaseModel, HttpUrl
 
-from apps.core.fetchers.base import Fetcher
+from apps.core.fetchers.base import Fetcher, FetchStats
 
 
 class WebsiteFetcherInput(BaseModel):
@@ -37,15 +37,21 @@ headers = {
 
 class WebsiteFetcher(Fetcher):
     def fetch_single(self, data: WebsiteFetcherInput) -> tuple[bool, str | float]:
+        stats = self.stats[""] = FetchStats()
+        start = time.perf_counter()
         try:
             resp = requests.get(str(data.website), headers=headers)
             html = resp.text
         except Exception as e:
+            stats.duration = time.perf_counter() - start
             return (
                 False,
                 f"An error occured while trying to connect to {data.website}: {e}.",
             )
 
+        stats.duration = time.perf_counter() - start
+        stats.bytes = len(resp.content)
+
         if resp.status_code != 200:
             return (
                 False,
@@ -55,8 +61,10 @@ class WebsiteFetcher(Fetcher):
                 ),
             )
 
+        start = time.perf_counter()
         soup = BeautifulSoup(html, features="html.parser")
         selection = soup.select_one(data.target)
+        stats.parse_duration = time.perf_counter() - start
 
         if not selection:
             return (
@@ -82,6 +90,7 @@ class WebsiteFetcher(Fetcher):
         for fetcher, input in data.items():
             result = self.fetch_single(input)
             results[fetcher] = result
+            self.stats[fetcher] = self.stats.pop("")
             time.sleep(i)
             i += 1
         return results
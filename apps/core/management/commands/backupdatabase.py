@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.backup import Repository, backup
+
+
+class Command(BaseCommand):
+    help = (
+        "Takes an online snapshot of the database and stores its new chunks "
+        "compressed in the backup directory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--directory",
+            default=settings.BACKUP_DIR,
+            help="The directory of the chunks and snapshots.",
+        )
+        parser.add_argument(
+            "--keep",
+            type=int,
+            default=None,
+            help="Delete all but the newest snapshots and their unused chunks.",
+        )
+
+    def handle(self, *args, **kwargs):
+        directory: str = kwargs["directory"]
+        stats = backup(settings.DATABASES["default"]["NAME"], directory)
+        self.stdout.write(str(stats))
+        if kwargs["keep"] is not None:
+            deleted = Repository(directory).prune(kwargs["keep"])
+            self.stdout.write("pruned {} chunks".format(deleted))
@@ -0,0 +1,148 @@
+import os
+import sqlite3
+import tempfile
+import time
+from multiprocessing import Process, Queue
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# the cron container fetches prices and writes them in long transactions
+# while the web container reads and writes small amounts of data
+CRON_BATCH = 500
+CRON_HOLD = 0.05
+CRON_FETCH = 0.05
+WEB_WRITE_EVERY = 10
+
+
+def connect(path: str, pragmas: dict) -> sqlite3.Connection:
+    # autocommit, the transactions are started explicitly like django does
+    conn = sqlite3.connect(path, isolation_level=None)
+    for key, value in pragmas.items():
+        conn.execute("PRAGMA {}={}".format(key, value))
+    return conn
+
+
+def setup(path: str, pragmas: dict):
+    conn = connect(path, pragmas)
+    conn.execute(
+        "create table price (id integer primary key, isin text, date real, price real)"
+    )
+    conn.execute("create index price_isin_date on price (isin, date)")
+    conn.executemany(
+        "insert into price (isin, date, price) values (?, ?, ?)",
+        [("ISIN{}".format(i % 50), i, i) for i in range(10000)],
+    )
+    conn.close()
+
+
+def run_cron(path: str, pragmas: dict, begin: str, duration: float, queue: Queue):
+    conn = connect(path, pragmas)
+    rows, errors = 0, 0
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        try:
+            conn.execute(begin)
+            conn.executemany(
+                "insert into price (isin, date, price) values (?, ?, ?)",
+                [("ISIN{}".format(i % 50), time.time(), i) for i in range(CRON_BATCH)],
+            )
+            time.sleep(CRON_HOLD)
+            conn.execute("commit")
+            rows += CRON_BATCH
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute("rollback")
+        time.sleep(CRON_FETCH)
+    queue.put(("cron", rows, errors, []))
+
+
+def run_web(path: str, pragmas: dict, begin: str, duration: float, queue: Queue):
+    conn = connect(path, pragmas)
+    ops, errors, latencies = 0, 0, []
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        start = time.perf_counter()
+        try:
+            if ops % WEB_WRITE_EVERY == WEB_WRITE_EVERY - 1:
+                conn.execute(begin)
+                conn.execute(
+                    "insert into price (isin, date, price) values ('WEB', ?, 1)",
+                    (time.time(),),
+                )
+                conn.execute("commit")
+            else:
+                conn.execute(
+                    "select price from price where isin = ? order by date desc limit 1",
+                    ("ISIN{}".format(ops % 50),),
+                ).fetchone()
+            ops += 1
+            latencies.append(time.perf_counter() - start)
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute("rollback")
+    queue.put(("web", ops, errors, latencies))
+
+
+def benchmark(path: str, pragmas: dict, begin: str, duration: float) -> dict:
+    setup(path, pragmas)
+    queue: Queue = Queue()
+    processes = [
+        Process(target=target, args=(path, pragmas, begin, duration, queue))
+        for target in [run_cron, run_web]
+    ]
+    for process in processes:
+        process.start()
+    results = {
+        name: (count, errors, lat)
+        for name, count, errors, lat in [queue.get() for _ in processes]
+    }
+    for process in processes:
+        process.join()
+    cron_rows, cron_errors, _ = results["cron"]
+    web_ops, web_errors, latencies = results["web"]
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0
+    return {
+        "cron rows/s": cron_rows / duration,
+        "cron errors": cron_errors,
+        "web ops/s": web_ops / duration,
+        "web errors": web_errors,
+        "web p95 ms": p95 * 1000,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the throughput of a cron writer and a web reader that share "
+        "one sqlite database with the default and the configured pragmas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=5,
+            help="Seconds every profile is run.",
+        )
+
+    def handle(self, *args, **kwargs):
+        duration: float = kwargs["duration"]
+        profiles = {
+            # python's sqlite3 defaults, a rollback journal and deferred
+            # transactions
+            "default": ({}, "begin"),
+            "configured": (settings.SQLITE_PRAGMAS, "begin immediate"),
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            for name, (pragmas, begin) in profiles.items():
+                path = os.path.join(directory, "{}.sqlite3".format(name))
+                result = benchmark(path, pragmas, begin, duration)
+                self.stdout.write(
+                    "{:<12}".format(name)
+                    + "  ".join(
+                        "{}: {:.2f}".format(key, value) for key, value in result.items()
+                    )
+                )
@@ -0,0 +1,55 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from apps.core.retention import compact_prices
+from apps.crypto.models import Price as CryptoPrice
+from apps.stocks.models import Price as StocksPrice
+
+
+class Command(BaseCommand):
+    help = (
+        "Compacts the prices older than the retention to the open, high, low and "
+        "close of every day and reports the reclaimed space."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.PRICE_RETENTION_DAYS,
+            help="How many days of prices are kept in full resolution.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.PRICE_COMPACTION_CHUNK,
+            help="How many days are compacted in one transaction.",
+        )
+        parser.add_argument(
+            "--vacuum",
+            action="store_true",
+            help="Return the freed space to the file system afterwards.",
+        )
+
+    def handle(self, *args, **kwargs):
+        path = settings.DATABASES["default"]["NAME"]
+        size = os.path.getsize(path)
+        for model in [StocksPrice, CryptoPrice]:
+            stats = compact_prices(model, kwargs["days"], kwargs["chunk_size"])
+            self.stdout.write(
+                "{}: compacted {} days, deleted {} prices, freed {:.1f} KiB".format(
+                    model._meta.label, stats.days, stats.rows, stats.bytes / 1024
+                )
+            )
+        if not kwargs["vacuum"]:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute("VACUUM")
+        self.stdout.write(
+            "vacuum: {:.1f} KiB -> {:.1f} KiB".format(
+                size / 1024, os.path.getsize(path) / 1024
+            )
+        )
@@ -1,10 +1,8 @@
-import importlib
-import time
-from typing import Callable
-
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+from apps.core.cron import Scheduler, load_jobs
+
 
 class Command(BaseCommand):
     def add_arguments(self, parser):
@@ -17,26 +15,28 @@ class Command(BaseCommand):
                 "starting new jobs once the duration is exceeded."
             ),
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=getattr(settings, "CRON_WORKERS", 2),
+            help="How many jobs are allowed to run at the same time.",
+        )
 
     def handle(self, *args, **kwargs):
         duration: int | None = kwargs.get("duration")
-        start = time.monotonic()
+        workers: int = kwargs["workers"]
+
+        jobs = load_jobs(settings.CRONJOBS)
+        scheduler = Scheduler(
+            jobs, workers=workers, duration=duration, log=self.stdout.write
+        )
+        done = scheduler.run()
 
-        jobs = []
-        for s in settings.CRONJOBS:
-            module_name = ".".join(s.split(".")[:-1])
-            module = importlib.import_module(module_name)
-            function_name = s.split(".")[-1]
-            job: Callable[[], None] = getattr(module, function_name)
-            jobs.append(job)
-        for job in jobs:
-            if duration is not None and duration >= 0 and (time.monotonic() - start) > duration:
-                self.stdout.write("duration limit reached, stopping")
-                break
-            self.stdout.write(f"running {job}")
-            try:
-                job()
-            except AssertionError as e:
-                raise e
-            except Exception as e:
-                self.stderr.write(self.style.ERROR(f"{job} failed with \n{e}"))
+        for worker in done:
+            if worker.exception is None:
+                continue
+            if isinstance(worker.exception, AssertionError):
+                raise worker.exception
+            self.stderr.write(
+                self.style.ERROR(f"{worker.job.path} failed with \n{worker.exception}")
+            )
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.portfolio import CHUNK_ROWS, export_portfolio
+from apps.users.models import StandardUser
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports every depot, transaction and price of a user as compressed "
+        "columnar files into a directory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="The user whose portfolio is exported.")
+        parser.add_argument("directory", help="The directory of the export.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_ROWS,
+            help="How many rows are written to one file.",
+        )
+
+    def handle(self, *args, **kwargs):
+        try:
+            user = StandardUser.objects.get(username=kwargs["username"])
+        except StandardUser.DoesNotExist:
+            raise CommandError(
+                "The user '{}' does not exist.".format(kwargs["username"])
+            )
+        stats = export_portfolio(user, kwargs["directory"], kwargs["chunk_size"])
+        for label, rows in stats.rows.items():
+            self.stdout.write("{}: {} rows".format(label, rows))
+        self.stdout.write(str(stats))
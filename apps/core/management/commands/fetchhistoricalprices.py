@@ -0,0 +1,29 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.stocks.tasks import fetch_historical_prices
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from",
+            dest="date_from",
+            type=date.fromisoformat,
+            default=None,
+            help="First day to fetch, defaults to 30 days ago.",
+        )
+        parser.add_argument(
+            "--to",
+            dest="date_to",
+            type=date.fromisoformat,
+            default=None,
+            help="Last day to fetch, defaults to today.",
+        )
+
+    def handle(self, *args, **kwargs):
+        date_to: date = kwargs["date_to"] or date.today()
+        date_from: date = kwargs["date_from"] or date_to - timedelta(days=30)
+        saved = fetch_historical_prices(date_from, date_to)
+        self.stdout.write(f"Saved {saved} marketstack prices")
@@ -25,7 +25,7 @@ class Command(BaseCommand):
             for t, p in prices:
                 date = datetime.fromtimestamp(t / 1000)
                 if not Price.objects.filter(
-                    symbol=asset.symbol, date__date=date.date()
+                    symbol=asset.symbol, local_date=date.date()
                 ).exists():
                     price = Price.objects.create(
                         symbol=asset.symbol, date=date, price=p
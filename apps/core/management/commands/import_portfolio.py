@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.portfolio import import_portfolio
+from apps.users.models import StandardUser
+
+
+class Command(BaseCommand):
+    help = (
+        "Adds the portfolio of an export to a user and recalculates its values "
+        "once at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="The user that gets the portfolio.")
+        parser.add_argument("directory", help="The directory of the export.")
+
+    def handle(self, *args, **kwargs):
+        try:
+            user = StandardUser.objects.get(username=kwargs["username"])
+        except StandardUser.DoesNotExist:
+            raise CommandError(
+                "The user '{}' does not exist.".format(kwargs["username"])
+            )
+        try:
+            stats = import_portfolio(user, kwargs["directory"])
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+        self.stdout.write(str(stats))
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.backup import Repository, restore
+
+
+class Command(BaseCommand):
+    help = "Restores a snapshot of the backup directory into the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "snapshot",
+            nargs="?",
+            default="latest",
+            help="The name of the snapshot, the newest one by default.",
+        )
+        parser.add_argument(
+            "--directory",
+            default=settings.BACKUP_DIR,
+            help="The directory of the chunks and snapshots.",
+        )
+        parser.add_argument(
+            "--output",
+            default=settings.DATABASES["default"]["NAME"],
+            help="The database that is overwritten, the configured one by default.",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="List the snapshots instead of restoring one.",
+        )
+
+    def handle(self, *args, **kwargs):
+        directory: str = kwargs["directory"]
+        if kwargs["list"]:
+            for name in Repository(directory).get_snapshots():
+                self.stdout.write(name)
+            return
+        try:
+            stats = restore(directory, kwargs["snapshot"], kwargs["output"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(str(stats))
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="CronRun",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("job", models.CharField(max_length=200)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("RUNNING", "Running"),
+                            ("SUCCESS", "Success"),
+                            ("FAILURE", "Failure"),
+                            ("TIMEOUT", "Timeout"),
+                        ],
+                        default="RUNNING",
+                        max_length=20,
+                    ),
+                ),
+                ("started_at", models.DateTimeField()),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("duration", models.FloatField(blank=True, null=True)),
+                ("items", models.IntegerField(blank=True, null=True)),
+                ("error", models.CharField(blank=True, max_length=1000)),
+            ],
+            options={
+                "verbose_name": "Cron Run",
+                "verbose_name_plural": "Cron Runs",
+                "ordering": ["-started_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["job", "-started_at"], name="core_cronru_job_4fe319_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,7 +1,57 @@
-from django.db import models
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 
+import numpy as np
+import pandas as pd
+from django.db import connection, models, transaction
+from django.utils import timezone
+from pydantic import BaseModel
 
-class Depot(models.Model):
+import apps.core.utils as utils
+from apps.core.fetchers.base import FetchStats
+from apps.users.models import StandardUser
+
+# fetch attempts older than this are deleted, the stats only cover this window
+FETCH_ATTEMPTS_DAYS = 14
+# after this many failures in a row the circuit of a fetcher opens, until then
+# the pause between two attempts doubles with every failure
+CIRCUIT_FAILURES = 5
+BACKOFF_BASE = timedelta(minutes=15)
+BACKOFF_MAX = timedelta(days=2)
+
+
+class DataVersionMixin:
+    """
+    Bumps the data version of the owner on save and delete, for the depots
+    and the objects that are shown in their cached template fragments. If
+    the model sets DATA_VERSION_FIELDS a save only bumps if one of them
+    changed, the other fields are cached values that are filled lazily.
+    """
+
+    DATA_VERSION_FIELDS: tuple[str, ...] | None = None
+
+    def get_owner_id(self) -> int:
+        return self.depot.user_id  # type: ignore
+
+    def has_data_version_changes(self) -> bool:
+        if self.DATA_VERSION_FIELDS is None or self._state.adding:  # type: ignore
+            return True
+        values = {name: getattr(self, name) for name in self.DATA_VERSION_FIELDS}
+        return not type(self).objects.filter(pk=self.pk, **values).exists()  # type: ignore
+
+    def save(self, *args, **kwargs):
+        changed = self.has_data_version_changes()
+        super().save(*args, **kwargs)  # type: ignore
+        if changed:
+            StandardUser.bump_data_version(self.get_owner_id())
+
+    def delete(self, *args, **kwargs):
+        ret = super().delete(*args, **kwargs)  # type: ignore
+        StandardUser.bump_data_version(self.get_owner_id())
+        return ret
+
+
+class Depot(DataVersionMixin, models.Model):
     name = models.CharField(max_length=200)
     is_active = models.BooleanField(default=False)
 
@@ -11,8 +61,11 @@ class Depot(models.Model):
     def __str__(self):
         return self.name
 
+    def get_owner_id(self) -> int:
+        return self.user_id  # type: ignore
+
 
-class Account(models.Model):
+class Account(DataVersionMixin, models.Model):
     name = models.CharField(max_length=200)
 
     class Meta:
@@ -20,3 +73,416 @@ class Account(models.Model):
 
     def __str__(self):
         return self.name
+
+
+def get_local_date(value: datetime) -> date:
+    # django saves a naive date as a date in the default time zone
+    if timezone.is_naive(value):
+        return value.date()
+    return timezone.localtime(value, timezone.get_default_timezone()).date()
+
+
+class LocalDateQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.set_local_date()
+        return super().bulk_create(objs, *args, **kwargs)
+
+
+class LocalDateMixin:
+    """
+    Stores the calendar day of date in the time zone of the project in the
+    local_date field on save, raw queries group and filter on the indexed
+    column instead of computing date(date) for every row. The model uses the
+    LocalDateQuerySet as its manager so that bulk_create sets it as well,
+    updates of date through a queryset have to set it themselves.
+    """
+
+    date: datetime
+    local_date: date
+
+    def set_local_date(self):
+        self.local_date = get_local_date(self.date)
+
+    def save(self, *args, **kwargs):
+        self.set_local_date()
+        super().save(*args, **kwargs)  # type: ignore
+
+
+class PriceRollup(models.Model):
+    """
+    One row per instrument and day with the open, high, low and close of the
+    prices of that day, the price series are read from here instead of from
+    the intraday prices. The subclasses set KEY to the column that identifies
+    the instrument, PRICE_TABLE to the table of the prices and need a unique
+    constraint on KEY and day.
+    """
+
+    KEY: str
+    PRICE_TABLE: str
+
+    day = models.DateField()
+    open = models.DecimalField(max_digits=20, decimal_places=2)
+    high = models.DecimalField(max_digits=20, decimal_places=2)
+    low = models.DecimalField(max_digits=20, decimal_places=2)
+    close = models.DecimalField(max_digits=20, decimal_places=2)
+    first_date = models.DateTimeField()
+    last_date = models.DateTimeField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        abstract = True
+        ordering = ["-day"]
+
+    def __str__(self):
+        return "{} - {} - {}".format(getattr(self, self.KEY), self.day, self.close)
+
+    @classmethod
+    def add(cls, key: str | None, day: date, date: datetime, price):
+        if key is None:
+            return
+        date_value = connection.ops.adapt_datetimefield_value(date)
+        statement = """
+            insert into {table} ({key}, day, open, high, low, close,
+                first_date, last_date, count)
+            values (%s, %s, %s, %s, %s, %s, %s, %s, 1)
+            on conflict ({key}, day) do update set
+                open = case when excluded.first_date < first_date
+                    then excluded.open else open end,
+                high = max(high, excluded.high),
+                low = min(low, excluded.low),
+                close = case when excluded.last_date >= last_date
+                    then excluded.close else close end,
+                first_date = min(first_date, excluded.first_date),
+                last_date = max(last_date, excluded.last_date),
+                count = count + 1
+        """.format(table=cls._meta.db_table, key=cls.KEY)
+        params = [key, day.isoformat()] + [price] * 4 + [date_value] * 2
+        with connection.cursor() as cursor:
+            cursor.execute(statement, params)
+
+    @classmethod
+    def refresh(cls, key: str | None, day_from: date, day_to: date):
+        """
+        Recomputes the rollups of the days from the prices, used after prices
+        were changed, deleted or created without their save method.
+        """
+        if key is None:
+            return
+        table = cls._meta.db_table
+        statement = """
+            insert into {table} ({key}, day, open, high, low, close,
+                first_date, last_date, count)
+            select distinct
+                {key},
+                local_date,
+                first_value(price) over w,
+                max(price) over w,
+                min(price) over w,
+                last_value(price) over w,
+                min(date) over w,
+                max(date) over w,
+                count(*) over w
+            from {prices}
+            where {key} = %s and local_date >= %s and local_date <= %s
+            window w as (
+                partition by local_date order by date, id
+                rows between unbounded preceding and unbounded following
+            )
+        """.format(table=table, key=cls.KEY, prices=cls.PRICE_TABLE)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "delete from {} where {} = %s and day >= %s and day <= %s".format(
+                    table, cls.KEY
+                ),
+                [key, day_from.isoformat(), day_to.isoformat()],
+            )
+            cursor.execute(statement, [key, day_from.isoformat(), day_to.isoformat()])
+
+    @classmethod
+    def rebuild(cls):
+        with connection.cursor() as cursor:
+            cursor.execute("delete from {}".format(cls._meta.db_table))
+            cursor.execute(
+                "select {key}, min(local_date), max(local_date) from {prices} "
+                "where {key} is not null group by {key}".format(
+                    key=cls.KEY, prices=cls.PRICE_TABLE
+                )
+            )
+            ranges = cursor.fetchall()
+        for key, day_from, day_to in ranges:
+            cls.refresh(key, date.fromisoformat(day_from), date.fromisoformat(day_to))
+
+
+class RolledUpPriceMixin:
+    """
+    Keeps the PriceRollup of a price model up to date on save and delete. The
+    model sets ROLLUP, bulk operations have to call ROLLUP.refresh themselves.
+    """
+
+    ROLLUP: type[PriceRollup]
+    date: datetime
+    local_date: date
+    price: models.DecimalField
+
+    def get_rollup_key(self) -> str | None:
+        return getattr(self, self.ROLLUP.KEY)
+
+    def save(self, *args, **kwargs):
+        previous = None
+        if not self._state.adding:  # type: ignore
+            previous = (
+                type(self)
+                .objects.filter(pk=self.pk)  # type: ignore
+                .only(self.ROLLUP.KEY, "local_date")
+                .first()
+            )
+        super().save(*args, **kwargs)  # type: ignore
+        if previous is None:
+            self.ROLLUP.add(
+                self.get_rollup_key(), self.local_date, self.date, self.price
+            )
+            return
+        for price in [previous, self]:
+            day = price.local_date
+            self.ROLLUP.refresh(price.get_rollup_key(), day, day)
+
+    def delete(self, *args, **kwargs):
+        ret = super().delete(*args, **kwargs)  # type: ignore
+        self.ROLLUP.refresh(self.get_rollup_key(), self.local_date, self.local_date)
+        return ret
+
+
+class ClosingValue(models.Model):
+    """
+    The summed value of the archived items of a depot at the end of every day
+    on which one of them changed. Archived items are dormant, their histories
+    are frozen into these rows once and the value series and totals of the
+    depot read the rows instead of the histories. The subclasses need a
+    foreign key named depot and set STATEMENT to a select of the depot, day
+    and value of the archived items of the depot given as parameter.
+    """
+
+    STATEMENT: str
+
+    day = models.DateField()
+    value = models.DecimalField(max_digits=15, decimal_places=2)
+
+    class Meta:
+        abstract = True
+        ordering = ["day"]
+
+    def __str__(self):
+        return "{} - {}".format(self.day, self.value)
+
+    @classmethod
+    def freeze(cls, depot_id: int):
+        table = cls._meta.db_table
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "delete from {} where depot_id = %s".format(table), [depot_id]
+            )
+            cursor.execute(
+                "insert into {} (depot_id, day, value) {}".format(table, cls.STATEMENT),
+                [depot_id],
+            )
+
+    @classmethod
+    def get_last_value(cls, depot_id: int) -> Decimal | None:
+        closing = cls.objects.filter(depot_id=depot_id).order_by("day").last()  # type: ignore
+        return closing.value if closing else None
+
+
+class ClosingSeries:
+    """
+    Stands in for the archived items of a depot in the value series that are
+    summed up from the items of the depot.
+    """
+
+    pk = "closing"
+
+    def __init__(self, model: type[ClosingValue], depot_id: int):
+        self.model = model
+        self.depot_id = depot_id
+
+    def get_value_df(self) -> pd.DataFrame:
+        statement = """
+            select day as date, value
+            from {}
+            where depot_id = {}
+            order by day
+        """.format(self.model._meta.db_table, self.depot_id)
+        return utils.get_df_from_database(statement, ["date", "value"])
+
+
+class ArchivableMixin:
+    """
+    Freezes the closing values of the depot of the item when it is archived,
+    unarchived or deleted while being archived. The model sets CLOSING to the
+    closing value model of its depot.
+    """
+
+    CLOSING: type[ClosingValue]
+    is_archived: bool
+    depot_id: int
+
+    def save(self, *args, **kwargs):
+        was_archived = (
+            not self._state.adding  # type: ignore
+            and type(self).objects.filter(pk=self.pk, is_archived=True).exists()  # type: ignore
+        )
+        super().save(*args, **kwargs)  # type: ignore
+        if was_archived != self.is_archived:
+            self.CLOSING.freeze(self.depot_id)
+
+    def delete(self, *args, **kwargs):
+        ret = super().delete(*args, **kwargs)  # type: ignore
+        if self.is_archived:
+            self.CLOSING.freeze(self.depot_id)
+        return ret
+
+
+class CronRun(models.Model):
+    job = models.CharField(max_length=200)
+    STATUS_TYPES = (
+        ("RUNNING", "Running"),
+        ("SUCCESS", "Success"),
+        ("FAILURE", "Failure"),
+        ("TIMEOUT", "Timeout"),
+    )
+    status = models.CharField(max_length=20, choices=STATUS_TYPES, default="RUNNING")
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration = models.FloatField(null=True, blank=True)
+    items = models.IntegerField(null=True, blank=True)
+    error = models.CharField(max_length=1000, blank=True)
+
+    class Meta:
+        verbose_name = "Cron Run"
+        verbose_name_plural = "Cron Runs"
+        ordering = ["-started_at"]
+        indexes = [models.Index(fields=["job", "-started_at"])]
+
+    def __str__(self):
+        return "{} - {} - {}".format(self.job, self.started_at, self.status)
+
+    @property
+    def throughput(self) -> float | None:
+        if not self.items or not self.duration:
+            return None
+        return self.items / self.duration
+
+
+class FetchAttempt(models.Model):
+    STATUS_TYPES = (
+        ("SUCCESS", "Success"),
+        ("FAILURE", "Failure"),
+    )
+    status = models.CharField(max_length=20, choices=STATUS_TYPES)
+    created_at = models.DateTimeField(default=timezone.now)
+    duration = models.FloatField()
+    parse_duration = models.FloatField(default=0)
+    bytes = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return "{} - {} - {:.2f}s".format(self.created_at, self.status, self.duration)
+
+    @classmethod
+    def delete_old(cls) -> int:
+        since = timezone.now() - timedelta(days=FETCH_ATTEMPTS_DAYS)
+        return cls.objects.filter(created_at__lt=since).delete()[0]  # type: ignore
+
+
+class FetcherStats(BaseModel):
+    attempts: int = 0
+    success_rate: float | None = None
+    p50: float | None = None
+    p95: float | None = None
+    last_success: datetime | None = None
+
+    @classmethod
+    def from_attempts(cls, attempts: list[FetchAttempt]) -> "FetcherStats":
+        if not attempts:
+            return cls()
+        durations = np.array([attempt.duration for attempt in attempts])
+        successes = [a.created_at for a in attempts if a.status == "SUCCESS"]
+        return cls(
+            attempts=len(attempts),
+            success_rate=len(successes) / len(attempts),
+            p50=float(np.percentile(durations, 50)),
+            p95=float(np.percentile(durations, 95)),
+            last_success=max(successes) if successes else None,
+        )
+
+    def __str__(self):
+        if not self.attempts:
+            return "No attempts"
+        return "p50 {:.2f}s, p95 {:.2f}s, {:.0%} of {} succeeded".format(
+            self.p50, self.p95, self.success_rate, self.attempts
+        )
+
+
+class FetcherStatsMixin:
+    """
+    Used by the price fetchers of the apps. The model needs a FetchAttempt with
+    related_name "attempts", prefetch it to get the stats of many fetchers.
+    """
+
+    attempts: models.Manager
+
+    def record_attempt(self, success: bool, stats: FetchStats | None):
+        stats = stats or FetchStats()
+        self.attempts.create(
+            status="SUCCESS" if success else "FAILURE",
+            duration=stats.duration,
+            parse_duration=stats.parse_duration,
+            bytes=stats.bytes,
+        )
+
+    def get_stats(self) -> FetcherStats:
+        since = timezone.now() - timedelta(days=FETCH_ATTEMPTS_DAYS)
+        attempts = [a for a in self.attempts.all() if a.created_at >= since]
+        return FetcherStats.from_attempts(attempts)
+
+
+class CircuitBreakerMixin:
+    """
+    Used by the price fetchers of the apps. A failing fetcher is paused for an
+    exponentially growing time, after CIRCUIT_FAILURES failures in a row its
+    circuit is open and it is only probed once every BACKOFF_MAX. The model
+    needs a failures and a next_attempt_at field, both are saved by the caller.
+    """
+
+    failures: int
+    next_attempt_at: datetime | None
+
+    @property
+    def circuit_state(self) -> str:
+        if self.failures < CIRCUIT_FAILURES:
+            return "CLOSED"
+        if self.next_attempt_at and self.next_attempt_at > timezone.now():
+            return "OPEN"
+        return "HALF_OPEN"
+
+    def get_circuit_state_display(self) -> str:
+        return self.circuit_state.replace("_", "-").lower()
+
+    @property
+    def is_due(self) -> bool:
+        return self.next_attempt_at is None or self.next_attempt_at <= timezone.now()
+
+    def close_circuit(self):
+        self.failures = 0
+        self.next_attempt_at = None
+
+    def register_failure(self):
+        self.failures += 1
+        backoff = BACKOFF_BASE * 2 ** (self.failures - 1)
+        if self.failures >= CIRCUIT_FAILURES:
+            backoff = BACKOFF_MAX
+        self.next_attempt_at = timezone.now() + min(backoff, BACKOFF_MAX)
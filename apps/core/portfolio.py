@@ -0,0 +1,332 @@
+import json
+import os
+import time
+from collections.abc import Iterable
+from datetime import date, timezone
+from decimal import Decimal
+from itertools import islice
+
+import numpy as np
+from django.apps import apps
+from django.db import models, transaction
+from pydantic import BaseModel
+
+from apps.users.models import StandardUser
+
+# rows per chunk file, the export and the import only hold one chunk in memory
+CHUNK_ROWS = 50000
+VERSION = 1
+MANIFEST = "manifest.json"
+
+# the models of a portfolio in the order they are imported, every model only
+# references models before it, with the lookup from the model to its user
+PORTFOLIO_MODELS = {
+    "overview.Bucket": "user",
+    "banking.Depot": "user",
+    "banking.Account": "depot__user",
+    "banking.Category": "depot__user",
+    "banking.Change": "account__depot__user",
+    "crypto.Depot": "user",
+    "crypto.Account": "depot__user",
+    "crypto.Asset": "depot__user",
+    "crypto.AccountAssetStats": "account__depot__user",
+    "crypto.Trade": "account__depot__user",
+    "crypto.Transaction": "from_account__depot__user",
+    "crypto.Flow": "account__depot__user",
+    "crypto.PriceFetcher": "asset__depot__user",
+    "stocks.Depot": "user",
+    "stocks.Bank": "depot__user",
+    "stocks.Stock": "depot__user",
+    "stocks.Flow": "bank__depot__user",
+    "stocks.Trade": "bank__depot__user",
+    "stocks.Dividend": "bank__depot__user",
+    "stocks.PriceFetcher": "stock__depot__user",
+    "alternative.Depot": "user",
+    "alternative.Alternative": "depot__user",
+    "alternative.Value": "alternative__depot__user",
+    "alternative.Flow": "alternative__depot__user",
+}
+# the prices are shared between the users, the prices of the instruments of
+# the portfolio are exported and the missing ones are added on import
+PRICE_MODELS = {
+    "stocks.Price": "stocks.Stock",
+    "crypto.Price": "crypto.Asset",
+}
+
+
+class PortfolioStats(BaseModel):
+    rows: dict[str, int] = {}
+    # bytes of the chunk files
+    size: int = 0
+    duration: float = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.rows.values())
+
+    def __str__(self):
+        return "{} rows of {} models, {:.2f} MiB in {:.1f} s".format(
+            self.total, len(self.rows), self.size / 2**20, self.duration
+        )
+
+
+def get_queryset(label: str, user: StandardUser) -> models.QuerySet:
+    model = apps.get_model(label)
+    if label in PRICE_MODELS:
+        key = model.ROLLUP.KEY  # type: ignore
+        instruments = apps.get_model(PRICE_MODELS[label]).objects.filter(
+            depot__user=user
+        )
+        return model.objects.filter(**{"{}__in".format(key): instruments.values(key)})
+    return model.objects.filter(**{PORTFOLIO_MODELS[label]: user})
+
+
+def get_kind(field: models.Field) -> str:
+    kind = field.get_internal_type()
+    if field.is_relation or kind.endswith("IntegerField") or kind.endswith("AutoField"):
+        return "int"
+    return {
+        "FloatField": "float",
+        "BooleanField": "bool",
+        "DecimalField": "decimal",
+        "DateTimeField": "datetime",
+        "DateField": "date",
+        "JSONField": "json",
+    }.get(kind, "str")
+
+
+def encode(kind: str, values: tuple) -> np.ndarray:
+    """
+    Converts a column to a numpy array that is stored without pickle, decimals
+    are stored as text to keep them exact and datetimes in utc.
+    """
+    if kind == "int":
+        return np.array([0 if v is None else v for v in values], dtype=np.int64)
+    if kind == "float":
+        return np.array([np.nan if v is None else v for v in values], dtype=float)
+    if kind == "bool":
+        return np.array([bool(v) for v in values], dtype=bool)
+    if kind == "datetime":
+        values = tuple(
+            None if v is None else v.astimezone(timezone.utc).replace(tzinfo=None)
+            for v in values
+        )
+        return np.array(values, dtype="datetime64[us]")
+    if kind == "date":
+        return np.array(values, dtype="datetime64[D]")
+    if kind == "json":
+        return np.array([json.dumps(v) for v in values], dtype=str)
+    return np.array(["" if v is None else str(v) for v in values], dtype=str)
+
+
+def decode(kind: str, array: np.ndarray, nulls: np.ndarray | None) -> list:
+    values = array.tolist()
+    if nulls is not None:
+        values = [None if null else v for v, null in zip(values, nulls.tolist())]
+    convert = {
+        "datetime": lambda v: v.replace(tzinfo=timezone.utc),
+        "decimal": Decimal,
+        "json": json.loads,
+    }.get(kind)
+    if convert is None:
+        return values
+    return [None if v is None else convert(v) for v in values]
+
+
+def get_chunks(rows: Iterable, size: int):
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def export_portfolio(
+    user: StandardUser, directory: str, chunk_size: int = CHUNK_ROWS
+) -> PortfolioStats:
+    """
+    Writes every model of the portfolio of the user as compressed npz files
+    with one array per column. The rows are streamed from the database in
+    chunks of chunk_size rows and every chunk is written to its own file.
+    """
+    start = time.perf_counter()
+    os.makedirs(directory, exist_ok=True)
+    stats = PortfolioStats()
+    manifest: dict = {"version": VERSION, "models": {}}
+
+    for label in list(PORTFOLIO_MODELS) + list(PRICE_MODELS):
+        model = apps.get_model(label)
+        fields = model._meta.concrete_fields
+        columns = {field.attname: get_kind(field) for field in fields}
+        queryset = get_queryset(label, user).order_by("pk").values_list(*columns)
+        chunks, rows = [], 0
+        for chunk in get_chunks(queryset.iterator(chunk_size=chunk_size), chunk_size):
+            arrays = {}
+            for (name, kind), values in zip(columns.items(), zip(*chunk)):
+                arrays[name] = encode(kind, values)
+                if None in values:
+                    arrays["{}__null".format(name)] = np.array(
+                        [v is None for v in values], dtype=bool
+                    )
+            file = "{}.{}.npz".format(label, len(chunks))
+            path = os.path.join(directory, file)
+            np.savez_compressed(path, **arrays)  # type: ignore
+            stats.size += os.path.getsize(path)
+            chunks.append(file)
+            rows += len(chunk)
+        manifest["models"][label] = {"columns": columns, "chunks": chunks, "rows": rows}
+        stats.rows[label] = rows
+
+    with open(os.path.join(directory, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+    stats.duration = time.perf_counter() - start
+    return stats
+
+
+def read_chunk(directory: str, file: str, columns: dict[str, str]) -> list[dict]:
+    with np.load(os.path.join(directory, file), allow_pickle=False) as arrays:
+        values = {
+            name: decode(kind, arrays[name], arrays.get("{}__null".format(name)))
+            for name, kind in columns.items()
+        }
+    return [dict(zip(values, row)) for row in zip(*values.values())]
+
+
+def import_rows(
+    model: type[models.Model],
+    rows: list[dict],
+    user: StandardUser,
+    ids: dict[str, dict[int, int]],
+) -> list[models.Model]:
+    """
+    Creates the rows with new primary keys. The foreign keys are mapped to the
+    new primary keys of the imported rows, foreign keys to rows that are not
+    part of the export, like the cached price of a stock, are set to null and
+    filled by the recompute.
+    """
+    pk = model._meta.pk.attname  # type: ignore
+    objs = []
+    for row in rows:
+        row.pop(pk)
+        for field in model._meta.concrete_fields:
+            if not field.is_relation or row[field.attname] is None:
+                continue
+            target = field.related_model._meta.label  # type: ignore
+            if target == StandardUser._meta.label:
+                row[field.attname] = user.pk
+            elif target in ids:
+                row[field.attname] = ids[target][row[field.attname]]
+            else:
+                row[field.attname] = None
+        objs.append(model(**row))
+    return model.objects.bulk_create(objs)  # type: ignore
+
+
+def import_prices(
+    model: type[models.Model], rows: list[dict], days: dict[str, tuple[date, date]]
+):
+    """
+    Adds the prices that do not exist yet and extends the range of days of
+    every instrument with new prices in days.
+    """
+    key = model.ROLLUP.KEY  # type: ignore
+    dates = [row["date"] for row in rows]
+    existing = set(
+        model.objects.filter(  # type: ignore
+            **{"{}__in".format(key): {row[key] for row in rows}},
+            date__gte=min(dates),
+            date__lte=max(dates),
+        ).values_list(key, "date")
+    )
+    objs = []
+    for row in rows:
+        row.pop(model._meta.pk.attname)  # type: ignore
+        if (row[key], row["date"]) not in existing:
+            objs.append(model(**row))
+    for obj in model.objects.bulk_create(objs):  # type: ignore
+        day = getattr(obj, "local_date")
+        first, last = days.get(getattr(obj, key), (day, day))
+        days[getattr(obj, key)] = (min(first, day), max(last, day))
+
+
+def recompute(user: StandardUser, depots: dict[str, list[int]]):
+    """
+    Recalculates every cached value of the imported depots once, the rows
+    were created with bulk_create and none of their save methods ran.
+    """
+    from apps.alternative.models import ClosingValue as AlternativeClosingValue
+    from apps.alternative.models import Depot as AlternativeDepot
+    from apps.banking.models import ChangeRollup
+    from apps.banking.models import ClosingValue as BankingClosingValue
+    from apps.banking.models import Depot as BankingDepot
+    from apps.crypto.models import Depot as CryptoDepot
+    from apps.crypto.models import Holding
+    from apps.stocks.models import Depot as StocksDepot
+
+    for depot in BankingDepot.objects.filter(pk__in=depots["banking.Depot"]):
+        ChangeRollup.rebuild(depot.accounts.all())
+        BankingClosingValue.freeze(depot.pk)
+        depot.set_balances_to_none()
+        depot.calculate_changes_count()
+        depot.reset_balance()
+    for depot_id in depots["alternative.Depot"]:
+        AlternativeClosingValue.freeze(depot_id)
+    for depot_id in depots["crypto.Depot"]:
+        Holding.rebuild(depot_id)
+    for model in [CryptoDepot, StocksDepot, AlternativeDepot]:
+        for depot in model.objects.filter(pk__in=depots[model._meta.label]):
+            depot.reset_all()
+    StandardUser.bump_data_version(user.pk)
+
+
+def import_portfolio(user: StandardUser, directory: str) -> PortfolioStats:
+    """
+    Adds the portfolio of an export to the user in a single transaction. The
+    rows are created chunk by chunk with bulk_create and the cached values
+    are recomputed once at the end. Imported depots are only active if the
+    user has no active depot of that kind yet.
+    """
+    start = time.perf_counter()
+    with open(os.path.join(directory, MANIFEST)) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != VERSION:
+        raise ValueError("The export has an unknown version.")
+    stats = PortfolioStats()
+    ids: dict[str, dict[int, int]] = {}
+    days: dict[str, dict[str, tuple[date, date]]] = {}
+
+    with transaction.atomic():
+        for label in list(PORTFOLIO_MODELS) + list(PRICE_MODELS):
+            if label not in manifest["models"]:
+                continue
+            model = apps.get_model(label)
+            info = manifest["models"][label]
+            has_active = label.endswith(".Depot") and (
+                model.objects.filter(user=user, is_active=True).exists()
+            )
+            ids[label], days[label] = {}, {}
+            for file in info["chunks"]:
+                stats.size += os.path.getsize(os.path.join(directory, file))
+                rows = read_chunk(directory, file, info["columns"])
+                if label in PRICE_MODELS:
+                    import_prices(model, rows, days[label])
+                    continue
+                if has_active:
+                    for row in rows:
+                        row["is_active"] = False
+                old = [row[model._meta.pk.attname] for row in rows]  # type: ignore
+                objs = import_rows(model, rows, user, ids)
+                ids[label].update(zip(old, [obj.pk for obj in objs]))
+            stats.rows[label] = info["rows"]
+
+        for label in PRICE_MODELS:
+            rollup = apps.get_model(label).ROLLUP  # type: ignore
+            for key, (first, last) in days.get(label, {}).items():
+                rollup.refresh(key, first, last)
+        depots = {
+            label: list(ids.get(label, {}).values())
+            for label in PORTFOLIO_MODELS
+            if label.endswith(".Depot")
+        }
+        recompute(user, depots)
+
+    stats.duration = time.perf_counter() - start
+    return stats
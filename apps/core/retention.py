@@ -0,0 +1,110 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.utils import timezone
+from pydantic import BaseModel
+
+from apps.core.models import PriceRollup
+
+logger = logging.getLogger(__name__)
+
+# the open, high, low and close of a day, a refresh of the rollup from these
+# prices gives the same rollup
+COMPACTED_COUNT = 4
+
+
+class CompactionStats(BaseModel):
+    days: int = 0
+    rows: int = 0
+    # bytes that were freed inside of the database file, they are reused by
+    # new rows or returned to the file system by a vacuum
+    bytes: int = 0
+
+
+def get_free_bytes() -> int:
+    if connection.vendor != "sqlite":
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA freelist_count")
+        free_pages = cursor.fetchone()[0]
+        cursor.execute("PRAGMA page_size")
+        return free_pages * cursor.fetchone()[0]
+
+
+def compact_chunk(price_model: type[models.Model], rollups: list[PriceRollup]) -> int:
+    """
+    Deletes every price of the days of the rollups except for the open, high,
+    low and close. A refresh of the rollups from the remaining prices gives
+    the same rollups, their count is set to the remaining prices.
+    """
+    rollup_model = type(rollups[0])
+    key = rollup_model.KEY
+    prices = price_model._meta.db_table
+    statement = """
+        delete from {prices}
+        where {key} = %s and local_date = %s and id not in (
+            select id
+            from (
+                select
+                    id,
+                    row_number() over (order by date, id) as open_rank,
+                    row_number() over (order by date desc, id desc) as close_rank,
+                    row_number() over (order by price desc, date, id) as high_rank,
+                    row_number() over (order by price, date, id) as low_rank
+                from {prices}
+                where {key} = %s and local_date = %s
+            )
+            where 1 in (open_rank, close_rank, high_rank, low_rank)
+        )
+    """.format(prices=prices, key=key)
+    count_statement = "select count(*) from {} where {} = %s and local_date = %s"
+    count_statement = count_statement.format(prices, key)
+    deleted = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        for rollup in rollups:
+            params = [getattr(rollup, key), rollup.day.isoformat()]
+            cursor.execute(statement, params * 2)
+            deleted += cursor.rowcount
+            cursor.execute(count_statement, params)
+            rollup.count = cursor.fetchone()[0]
+        rollup_model.objects.bulk_update(rollups, ["count"])
+    return deleted
+
+
+def compact_prices(
+    price_model: type[models.Model],
+    keep_days: int | None = None,
+    chunk_size: int | None = None,
+) -> CompactionStats:
+    """
+    Keeps every price of the last keep_days days and only the open, high, low
+    and close of the days before. Every chunk of days is compacted in its own
+    short transaction, an interrupted run is continued by the next one as the
+    compacted days have a count of at most COMPACTED_COUNT.
+    """
+    keep_days = keep_days or settings.PRICE_RETENTION_DAYS
+    chunk_size = chunk_size or settings.PRICE_COMPACTION_CHUNK
+    rollup_model: type[PriceRollup] = price_model.ROLLUP  # type: ignore
+    until = timezone.now().date() - timedelta(days=keep_days)
+
+    stats = CompactionStats()
+    free_bytes = get_free_bytes()
+    while True:
+        rollups = list(
+            rollup_model.objects.filter(
+                day__lt=until, count__gt=COMPACTED_COUNT
+            ).order_by("day")[:chunk_size]
+        )
+        if not rollups:
+            break
+        stats.rows += compact_chunk(price_model, rollups)
+        stats.days += len(rollups)
+    stats.bytes = max(get_free_bytes() - free_bytes, 0)
+    logger.info(
+        "compacted {} days of {}, deleted {} prices and freed {} bytes".format(
+            stats.days, price_model._meta.label, stats.rows, stats.bytes
+        )
+    )
+    return stats
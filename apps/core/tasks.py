@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.db import connection
+
+from apps.core.backup import Repository, backup
+
+
+def optimize_database():
+    """
+    Moves the write ahead log back into the database file, truncates it and
+    lets sqlite refresh the statistics of the query planner.
+    """
+    if connection.vendor != "sqlite":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        _busy, _log, checkpointed = cursor.fetchone()
+        cursor.execute("PRAGMA optimize")
+    # -1 if the database is not in wal mode, e.g. in memory
+    return max(checkpointed, 0)
+
+
+def backup_database():
+    if connection.vendor != "sqlite":
+        return None
+    stats = backup(settings.DATABASES["default"]["NAME"], settings.BACKUP_DIR)
+    Repository(settings.BACKUP_DIR).prune(settings.BACKUP_KEEP)
+    return stats.new_chunks
@@ -0,0 +1,67 @@
+import os
+import sqlite3
+import tempfile
+
+from django.test import SimpleTestCase
+
+from apps.core.backup import Repository, backup, restore
+
+
+class BackupTestCase(SimpleTestCase):
+    def setUp(self):
+        self.temporary = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.temporary.name, "db.sqlite3")
+        self.directory = os.path.join(self.temporary.name, "backups")
+        with sqlite3.connect(self.database) as conn:
+            conn.execute("PRAGMA journal_mode=wal")
+            conn.execute("create table price (id integer primary key, price real)")
+            conn.executemany(
+                "insert into price (price) values (?)", [(i,) for i in range(50000)]
+            )
+
+    def tearDown(self):
+        self.temporary.cleanup()
+
+    def execute(self, statement: str):
+        conn = sqlite3.connect(self.database, isolation_level=None)
+        conn.execute(statement)
+        conn.close()
+
+    def backup(self):
+        return backup(self.database, self.directory, chunk_pages=8)
+
+    def read(self, database: str) -> list:
+        with sqlite3.connect(database) as conn:
+            return conn.execute("select * from price order by id").fetchall()
+
+    def test_only_changed_chunks_are_stored(self):
+        first = self.backup()
+        assert first.new_chunks == first.chunks > 1
+        self.execute("insert into price (price) values (-1)")
+        second = self.backup()
+        assert 0 < second.new_chunks < second.chunks
+        assert second.written < first.written
+
+    def test_every_snapshot_can_be_restored(self):
+        first = self.backup()
+        rows = self.read(self.database)
+        self.execute("delete from price where id > 100")
+        self.backup()
+
+        output = os.path.join(self.temporary.name, "restored.sqlite3")
+        restore(self.directory, first.name, output)
+        assert self.read(output) == rows
+        restore(self.directory, "latest", output)
+        assert len(self.read(output)) == 100
+
+    def test_prune_keeps_the_chunks_of_the_remaining_snapshots(self):
+        self.backup()
+        self.execute("delete from price")
+        self.execute("vacuum")
+        last = self.backup()
+        repository = Repository(self.directory)
+        assert repository.prune(keep=1) > 0
+        assert repository.get_snapshots() == [last.name]
+        output = os.path.join(self.temporary.name, "restored.sqlite3")
+        restore(self.directory, "latest", output)
+        assert self.read(output) == []
@@ -0,0 +1,86 @@
+import time
+from datetime import timedelta
+
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from apps.core.cron import CronJob, Scheduler, get_jobs_to_be_run, load_jobs
+from apps.core.models import CronRun
+
+PATH = "apps.core.tests.test_cron"
+
+
+def quick_job():
+    return 3
+
+
+def slow_job():
+    time.sleep(2)
+
+
+def failing_job():
+    raise ValueError("broken")
+
+
+class SchedulerTestCase(TransactionTestCase):
+    def run_jobs(self, jobs: list[CronJob], **kwargs):
+        return Scheduler(jobs, log=lambda _: None, **kwargs).run()
+
+    def test_load_jobs_accepts_paths_and_dicts(self):
+        jobs = load_jobs([f"{PATH}.quick_job", {"path": f"{PATH}.slow_job"}])
+        assert [job.path for job in jobs] == [f"{PATH}.quick_job", f"{PATH}.slow_job"]
+
+    def test_run_is_stored_with_items(self):
+        self.run_jobs([CronJob(path=f"{PATH}.quick_job")])
+        run = CronRun.objects.get()
+        assert run.status == "SUCCESS"
+        assert run.items == 3
+        assert run.duration is not None
+
+    def test_failure_is_stored(self):
+        self.run_jobs([CronJob(path=f"{PATH}.failing_job")])
+        run = CronRun.objects.get()
+        assert run.status == "FAILURE"
+        assert run.error == "broken"
+
+    def test_timeout_does_not_block_other_jobs(self):
+        jobs = [
+            CronJob(path=f"{PATH}.slow_job", timeout=0, priority=1),
+            CronJob(path=f"{PATH}.quick_job"),
+        ]
+        self.run_jobs(jobs, workers=2)
+        assert CronRun.objects.get(job=f"{PATH}.slow_job").status == "TIMEOUT"
+        assert CronRun.objects.get(job=f"{PATH}.quick_job").status == "SUCCESS"
+
+    def test_timed_out_jobs_count_against_the_workers(self):
+        jobs = [
+            CronJob(path=f"{PATH}.slow_job", timeout=0, priority=1),
+            CronJob(path=f"{PATH}.quick_job"),
+        ]
+        self.run_jobs(jobs, workers=1)
+        assert CronRun.objects.get(job=f"{PATH}.slow_job").status == "TIMEOUT"
+        # the quick job is left to the next run instead of running next to the
+        # timed out job
+        assert not CronRun.objects.filter(job=f"{PATH}.quick_job").exists()
+
+    def test_jobs_are_sorted_by_priority(self):
+        low = CronJob(path=f"{PATH}.quick_job", priority=0)
+        high = CronJob(path=f"{PATH}.slow_job", priority=5)
+        assert get_jobs_to_be_run([low, high]) == [high, low]
+
+    def test_running_job_is_not_started_again(self):
+        job = CronJob(path=f"{PATH}.quick_job")
+        CronRun.objects.create(job=job.path, started_at=timezone.now())
+        assert get_jobs_to_be_run([job]) == []
+
+    def test_stale_running_job_is_started_again(self):
+        job = CronJob(path=f"{PATH}.quick_job", timeout=60)
+        started_at = timezone.now() - timedelta(seconds=120)
+        CronRun.objects.create(job=job.path, started_at=started_at)
+        assert get_jobs_to_be_run([job]) == [job]
+
+    def test_interval_is_respected(self):
+        job = CronJob(path=f"{PATH}.quick_job", interval=60 * 60)
+        self.run_jobs([job])
+        self.run_jobs([job])
+        assert CronRun.objects.filter(job=job.path).count() == 1
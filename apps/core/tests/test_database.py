@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.db import connection
+from django.test import TransactionTestCase
+
+from apps.core.tasks import optimize_database
+
+
+class SqliteProfileTestCase(TransactionTestCase):
+    # a checkpoint can not run inside of the transaction of a TestCase
+    def get_pragma(self, name: str):
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA {}".format(name))
+            return cursor.fetchone()[0]
+
+    def test_pragmas_are_applied_to_the_connection(self):
+        assert (
+            self.get_pragma("busy_timeout") == settings.SQLITE_PRAGMAS["busy_timeout"]
+        )
+        assert self.get_pragma("cache_size") == settings.SQLITE_PRAGMAS["cache_size"]
+        # 2 is memory
+        assert self.get_pragma("temp_store") == 2
+
+    def test_optimize_database(self):
+        assert optimize_database() == 0
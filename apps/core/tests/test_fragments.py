@@ -0,0 +1,71 @@
+import re
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from apps.stocks.models import Depot, Price
+from apps.users.models import StandardUser as User
+
+
+class FragmentCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user: User = User.objects.create_user(username="dummy")  # type: ignore
+        self.user.set_password("test")
+        self.user.save()
+        self.depot = self.user.create_random_stocks_data()
+        self.client = Client()
+        self.client.login(username="dummy", password="test")
+
+    def get(self, tab: str) -> tuple[str, int]:
+        url = reverse_lazy("stocks:index")
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, {"tab": tab})
+        self.assertEqual(response.status_code, 200)
+        # the csrf token is masked differently in every response
+        content = re.sub(r'value="\w{64}"', "", response.content.decode())
+        return content, len(context.captured_queries)
+
+    def test_unchanged_depot_is_rendered_from_the_cache(self):
+        content, queries = self.get("stats")
+        with patch.object(Depot, "get_stats") as get_stats:
+            cached_content, cached_queries = self.get("stats")
+        get_stats.assert_not_called()
+        assert cached_content == content
+        assert cached_queries <= queries
+
+    def test_save_invalidates_the_fragments(self):
+        self.get("banks")
+        bank = self.depot.banks.first()
+        bank.name = "Renamed Bank"
+        bank.save()
+        content, _ = self.get("banks")
+        assert "Renamed Bank" in content
+
+    def test_old_prices_invalidate_the_fragments(self):
+        stock = self.depot.stocks.first()
+        Price.objects.create(isin=stock.isin, date=timezone.now(), price=10)
+        stock.reset()
+        content, _ = self.get("stocks")
+        assert "OLD" not in content
+        # a failed fetch saves nothing, the price only gets older
+        old = timezone.now() - timedelta(days=2)
+        Price.objects.filter(pk=stock.price_id).update(date=old)
+        content, _ = self.get("stocks")
+        assert "OLD" in content
+
+    def test_show_archived_only_selects_one_of_two_fragments(self):
+        self.user.create_random_banking_data()
+        url = reverse_lazy("banking:index")
+        with patch("config.jinja2.get_or_set_fragment") as get_or_set_fragment:
+            get_or_set_fragment.side_effect = lambda obj, name, render: render()
+            for value in ["", "1", "yes", "x" * 50]:
+                self.client.get(url, {"tab": "accounts", "show_archived": value})
+            names = {c.args[1] for c in get_or_set_fragment.call_args_list}
+        assert names == {"accounts:active", "accounts:archived"}
@@ -0,0 +1,75 @@
+import os
+import tempfile
+
+from django.test import TestCase
+
+from apps.core.portfolio import (
+    PORTFOLIO_MODELS,
+    PRICE_MODELS,
+    export_portfolio,
+    get_queryset,
+    import_portfolio,
+)
+from apps.users.models import StandardUser as User
+
+
+class PortfolioTestCase(TestCase):
+    def setUp(self):
+        self.temporary = tempfile.TemporaryDirectory()
+        self.user: User = User.objects.create_user(username="dummy")  # type: ignore
+        self.banking = self.user.create_random_banking_data()
+        self.alternative = self.user.create_random_alternative_data()
+        self.crypto = self.user.create_random_crypto_data()
+        # the stats of every account and asset, like after the first visit
+        self.crypto.reset_all()
+        self.stocks = self.user.create_random_stocks_data()
+        self.other: User = User.objects.create_user(username="other")  # type: ignore
+
+    def tearDown(self):
+        self.temporary.cleanup()
+
+    def test_export_is_written_in_chunks(self):
+        stats = export_portfolio(self.user, self.temporary.name, chunk_size=5)
+        changes = get_queryset("banking.Change", self.user).count()
+        assert stats.rows["banking.Change"] == changes > 5
+        files = os.listdir(self.temporary.name)
+        assert len([f for f in files if f.startswith("banking.Change.")]) == (
+            (changes + 4) // 5
+        )
+
+    def test_import_restores_the_portfolio(self):
+        export_portfolio(self.user, self.temporary.name, chunk_size=5)
+        prices = {
+            label: get_queryset(label, self.user).count() for label in PRICE_MODELS
+        }
+        stats = import_portfolio(self.other, self.temporary.name)
+
+        for label in PORTFOLIO_MODELS:
+            count = get_queryset(label, self.user).count()
+            assert get_queryset(label, self.other).count() == count, label
+            assert stats.rows[label] == count
+        # the prices are shared and already exist
+        for label, count in prices.items():
+            assert get_queryset(label, self.other).count() == count
+
+        banking = self.other.get_active_banking_depot()
+        assert banking.get_balance() == self.banking.get_balance()
+        alternative = self.other.get_active_alternative_depot()
+        assert alternative.value == self.alternative.value
+        crypto = self.other.get_active_crypto_depot()
+        self.crypto.refresh_from_db()
+        assert crypto.value == self.crypto.value
+        stocks = self.other.get_active_stocks_depot()
+        self.stocks.refresh_from_db()
+        assert stocks.value == self.stocks.value
+        for stock in self.stocks.stocks.all():
+            imported = stocks.stocks.get(isin=stock.isin)
+            assert imported.price_id == stock.price_id
+            assert imported.top_price == stock.top_price
+
+    def test_imported_depots_are_inactive_next_to_active_ones(self):
+        export_portfolio(self.user, self.temporary.name)
+        import_portfolio(self.user, self.temporary.name)
+        assert self.user.banking_depots.count() == 2
+        assert self.user.banking_depots.filter(is_active=True).count() == 1
+        assert self.user.get_active_banking_depot() == self.banking
@@ -0,0 +1,82 @@
+from typing import Callable
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.banking.models import Change, Depot
+from apps.stocks.models import Stock, get_latest_prices
+from apps.users.models import StandardUser as User
+
+
+def get_plans(table: str, run: Callable) -> list[str]:
+    """
+    Runs the function and returns the query plan details of every captured
+    query that reads from the table.
+    """
+    with CaptureQueriesContext(connection) as context:
+        run()
+    plans: list[str] = []
+    for query in context.captured_queries:
+        sql = query["sql"]
+        if not sql.lstrip().lower().startswith("select") or table not in sql:
+            continue
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN {}".format(sql))
+            details = [row[3] for row in cursor.fetchall()]
+        plans += [detail for detail in details if " {} ".format(table) in detail]
+    return plans
+
+
+class QueryPlanTestCase(TestCase):
+    def setUp(self):
+        self.user: User = User.objects.create_user(username="dummy")  # type: ignore
+        self.user.create_random_stocks_data()
+        self.user.create_random_banking_data()
+        self.stock = Stock.objects.filter(depot__user=self.user).first()
+
+    def assert_index_seek(self, table: str, run: Callable, seek: str):
+        plans = get_plans(table, run)
+        assert plans, "no query read from {}".format(table)
+        # no query may scan the table, primary key lookups are fine
+        for plan in plans:
+            assert plan.startswith("SEARCH {} USING".format(table)), plan
+        assert any("INDEX" in plan and seek in plan for plan in plans), plans
+
+    def test_price_df(self):
+        self.assert_index_seek(
+            "stocks_pricerollup", self.stock.get_price_df, "(isin=?)"
+        )
+
+    def test_amount_df(self):
+        self.assert_index_seek("stocks_trade", self.stock.get_amount_df, "(stock_id=?)")
+
+    def test_latest_price(self):
+        self.assert_index_seek(
+            "stocks_price", lambda: get_latest_prices([self.stock.isin]), "(isin=?)"
+        )
+
+    def test_change_balance(self):
+        change = Change.objects.filter(account__depot__user=self.user).last()
+        change.balance = None
+        self.assert_index_seek(
+            "banking_change", change.get_balance, "(account_id=? AND date<?)"
+        )
+
+    def test_flows_trades_and_dividends_by_bank_and_date(self):
+        bank = self.stock.depot.banks.first()
+        for table, queryset in [
+            ("stocks_flow", bank.flows.all()),
+            ("stocks_trade", bank.trades.all()),
+            ("stocks_dividend", bank.dividends.all()),
+            ("stocks_dividend", self.stock.dividends.all()),
+        ]:
+            self.assert_index_seek(table, lambda: list(queryset), "_id=?)")
+
+    def test_active_accounts_and_categories(self):
+        depot = Depot.objects.get(user=self.user)
+        for table, queryset in [
+            ("banking_account", depot.accounts.filter(is_archived=False)),
+            ("banking_category", depot.categories.filter(is_archived=False)),
+        ]:
+            self.assert_index_seek(table, lambda: list(queryset), "_active_idx")
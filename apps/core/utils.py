@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import date, timedelta
 from typing import Union
 
 import numpy as np
@@ -8,6 +8,13 @@ from django.db import connection
 pd.set_option("future.no_silent_downcasting", True)
 
 
+def parse_date(value: str | None) -> date | None:
+    # raises a value error if the value is not an iso date
+    if value is None:
+        return None
+    return date.fromisoformat(value)
+
+
 ###
 # DataFrame Utils
 ###
@@ -126,6 +133,51 @@ def remove_time_of_date_index_in_df(df) -> pd.DataFrame:
     return df
 
 
+def get_lttb_indices(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Largest triangle three buckets: returns the indices of the points that
+    keep the visual shape of the series. The first and the last point are
+    always kept, from every bucket in between the point that forms the largest
+    triangle with the previously kept point and the average of the next bucket.
+    """
+    length = len(y)
+    if points >= length or points < 3:
+        return np.arange(length)
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    # points - 2 buckets between the first and the last point
+    edges = np.linspace(1, length - 1, points - 1).astype(np.int64)
+    indices = np.empty(points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = length - 1
+    a = 0
+    for i in range(points - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end : edges[i + 2]].mean()
+            next_y = y[end : edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        # twice the area of the triangles, the factor does not matter
+        areas = np.abs(
+            (x[a] - next_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    return indices
+
+
+def downsample_df(df: pd.DataFrame, points: int, column: str) -> pd.DataFrame:
+    # the indices are chosen by one column and used for all, so the
+    # columns stay aligned on the same dates
+    if len(df) <= points:
+        return df
+    x = df.index.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    y = df.loc[:, column].to_numpy()
+    return df.iloc[get_lttb_indices(x, y, points)]
+
+
 ###
 # Python Utils
 ###
@@ -0,0 +1,15 @@
+from django.contrib import admin
+
+from apps.core.admin import PriceFetcherAdminMixin
+from apps.crypto.models import FetchAttempt, PriceFetcher
+
+
+@admin.register(PriceFetcher)
+class PriceFetcherAdmin(PriceFetcherAdminMixin, admin.ModelAdmin):
+    pass
+
+
+@admin.register(FetchAttempt)
+class FetchAttemptAdmin(admin.ModelAdmin):
+    list_display = ("fetcher", "status", "created_at", "duration", "bytes")
+    list_filter = ("status",)
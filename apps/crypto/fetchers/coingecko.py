@@ -1,10 +1,11 @@
 import json
+import time
 from typing import Mapping
 
 import requests
 from pydantic import BaseModel
 
-from apps.core.fetchers.base import Fetcher
+from apps.core.fetchers.base import Fetcher, FetchStats
 
 
 class CoinGeckoFetcherInput(BaseModel):
@@ -12,18 +13,27 @@ class CoinGeckoFetcherInput(BaseModel):
 
 
 class CoinGeckoFetcher(Fetcher):
-    def __fetch(self, ids: list[str]) -> dict[str, float]:
+    def __fetch(self, ids: list[str]) -> tuple[dict[str, float], FetchStats]:
         joined_ids = ",".join(ids)
         url = f"https://api.coingecko.com/api/v3/simple/price?ids={joined_ids}&vs_currencies=eur"
+        start = time.perf_counter()
         response = requests.get(url)
+        duration = time.perf_counter() - start
+        start = time.perf_counter()
         prices = json.loads(response.content.decode())
         results = {}
         for price in prices:
             results[price] = float(prices[price]["eur"])
-        return results
+        # the request is shared by all ids, every id gets its share of it
+        stats = FetchStats(
+            duration=duration,
+            parse_duration=(time.perf_counter() - start) / max(len(ids), 1),
+            bytes=len(response.content) // max(len(ids), 1),
+        )
+        return results, stats
 
     def fetch_single(self, data: CoinGeckoFetcherInput) -> tuple[bool, str | float]:
-        results = self.__fetch([data.coingecko_id])
+        results, self.stats[""] = self.__fetch([data.coingecko_id])
         if data.coingecko_id not in results:
             return False, f"Could not find a price for {data.coingecko_id}."
         return True, results[data.coingecko_id]
@@ -35,11 +45,12 @@ class CoinGeckoFetcher(Fetcher):
         for _, input in data.items():
             ids.append(input.coingecko_id)
 
-        response = self.__fetch(ids)
+        response, stats = self.__fetch(ids)
 
         results: Mapping[str, tuple[bool, str | float]] = {}
 
         for fetcher, input in data.items():
+            self.stats[fetcher] = stats
             if input.coingecko_id not in response:
                 results[fetcher] = (
                     False,
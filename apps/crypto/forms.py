@@ -10,6 +10,31 @@ from apps.core.fetchers.website import WebsiteFetcherInput
 from apps.crypto.fetchers.coingecko import CoinGeckoFetcherInput
 
 
+def check_later_amounts(changes, date, original=(), original_date=None, **exclude):
+    """
+    Checks that the amounts after the date do not become negative with the
+    changes of the instance. Only a change that lowers an amount or an edit,
+    which removes the old changes of the instance, can do that. The original
+    account and asset pairs of an edited instance lose its old changes, the
+    ones that the edit moves away are checked from the original date on.
+    """
+    checks = [(account, asset, change, date) for account, asset, change in changes]
+    covered = {(account.pk, asset.pk) for account, asset, _ in changes}
+    for account, asset in original:
+        if (account.pk, asset.pk) not in covered:
+            checks.append((account, asset, 0, original_date))
+            covered.add((account.pk, asset.pk))
+    for account, asset, change, since in checks:
+        if change >= 0 and not any(exclude.values()):
+            continue
+        minimum = account.get_minimum_asset_from_date(asset, since, **exclude)
+        if minimum is not None and minimum + change < 0:
+            raise forms.ValidationError(
+                "The amount of {} on {} would be negative at a later date. "
+                "There is {} missing.".format(asset, account, -(minimum + change))
+            )
+
+
 # depot
 class DepotForm(forms.ModelForm):
     class Meta:
@@ -124,6 +149,7 @@ class TradeForm(forms.ModelForm):
         if (
             "account" not in self.cleaned_data
             or "sell_asset" not in self.cleaned_data
+            or "buy_asset" not in self.cleaned_data
             or "sell_amount" not in self.cleaned_data
             or "buy_amount" not in self.cleaned_data
             or "date" not in self.cleaned_data
@@ -133,6 +159,7 @@ class TradeForm(forms.ModelForm):
         sell_asset = self.cleaned_data["sell_asset"]
         sell_amount = self.cleaned_data["sell_amount"]
         buy_amount = self.cleaned_data["buy_amount"]
+        buy_asset = self.cleaned_data["buy_asset"]
         date = self.cleaned_data["date"]
         # check that there is not already a transaction or
         # flow on this exact date and account
@@ -151,14 +178,32 @@ class TradeForm(forms.ModelForm):
         if sell_amount < 0 or buy_amount < 0:
             raise forms.ValidationError("Sell and buy amount must be positive.")
         # check that enough asset is available of the asset that is sold
-        # TODO exclude the own instance from the available calculation
-        available_amount = account.get_amount_asset_before_date(sell_asset, date)
+        exclude = [self.instance.pk] if self.instance.pk else None
+        available_amount = account.get_amount_asset_before_date(
+            sell_asset, date, exclude_trades=exclude
+        )
         if available_amount < sell_amount:
             message = (
                 "There is not enough asset on this account to support this trade. "
                 "There is {} available.".format(available_amount)
             )
             raise forms.ValidationError(message)
+        # check that the trades, transactions and flows after this trade
+        # still have enough asset available
+        changes = [
+            (account, sell_asset, -sell_amount),
+            (account, buy_asset, buy_amount),
+        ]
+        # the instance still has the original values, they are set after clean
+        original = []
+        if self.instance.pk:
+            original = [
+                (self.instance.account, self.instance.sell_asset),
+                (self.instance.account, self.instance.buy_asset),
+            ]
+        check_later_amounts(
+            changes, date, original, self.instance.date, exclude_trades=exclude
+        )
 
 
 # transaction
@@ -225,6 +270,20 @@ class TransactionForm(forms.ModelForm):
                 "There is {} available".format(available_amount)
             )
             raise forms.ValidationError(message)
+        changes = [
+            (from_account, asset, -amount - fees),
+            (to_account, asset, amount),
+        ]
+        # the instance still has the original values, they are set after clean
+        original = []
+        if self.instance.pk:
+            original = [
+                (self.instance.from_account, self.instance.asset),
+                (self.instance.to_account, self.instance.asset),
+            ]
+        check_later_amounts(
+            changes, date, original, self.instance.date, exclude_transactions=exclude
+        )
 
 
 # flow
@@ -269,11 +328,22 @@ class FlowForm(forms.ModelForm):
                 "There is already a trade at this date and account."
             )
         # check that enough asset is available if asset is withdrawn
-        # TODO exclude the own instance from the available calculation
-        if flow < 0 and account.get_amount_asset_before_date(asset, date) < abs(flow):
+        exclude = [self.instance.pk] if self.instance.pk else None
+        if flow < 0 and account.get_amount_asset_before_date(
+            asset, date, exclude_flows=exclude
+        ) < abs(flow):
             raise forms.ValidationError(
                 "There is not enough asset on this account to support this flow."
             )
+        # the instance still has the original values, they are set after clean
+        original = [(self.instance.account, asset)] if self.instance.pk else []
+        check_later_amounts(
+            [(account, asset, flow)],
+            date,
+            original,
+            self.instance.date,
+            exclude_flows=exclude,
+        )
 
 
 ###
@@ -316,6 +386,11 @@ class PriceFetcherForm(forms.ModelForm):
             raise forms.ValidationError("This type is not supported.")
         return type
 
+    def save(self, commit=True):
+        # the fetcher was changed, so give it a fresh start
+        self.instance.close_circuit()
+        return super().save(commit)
+
 
 # price
 class PriceEditForm(forms.ModelForm):
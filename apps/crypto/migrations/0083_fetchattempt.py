@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:24
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crypto", "0082_asset_bucket"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FetchAttempt",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("SUCCESS", "Success"), ("FAILURE", "Failure")],
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("duration", models.FloatField()),
+                ("parse_duration", models.FloatField(default=0)),
+                ("bytes", models.PositiveIntegerField(default=0)),
+                (
+                    "fetcher",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attempts",
+                        to="crypto.pricefetcher",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Fetch Attempt",
+                "verbose_name_plural": "Fetch Attempts",
+                "ordering": ["-created_at"],
+                "abstract": False,
+                "indexes": [
+                    models.Index(
+                        fields=["fetcher", "-created_at"],
+                        name="crypto_fetc_fetcher_b74f72_idx",
+                    )
+                ],
+            },
+        ),
+    ]
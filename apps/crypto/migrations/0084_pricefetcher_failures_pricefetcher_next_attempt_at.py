@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crypto", "0083_fetchattempt"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pricefetcher",
+            name="failures",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="pricefetcher",
+            name="next_attempt_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
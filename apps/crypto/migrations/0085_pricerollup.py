@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:17
+
+from django.db import migrations, models
+
+FILL = """
+    insert into {table} ({key}, day, open, high, low, close,
+        first_date, last_date, count)
+    select distinct
+        {key},
+        date(date),
+        first_value(price) over w,
+        max(price) over w,
+        min(price) over w,
+        last_value(price) over w,
+        min(date) over w,
+        max(date) over w,
+        count(*) over w
+    from {prices}
+    where {key} is not null
+    window w as (
+        partition by {key}, date(date) order by date, id
+        rows between unbounded preceding and unbounded following
+    )
+"""
+
+
+def fill_rollups(apps, schema_editor):
+    schema_editor.execute(
+        FILL.format(table="crypto_pricerollup", key="symbol", prices="crypto_price")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crypto", "0084_pricefetcher_failures_pricefetcher_next_attempt_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PriceRollup",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("open", models.DecimalField(decimal_places=2, max_digits=20)),
+                ("high", models.DecimalField(decimal_places=2, max_digits=20)),
+                ("low", models.DecimalField(decimal_places=2, max_digits=20)),
+                ("close", models.DecimalField(decimal_places=2, max_digits=20)),
+                ("first_date", models.DateTimeField()),
+                ("last_date", models.DateTimeField()),
+                ("count", models.IntegerField(default=0)),
+                ("symbol", models.CharField(max_length=5)),
+            ],
+            options={
+                "ordering": ["-day"],
+                "abstract": False,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("symbol", "day"), name="crypto_pricerollup_unique"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,88 @@
+import zoneinfo
+
+from django.conf import settings
+from django.db import migrations, models
+
+MODELS = ["Price", "Flow"]
+
+
+def fill_local_dates(apps, schema_editor):
+    time_zone = zoneinfo.ZoneInfo(settings.TIME_ZONE)
+    for name in MODELS:
+        model = apps.get_model("crypto", name)
+        objs = list(model.objects.only("date"))
+        for obj in objs:
+            obj.local_date = obj.date.astimezone(time_zone).date()
+        model.objects.bulk_update(objs, ["local_date"], batch_size=1000)
+
+
+REFILL = """
+    insert into crypto_pricerollup (symbol, day, open, high, low, close,
+        first_date, last_date, count)
+    select distinct
+        symbol,
+        local_date,
+        first_value(price) over w,
+        max(price) over w,
+        min(price) over w,
+        last_value(price) over w,
+        min(date) over w,
+        max(date) over w,
+        count(*) over w
+    from crypto_price
+    where symbol is not null
+    window w as (
+        partition by symbol, local_date order by date, id
+        rows between unbounded preceding and unbounded following
+    )
+"""
+
+
+def refill_rollups(apps, schema_editor):
+    # the rollups were grouped by the utc day before
+    schema_editor.execute("delete from crypto_pricerollup")
+    schema_editor.execute(REFILL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crypto", "0085_pricerollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="price",
+            name="local_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="flow",
+            name="local_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(fill_local_dates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="price",
+            name="local_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name="flow",
+            name="local_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="flow",
+            index=models.Index(
+                fields=["account", "local_date"], name="crypto_flow_account_ee9ab0_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="price",
+            index=models.Index(
+                fields=["symbol", "local_date"], name="crypto_pric_symbol_de31f4_idx"
+            ),
+        ),
+        migrations.RunPython(refill_rollups, migrations.RunPython.noop),
+    ]
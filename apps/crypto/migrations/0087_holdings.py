@@ -0,0 +1,133 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_holdings(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("""
+            insert into crypto_holding (account_id, asset_id, date, change, total,
+                minimum, trade_id, transaction_id, flow_id)
+            select account_id, buy_asset_id, date, buy_amount, 0, 0, id, null, null
+            from crypto_trade
+            union all
+            select account_id, sell_asset_id, date, -sell_amount, 0, 0, id, null, null
+            from crypto_trade
+            union all
+            select to_account_id, asset_id, date, amount, 0, 0, null, id, null
+            from crypto_transaction
+            union all
+            select from_account_id, asset_id, date, -amount - fees, 0, 0, null, id, null
+            from crypto_transaction
+            union all
+            select account_id, asset_id, date, flow, 0, 0, null, null, id
+            from crypto_flow
+            """)
+        cursor.execute("""
+            update crypto_holding as h
+            set total = w.total, minimum = w.minimum
+            from (
+                select
+                    id,
+                    total,
+                    min(total) over (
+                        partition by account_id, asset_id order by date desc, id desc
+                    ) as minimum
+                from (
+                    select
+                        id,
+                        account_id,
+                        asset_id,
+                        date,
+                        round(
+                            sum(change) over (
+                                partition by account_id, asset_id order by date, id
+                            ),
+                            8
+                        ) as total
+                    from crypto_holding
+                )
+            ) as w
+            where h.id = w.id
+            """)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crypto", "0086_local_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Holding",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateTimeField()),
+                ("change", models.DecimalField(decimal_places=8, max_digits=20)),
+                ("total", models.DecimalField(decimal_places=8, max_digits=20)),
+                ("minimum", models.DecimalField(decimal_places=8, max_digits=20)),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="holdings",
+                        to="crypto.account",
+                    ),
+                ),
+                (
+                    "asset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="holdings",
+                        to="crypto.asset",
+                    ),
+                ),
+                (
+                    "flow",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="holdings",
+                        to="crypto.flow",
+                    ),
+                ),
+                (
+                    "trade",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="holdings",
+                        to="crypto.trade",
+                    ),
+                ),
+                (
+                    "transaction",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="holdings",
+                        to="crypto.transaction",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["account", "asset", "date"],
+                        name="crypto_hold_account_2ba7f1_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_holdings, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,13 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import TYPE_CHECKING, Union
+from functools import reduce
+from operator import or_
+from typing import TYPE_CHECKING, Iterable, Union
 
 import pandas as pd
-from django.db import models
-from django.db.models import Max, Sum
+from django.db import connection, models, transaction
+from django.db.models import F, Max, Min, Q, Sum, Window
+from django.db.models.functions import RowNumber
 from django.db.models.query import QuerySet
 from django.utils import timezone
 
@@ -14,7 +17,12 @@ from apps.core.fetchers.base import Fetcher
 from apps.core.fetchers.selenium import SeleniumFetcher, SeleniumFetcherInput
 from apps.core.fetchers.website import WebsiteFetcher, WebsiteFetcherInput
 from apps.core.models import Account as CoreAccount
+from apps.core.models import CircuitBreakerMixin, DataVersionMixin
 from apps.core.models import Depot as CoreDepot
+from apps.core.models import FetchAttempt as CoreFetchAttempt
+from apps.core.models import FetcherStatsMixin, LocalDateMixin, LocalDateQuerySet
+from apps.core.models import PriceRollup as CorePriceRollup
+from apps.core.models import RolledUpPriceMixin
 from apps.core.utils import get_df_from_database
 from apps.crypto.fetchers.coingecko import CoinGeckoFetcher, CoinGeckoFetcherInput
 from apps.overview.models import Bucket
@@ -22,6 +30,15 @@ from apps.users.models import StandardUser
 
 
 class Depot(CoreDepot):
+    DATA_VERSION_FIELDS = (
+        "name",
+        "is_active",
+        "value",
+        "current_return",
+        "invested_capital",
+        "time_weighted_return",
+        "internal_rate_of_return",
+    )
     user = models.ForeignKey(
         StandardUser,
         editable=False,
@@ -48,15 +65,27 @@ class Depot(CoreDepot):
     def get_total_value(self) -> float:
         return float(self.value or 0)
 
+    def count_old_prices(self) -> int:
+        # a price turns old without a change of the data, the count is part of
+        # the keys of the fragments that show the prices
+        since = timezone.now() - timedelta(days=1)
+        return (
+            PriceRollup.objects.filter(symbol__in=self.assets.values("symbol"))
+            .values("symbol")
+            .annotate(last_date=Max("last_date"))
+            .filter(last_date__lt=since)
+            .count()
+        )
+
     def __get_flow_df(self):
         statement = """
             select 
-                date(date) as date,
+                local_date as date,
                 sum(flow) as flow
             from crypto_flow f
             join crypto_account a on f.account_id=a.id
             where a.depot_id = {}
-            group by date(date)
+            group by local_date
         """.format(
             self.pk
         )
@@ -131,15 +160,89 @@ class Depot(CoreDepot):
         df = rc.get_current_return_df(flow_df, value_df)
         self.current_return = rc.get_current_return(df)
 
+    def get_amounts(self) -> dict[tuple[int, int], float]:
+        # the amount of every asset in every account of this depot from all
+        # trades, transactions and flows in one pass
+        statement = """
+            with accounts as (
+                select id from crypto_account where depot_id = {}
+            )
+            select account_id, asset_id, sum(amount)
+            from (
+                select account_id, buy_asset_id as asset_id, buy_amount as amount
+                from crypto_trade
+                where account_id in accounts
+                union all
+                select account_id, sell_asset_id, -sell_amount
+                from crypto_trade
+                where account_id in accounts
+                union all
+                select to_account_id, asset_id, amount
+                from crypto_transaction
+                where to_account_id in accounts
+                union all
+                select from_account_id, asset_id, -amount - fees
+                from crypto_transaction
+                where from_account_id in accounts
+                union all
+                select account_id, asset_id, flow
+                from crypto_flow
+                where account_id in accounts
+            )
+            group by account_id, asset_id
+        """.format(
+            self.pk
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(statement)
+            rows = cursor.fetchall()
+        return {(account, asset): amount for account, asset, amount in rows}
+
     def reset_all(self):
-        for stats in list(
-            AccountAssetStats.objects.filter(account__in=self.accounts.all())
-        ):
-            stats.reset()
-        for asset in list(Asset.objects.filter(depot=self)):
-            asset.reset()
-        for account in list(Account.objects.filter(depot=self)):
-            account.reset()
+        # the amounts of all stats, assets and accounts come from a single
+        # query and every model is written back with one bulk update
+        accounts = list(self.accounts.all())
+        assets = list(self.assets.all())
+        prefetch_latest_prices(assets)
+        top_prices = get_top_prices([asset.symbol for asset in assets])
+        amounts = self.get_amounts()
+
+        stats = {
+            (s.account_id, s.asset_id): s  # type: ignore
+            for s in AccountAssetStats.objects.filter(
+                account__in=accounts, asset__in=assets
+            )
+        }
+        missing = [
+            AccountAssetStats(account=account, asset=asset)
+            for account in accounts
+            for asset in assets
+            if (account.pk, asset.pk) not in stats
+        ]
+        for s in AccountAssetStats.objects.bulk_create(missing):
+            stats[(s.account_id, s.asset_id)] = s  # type: ignore
+
+        for asset in assets:
+            asset.amount = sum(
+                amounts.get((account.pk, asset.pk), 0) for account in accounts
+            )
+            asset.calculate_price()
+            asset.calculate_value()
+            asset.set_top_price(top_prices.get(asset.symbol))
+        assets_by_pk = {asset.pk: asset for asset in assets}
+        values: dict[int, float] = {account.pk: 0 for account in accounts}
+        for (account_id, asset_id), s in stats.items():
+            s.amount = Decimal(str(amounts.get((account_id, asset_id), 0)))
+            s.asset = assets_by_pk[asset_id]
+            s.calculate_value()
+            if s.value is not None:
+                values[account_id] += s.value
+        for account in accounts:
+            account.value = values[account.pk]
+
+        AccountAssetStats.objects.bulk_update(stats.values(), ["amount", "value"])
+        Asset.objects.bulk_update(assets, ["amount", "price", "value", "top_price"])
+        Account.objects.bulk_update(accounts, ["value"])
         self.reset()
 
 
@@ -182,13 +285,23 @@ class Account(CoreAccount):
         exclude_trades=None,
         exclude_flows=None,
     ):
-        stats = self.get_asset_stats(asset)
-        return stats.get_amount_before_date(
-            date,
-            exclude_trades=exclude_trades,
-            exclude_flows=exclude_flows,
-            exclude_transactions=exclude_transactions,
+        exclude = Holding.get_exclude_filter(
+            exclude_trades, exclude_transactions, exclude_flows
+        )
+        return Holding.get_amount_before(self, asset, date, exclude)
+
+    def get_minimum_asset_from_date(
+        self,
+        asset,
+        date,
+        exclude_transactions=None,
+        exclude_trades=None,
+        exclude_flows=None,
+    ):
+        exclude = Holding.get_exclude_filter(
+            exclude_trades, exclude_transactions, exclude_flows
         )
+        return Holding.get_minimum_from(self, asset, date, exclude)
 
     # setters
     def reset(self):
@@ -212,7 +325,7 @@ class Account(CoreAccount):
                 self.value += stats.value
 
 
-class Asset(models.Model):
+class Asset(DataVersionMixin, models.Model):
     symbol = models.CharField(max_length=5)
     depot = models.ForeignKey(Depot, related_name="assets", on_delete=models.CASCADE)
     # query optimization
@@ -258,15 +371,12 @@ class Asset(models.Model):
         return utils.get_df_from_database(statement, columns)
 
     def get_price_df(self):
-        # this statement retreives all prices and groups them by date.
+        # the close of every day from the rollup of the prices.
         statement = """
-            select
-                date(date) as date,
-                max(price) as price
-            from crypto_price
+            select day as date, close as price
+            from crypto_pricerollup
             where symbol='{}'
-            group by date(date)
-            order by date asc
+            order by day asc
         """.format(
             self.symbol
         )
@@ -355,11 +465,13 @@ class Asset(models.Model):
             "Top": self.get_top_price_display(),
         }
 
-    def __get_price(self) -> Union["Price", None]:
-        return Price.objects.filter(symbol=self.symbol).order_by("date").last()
+    def get_latest_price(self) -> Union["Price", None]:
+        if not hasattr(self, "_latest_price"):
+            self._latest_price = get_latest_prices([self.symbol]).get(self.symbol)
+        return self._latest_price
 
     def get_price_display(self) -> str:
-        price = self.__get_price()
+        price = self.get_latest_price()
         if price is None:
             return "404"
         if price.is_old:
@@ -436,17 +548,16 @@ class Asset(models.Model):
         )
 
     def calculate_price(self):
-        price = self.__get_price()
+        price = self.get_latest_price()
         if price is not None:
             self.price = float(price.price) or 0
         else:
             self.price = 0
 
     def calculate_top_price(self):
-        date = timezone.now() - timedelta(days=365 * 2)
-        top_price = Price.objects.filter(symbol=self.symbol, date__gt=date).aggregate(
-            Max("price")
-        )["price__max"]
+        self.set_top_price(get_top_prices([self.symbol]).get(self.symbol))
+
+    def set_top_price(self, top_price: Decimal | None):
         if self.price is None:
             self.top_price = "404"
         elif top_price is None:
@@ -488,58 +599,10 @@ class AccountAssetStats(models.Model):
     def get_amount_before_date(
         self, date, exclude_transactions=None, exclude_trades=None, exclude_flows=None
     ):
-        if exclude_trades is None:
-            exclude_trades = []
-        if exclude_transactions is None:
-            exclude_transactions = []
-        if exclude_flows is None:
-            exclude_flows = []
-
-        trade_buy_amount = (
-            Trade.objects.filter(
-                buy_asset=self.asset, account=self.account, date__lt=date
-            )
-            .exclude(pk__in=exclude_trades)
-            .aggregate(Sum("buy_amount"))["buy_amount__sum"]
-            or 0
+        exclude = Holding.get_exclude_filter(
+            exclude_trades, exclude_transactions, exclude_flows
         )
-        trade_sell_amount = (
-            Trade.objects.filter(
-                sell_asset=self.asset, account=self.account, date__lt=date
-            )
-            .exclude(pk__in=exclude_trades)
-            .aggregate(Sum("sell_amount"))["sell_amount__sum"]
-            or 0
-        )
-        transaction_to_amount = (
-            Transaction.objects.filter(
-                asset=self.asset, to_account=self.account, date__lt=date
-            )
-            .exclude(pk__in=exclude_transactions)
-            .aggregate(Sum("amount"))["amount__sum"]
-            or 0
-        )
-        transaction_from_and_fees_amount = (
-            Transaction.objects.filter(
-                asset=self.asset, from_account=self.account, date__lt=date
-            )
-            .exclude(pk__in=exclude_transactions)
-            .aggregate(Sum("fees"), Sum("amount"))
-        )
-        flow_amount = (
-            Flow.objects.filter(asset=self.asset, account=self.account, date__lt=date)
-            .exclude(pk__in=exclude_flows)
-            .aggregate(Sum("flow"))["flow__sum"]
-            or 0
-        )
-        transaction_from_amount = transaction_from_and_fees_amount["amount__sum"] or 0
-        transaction_fees_amount = transaction_from_and_fees_amount["fees__sum"] or 0
-        trade_amount = trade_buy_amount - trade_sell_amount
-        transaction_amount = (
-            transaction_to_amount - transaction_fees_amount - transaction_from_amount
-        )
-        amount = trade_amount + transaction_amount + flow_amount
-        return amount
+        return Holding.get_amount_before(self.account, self.asset, date, exclude)
 
     # setters
     def reset(self):
@@ -627,10 +690,12 @@ class Trade(models.Model):
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
+        Holding.record(self)
         self.reset_deps()
 
     def delete(self, using=None, keep_parents=False):
         super().delete(using=using, keep_parents=keep_parents)
+        Holding.forget(self)
         self.reset_deps()
 
     @property
@@ -689,10 +754,12 @@ class Transaction(models.Model):
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
+        Holding.record(self)
         self.reset_deps()
 
     def delete(self, *args, **kwargs):
         super().delete(*args, **kwargs)
+        Holding.forget(self)
         self.reset_deps()
 
     # getters
@@ -713,13 +780,33 @@ class Transaction(models.Model):
             dep.reset()
 
 
-class Price(models.Model):
+class PriceRollup(CorePriceRollup):
+    KEY = "symbol"
+    PRICE_TABLE = "crypto_price"
+
+    symbol = models.CharField(max_length=5)
+
+    class Meta(CorePriceRollup.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["symbol", "day"], name="crypto_pricerollup_unique"
+            )
+        ]
+
+
+class Price(LocalDateMixin, RolledUpPriceMixin, models.Model):
+    ROLLUP = PriceRollup
+
     symbol = models.CharField(max_length=5, null=True)
     date = models.DateTimeField()
+    local_date = models.DateField(editable=False)
     price = models.DecimalField(decimal_places=2, max_digits=15, default=Decimal(0))
 
+    objects = LocalDateQuerySet.as_manager()
+
     class Meta:
         unique_together = ("symbol", "date")
+        indexes = [models.Index(fields=["symbol", "local_date"])]
 
     def __str__(self):
         return "{} {} {}".format(self.symbol, self.get_date(), self.price)
@@ -746,11 +833,12 @@ class Price(models.Model):
 
     # setters
     def reset_deps(self):
-        affected_assets = (
+        affected_assets = list(
             Asset.objects.filter(symbol=self.symbol)
             .select_related("depot")
             .prefetch_related("depot__accounts")
         )
+        prefetch_latest_prices(affected_assets)
         affected_depots: list[Depot] = []
         for asset in affected_assets:
             asset.reset()
@@ -762,24 +850,30 @@ class Price(models.Model):
             depot.reset()
 
 
-class Flow(models.Model):
+class Flow(LocalDateMixin, models.Model):
     account = models.ForeignKey(Account, related_name="flows", on_delete=models.CASCADE)
     date = models.DateTimeField()
+    local_date = models.DateField(editable=False)
     flow = models.DecimalField(max_digits=20, decimal_places=2)
     asset = models.ForeignKey(Asset, related_name="flows", on_delete=models.CASCADE)
 
+    objects = LocalDateQuerySet.as_manager()
+
     class Meta:
         unique_together = ("account", "date")
+        indexes = [models.Index(fields=["account", "local_date"])]
 
     def __str__(self):
         return "{} {} {}".format(self.get_date(), self.account, self.flow)
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
+        Holding.record(self)
         self.reset_deps()
 
     def delete(self, using=None, keep_parents=False):
         super().delete(using=using, keep_parents=keep_parents)
+        Holding.forget(self)
         self.reset_deps()
 
     # getters
@@ -795,7 +889,239 @@ class Flow(models.Model):
         self.account.depot.reset()
 
 
-class PriceFetcher(models.Model):
+class Holding(models.Model):
+    """
+    The ledger of the amount of every asset in every account, one row per
+    trade, transaction or flow that changes it. Every row has the running
+    total after its change and the minimum of the totals from the row on, so
+    the amount before a date and the lowest amount after a date are single
+    index lookups. The rows of an event are replaced by record on save and
+    the totals of the account and asset are refreshed.
+    """
+
+    TOTALS_STATEMENT = """
+        update crypto_holding as h
+        set total = w.total, minimum = w.minimum
+        from (
+            select
+                id,
+                total,
+                min(total) over (
+                    partition by account_id, asset_id order by date desc, id desc
+                ) as minimum
+            from (
+                select
+                    id,
+                    account_id,
+                    asset_id,
+                    date,
+                    round(
+                        sum(change) over (
+                            partition by account_id, asset_id order by date, id
+                        ),
+                        8
+                    ) as total
+                from crypto_holding
+                where {}
+            )
+        ) as w
+        where h.id = w.id
+    """
+    ROWS_STATEMENT = """
+        with accounts as (
+            select id from crypto_account where depot_id = %s
+        )
+        insert into crypto_holding (account_id, asset_id, date, change, total,
+            minimum, trade_id, transaction_id, flow_id)
+        select account_id, buy_asset_id, date, buy_amount, 0, 0, id, null, null
+        from crypto_trade
+        where account_id in accounts
+        union all
+        select account_id, sell_asset_id, date, -sell_amount, 0, 0, id, null, null
+        from crypto_trade
+        where account_id in accounts
+        union all
+        select to_account_id, asset_id, date, amount, 0, 0, null, id, null
+        from crypto_transaction
+        where to_account_id in accounts
+        union all
+        select from_account_id, asset_id, date, -amount - fees, 0, 0, null, id, null
+        from crypto_transaction
+        where from_account_id in accounts
+        union all
+        select account_id, asset_id, date, flow, 0, 0, null, null, id
+        from crypto_flow
+        where account_id in accounts
+    """
+
+    account = models.ForeignKey(
+        Account, related_name="holdings", on_delete=models.CASCADE
+    )
+    asset = models.ForeignKey(Asset, related_name="holdings", on_delete=models.CASCADE)
+    date = models.DateTimeField()
+    change = models.DecimalField(max_digits=20, decimal_places=8)
+    total = models.DecimalField(max_digits=20, decimal_places=8)
+    minimum = models.DecimalField(max_digits=20, decimal_places=8)
+    # the event of the row
+    trade = models.ForeignKey(
+        Trade, null=True, related_name="holdings", on_delete=models.CASCADE
+    )
+    transaction = models.ForeignKey(
+        Transaction, null=True, related_name="holdings", on_delete=models.CASCADE
+    )
+    flow = models.ForeignKey(
+        Flow, null=True, related_name="holdings", on_delete=models.CASCADE
+    )
+
+    class Meta:
+        indexes = [models.Index(fields=["account", "asset", "date"])]
+
+    def __str__(self):
+        return "{} {} {}".format(self.account, self.asset, self.total)
+
+    @staticmethod
+    def get_rows(event: "Trade | Transaction | Flow") -> list["Holding"]:
+        if isinstance(event, Trade):
+            return [
+                Holding(
+                    account_id=event.account_id,  # type: ignore
+                    asset_id=event.buy_asset_id,  # type: ignore
+                    change=event.buy_amount,
+                    trade=event,
+                ),
+                Holding(
+                    account_id=event.account_id,  # type: ignore
+                    asset_id=event.sell_asset_id,  # type: ignore
+                    change=-event.sell_amount,
+                    trade=event,
+                ),
+            ]
+        if isinstance(event, Transaction):
+            return [
+                Holding(
+                    account_id=event.to_account_id,  # type: ignore
+                    asset_id=event.asset_id,  # type: ignore
+                    change=event.amount,
+                    transaction=event,
+                ),
+                Holding(
+                    account_id=event.from_account_id,  # type: ignore
+                    asset_id=event.asset_id,  # type: ignore
+                    change=-event.amount - event.fees,
+                    transaction=event,
+                ),
+            ]
+        return [
+            Holding(
+                account_id=event.account_id,  # type: ignore
+                asset_id=event.asset_id,  # type: ignore
+                change=event.flow,
+                flow=event,
+            )
+        ]
+
+    @staticmethod
+    def get_exclude_filter(
+        exclude_trades=None, exclude_transactions=None, exclude_flows=None
+    ) -> Q | None:
+        filters = [
+            Q(**{"{}__in".format(name): pks})
+            for name, pks in [
+                ("trade", exclude_trades),
+                ("transaction", exclude_transactions),
+                ("flow", exclude_flows),
+            ]
+            if pks
+        ]
+        return reduce(or_, filters) if filters else None
+
+    @classmethod
+    def refresh(cls, account_id: int, asset_id: int):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                cls.TOTALS_STATEMENT.format("account_id = %s and asset_id = %s"),
+                [account_id, asset_id],
+            )
+
+    @classmethod
+    def rebuild(cls, depot_id: int):
+        # needed after trades, transactions or flows were created with
+        # bulk_create
+        accounts = "account_id in (select id from crypto_account where depot_id = %s)"
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "delete from crypto_holding where {}".format(accounts), [depot_id]
+            )
+            cursor.execute(cls.ROWS_STATEMENT, [depot_id])
+            cursor.execute(cls.TOTALS_STATEMENT.format(accounts), [depot_id])
+
+    @classmethod
+    def record(cls, event: "Trade | Transaction | Flow"):
+        rows = cls.get_rows(event)
+        previous = cls.objects.filter(**{event._meta.model_name: event})  # type: ignore
+        pairs = set(previous.values_list("account_id", "asset_id"))
+        pairs |= {(row.account_id, row.asset_id) for row in rows}  # type: ignore
+        with transaction.atomic():
+            previous.delete()
+            # the totals are set by the refresh
+            for row in rows:
+                row.date, row.total, row.minimum = event.date, 0, 0
+            cls.objects.bulk_create(rows)
+            for account_id, asset_id in pairs:
+                cls.refresh(account_id, asset_id)
+
+    @classmethod
+    def forget(cls, event: "Trade | Transaction | Flow"):
+        # the rows of the event were deleted with it
+        pairs = {(row.account_id, row.asset_id) for row in cls.get_rows(event)}  # type: ignore
+        for account_id, asset_id in pairs:
+            cls.refresh(account_id, asset_id)
+
+    @classmethod
+    def get_amount_before(cls, account, asset, date, exclude: Q | None = None):
+        rows = cls.objects.filter(account=account, asset=asset, date__lt=date)
+        amount = rows.order_by("-date", "-pk").values_list("total", flat=True).first()
+        amount = amount or Decimal(0)
+        if exclude is not None:
+            excluded = rows.filter(exclude).aggregate(Sum("change"))["change__sum"]
+            amount -= excluded or 0
+        return amount
+
+    @classmethod
+    def get_minimum_from(cls, account, asset, date, exclude: Q | None = None):
+        """
+        Returns the lowest amount from the date on without the excluded events
+        or None if nothing happens from the date on. Every excluded event
+        lowers the totals after it, the totals between two of them are read
+        with one range query and the totals after the last one from the
+        minimum of its first row.
+        """
+        rows = cls.objects.filter(account=account, asset=asset)
+        excluded = []
+        if exclude is not None:
+            excluded = list(rows.filter(exclude).values_list("date", "change"))
+        starts = sorted({date} | {d for d, _ in excluded if d >= date})
+        minimum = None
+        for start, end in zip(starts, starts[1:] + [None]):
+            if end is None:
+                value = (
+                    rows.filter(date__gte=start)
+                    .order_by("date", "pk")
+                    .values_list("minimum", flat=True)
+                    .first()
+                )
+            else:
+                value = rows.filter(date__gte=start, date__lt=end).aggregate(
+                    Min("total")
+                )["total__min"]
+            if value is None:
+                continue
+            value -= sum((c for d, c in excluded if d <= start), Decimal(0))
+            minimum = value if minimum is None else min(minimum, value)
+        return minimum
+
+
+class PriceFetcher(CircuitBreakerMixin, FetcherStatsMixin, models.Model):
     asset = models.ForeignKey(
         Asset, on_delete=models.CASCADE, related_name="price_fetchers"
     )
@@ -807,6 +1133,9 @@ class PriceFetcher(models.Model):
     fetcher_type = models.CharField(max_length=250, choices=PRICE_FETCHER_TYPES)
     data = models.JSONField(default=dict)
     error = models.CharField(max_length=1000, blank=True)
+    # circuit breaker
+    failures = models.PositiveIntegerField(default=0, editable=False)
+    next_attempt_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     def __str__(self):
         if self.fetcher_type in ["WEBSITE", "SELENIUM"]:
@@ -842,6 +1171,7 @@ class PriceFetcher(models.Model):
     def run(self):
         fetcher: Fetcher = self.fetcher_class()
         success, result = fetcher.fetch_single(self.fetcher_input)
+        self.record_attempt(success, fetcher.stats.get(""))
         if success:
             self.save_price(result)
         else:
@@ -859,9 +1189,55 @@ class PriceFetcher(models.Model):
         )
         price.save()
         self.error = ""
+        self.close_circuit()
         self.save()
 
     def set_error(self, error: str | float):
         assert isinstance(error, str)
         self.error = error
+        self.register_failure()
         self.save()
+
+
+class FetchAttempt(CoreFetchAttempt):
+    fetcher = models.ForeignKey(
+        PriceFetcher, on_delete=models.CASCADE, related_name="attempts"
+    )
+
+    class Meta(CoreFetchAttempt.Meta):
+        verbose_name = "Fetch Attempt"
+        verbose_name_plural = "Fetch Attempts"
+        indexes = [models.Index(fields=["fetcher", "-created_at"])]
+
+
+def get_latest_prices(symbols: Iterable[str]) -> dict[str, Price]:
+    # one query for the latest price of every symbol instead of one per symbol
+    prices = (
+        Price.objects.filter(symbol__in=set(symbols))
+        .annotate(
+            rank=Window(
+                RowNumber(), partition_by=[F("symbol")], order_by=F("date").desc()
+            )
+        )
+        .filter(rank=1)
+    )
+    return {price.symbol: price for price in prices if price.symbol is not None}
+
+
+def get_top_prices(symbols: Iterable[str]) -> dict[str, Decimal]:
+    # the highest price of the last two years of every symbol in one query
+    date = timezone.now() - timedelta(days=365 * 2)
+    rows = (
+        PriceRollup.objects.filter(symbol__in=set(symbols), day__gt=date.date())
+        .values_list("symbol")
+        .annotate(high=Max("high"))
+        .order_by()
+    )
+    return {symbol: high for symbol, high in rows}
+
+
+def prefetch_latest_prices(assets: Iterable[Asset]):
+    assets = list(assets)
+    latest_prices = get_latest_prices([asset.symbol for asset in assets])
+    for asset in assets:
+        asset._latest_price = latest_prices.get(asset.symbol)
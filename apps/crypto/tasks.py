@@ -1,43 +1,78 @@
 from typing import Callable, Mapping
 
+from apps.core import retention
+from apps.core.fetchers.base import FetchStats
 from apps.core.fetchers.selenium import SeleniumFetcher
 from apps.core.fetchers.website import WebsiteFetcher
 from apps.crypto.fetchers.coingecko import CoinGeckoFetcher
-from apps.crypto.models import Price, PriceFetcher
+from apps.crypto.models import (
+    FetchAttempt,
+    Price,
+    PriceFetcher,
+    prefetch_latest_prices,
+)
 
 FETCHER_FUNCTION = Callable[[PriceFetcher], tuple[bool, str]]
 
 
 def get_fetchers_to_be_run(fetcher_type: str):
+    fetchers = list(
+        PriceFetcher.objects.filter(fetcher_type=fetcher_type)
+        .select_related("asset")
+        .prefetch_related("attempts")
+    )
+    prefetch_latest_prices([fetcher.asset for fetcher in fetchers])
     fetchers_to_be_run: list[PriceFetcher] = []
-    for fetcher in list(PriceFetcher.objects.filter(fetcher_type=fetcher_type)):
-        price = (
-            Price.objects.filter(symbol=fetcher.asset.symbol).order_by("-date").first()
-        )
+    for fetcher in fetchers:
+        if not fetcher.is_due:
+            continue
+        price = fetcher.asset.get_latest_price()
         if price and not price.is_almost_old:
             continue
         fetchers_to_be_run.append(fetcher)
+    # slow fetchers run last, this way they do not hold up the fast ones and
+    # are the ones that are cut off if the cron job runs into its timeout
+    fetchers_to_be_run.sort(key=lambda fetcher: fetcher.get_stats().p95 or 0)
     return {str(fetcher.pk): fetcher.fetcher_input for fetcher in fetchers_to_be_run}
 
 
-def save_prices(results: Mapping[str, tuple[bool, str | float]]):
+def save_prices(
+    results: Mapping[str, tuple[bool, str | float]],
+    stats: Mapping[str, FetchStats] | None = None,
+) -> int:
+    saved = 0
     for fetcher, result in results.items():
         fetcher = PriceFetcher.objects.get(pk=fetcher)
+        fetcher.record_attempt(result[0], (stats or {}).get(str(fetcher.pk)))
         if result[0]:
             fetcher.save_price(result[1])
+            saved += 1
         else:
             fetcher.set_error(result[1])
+    return saved
+
 
+def fetch_prices() -> int:
+    saved = 0
 
-def fetch_prices():
     data = get_fetchers_to_be_run("WEBSITE")
-    results = WebsiteFetcher().fetch_multiple(data)
-    save_prices(results)
+    fetcher = WebsiteFetcher()
+    results = fetcher.fetch_multiple(data)
+    saved += save_prices(results, fetcher.stats)
 
     data = get_fetchers_to_be_run("SELENIUM")
-    results = SeleniumFetcher().fetch_multiple(data)
-    save_prices(results)
+    fetcher = SeleniumFetcher()
+    results = fetcher.fetch_multiple(data)
+    saved += save_prices(results, fetcher.stats)
 
     data = get_fetchers_to_be_run("COINGECKO")
-    results = CoinGeckoFetcher().fetch_multiple(data)
-    save_prices(results)
+    fetcher = CoinGeckoFetcher()
+    results = fetcher.fetch_multiple(data)
+    saved += save_prices(results, fetcher.stats)
+
+    FetchAttempt.delete_old()
+    return saved
+
+
+def compact_prices() -> int:
+    return retention.compact_prices(Price).rows
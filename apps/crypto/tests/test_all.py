@@ -1,13 +1,27 @@
 from datetime import timedelta
+from unittest.mock import patch
 
+from django.db import connection
 from django.db.models import Count, Q
 from django.db.models.functions import TruncDate
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
 from django.utils import timezone
 
 from apps.crypto.forms import FlowForm, TradeForm, TransactionForm
-from apps.crypto.models import Account, Asset, Depot, Flow, Price, Trade, Transaction
+from apps.crypto.models import (
+    Account,
+    AccountAssetStats,
+    Asset,
+    Depot,
+    Flow,
+    Holding,
+    Price,
+    Trade,
+    Transaction,
+    get_latest_prices,
+)
 from apps.users.models import StandardUser
 
 
@@ -155,6 +169,14 @@ class FlowValueAmountTestCase(StandardSetUpTestCase):
             hour=0, minute=0, second=0, microsecond=0, tzinfo=None
         )
 
+    def test_latest_prices_are_returned_for_every_symbol(self):
+        date = timezone.now()
+        Price.objects.create(symbol="BTC", date=date - timedelta(days=3), price=1)
+        btc = Price.objects.create(symbol="BTC", date=date, price=2)
+        prices = get_latest_prices(["BTC", "EUR"])
+        assert prices["BTC"] == btc
+        assert prices["EUR"] == Price.objects.filter(symbol="EUR").latest("date")
+
     def test_price_df_length_equal_to_prices(self):
         btc = Asset.objects.get(depot=self.depot, symbol="BTC")
         Price(
@@ -340,3 +362,200 @@ class FormValidationTestCase(StandardSetUpTestCase):
             self.create_transaction(30, 500, 10, eur, self.account, account2)
         # test you can actually send assets
         self.create_transaction(10, 990, 10, eur, self.account, account2)
+
+
+class HoldingTestCase(StandardSetUpTestCase):
+    def setUp(self):
+        super().setUp()
+        self.account = Account.objects.create(depot=self.depot, name="Test Acc")
+        self.eur = self.depot.assets.get(symbol="EUR")
+
+    def get_changes(self, account, asset) -> list:
+        changes = [
+            (t.date, t.buy_amount)
+            for t in Trade.objects.filter(account=account, buy_asset=asset)
+        ]
+        changes += [
+            (t.date, -t.sell_amount)
+            for t in Trade.objects.filter(account=account, sell_asset=asset)
+        ]
+        changes += [
+            (t.date, t.amount)
+            for t in Transaction.objects.filter(to_account=account, asset=asset)
+        ]
+        changes += [
+            (t.date, -t.amount - t.fees)
+            for t in Transaction.objects.filter(from_account=account, asset=asset)
+        ]
+        changes += [
+            (f.date, f.flow) for f in Flow.objects.filter(account=account, asset=asset)
+        ]
+        return changes
+
+    def get_ledger(self) -> list:
+        return list(
+            Holding.objects.filter(account__depot=self.depot)
+            .order_by("trade", "transaction", "flow", "asset")
+            .values_list("account", "asset", "change", "total", "minimum")
+        )
+
+    def test_ledger_matches_the_trades_transactions_and_flows(self):
+        dates = [timezone.now() - timedelta(days=d) for d in [0, 50, 100, 200, 400]]
+        for account in self.depot.accounts.all():
+            for asset in self.depot.assets.all():
+                changes = self.get_changes(account, asset)
+                for date in dates:
+                    amount = sum(c for d, c in changes if d < date)
+                    assert account.get_amount_asset_before_date(asset, date) == amount
+                    totals = [
+                        amount + sum(c for d, c in changes if date <= d <= day)
+                        for day, _ in changes
+                        if day >= date
+                    ]
+                    minimum = account.get_minimum_asset_from_date(asset, date)
+                    assert minimum == (min(totals) if totals else None)
+
+    def test_rebuild_matches_the_ledger_of_the_saves(self):
+        trade = Trade.objects.filter(account__depot=self.depot).first()
+        trade.delete()
+        expected = self.get_ledger()
+        assert len(expected) > 0
+        Holding.objects.all().delete()
+        Holding.rebuild(self.depot.pk)
+        assert self.get_ledger() == expected
+
+    def test_exclusions_match_the_ledger_without_the_event(self):
+        btc = self.depot.assets.get(symbol="BTC")
+        self.create_flow(30, 1000, self.account)
+        trade = self.create_trade(20, self.account, 1, btc, 600, self.eur)
+        self.create_flow(10, -300, self.account)
+        date = timezone.now() - timedelta(days=15)
+        assert (
+            self.account.get_amount_asset_before_date(
+                self.eur, date, exclude_trades=[trade.pk]
+            )
+            == self.account.get_amount_asset_before_date(self.eur, date) + 600
+        )
+        minimum = self.account.get_minimum_asset_from_date(
+            self.eur, trade.date, exclude_trades=[trade.pk]
+        )
+        assert minimum == 700
+        trade.delete()
+        assert self.account.get_minimum_asset_from_date(self.eur, trade.date) == 700
+
+    def test_forms_do_not_allow_negative_amounts_at_a_later_date(self):
+        btc = self.depot.assets.get(symbol="BTC")
+        deposit = self.create_flow(30, 1000, self.account)
+        self.create_flow(10, -800, self.account)
+        # the withdrawal would not be covered anymore
+        with self.assertRaises(ValueError):
+            self.create_trade(20, self.account, 1, btc, 500, self.eur)
+        with self.assertRaises(ValueError):
+            FlowForm(
+                self.depot,
+                instance=deposit,
+                data={"date": deposit.date, "flow": 500, "account": self.account},
+            ).save()
+        account2 = Account.objects.create(depot=self.depot, name="acc2")
+        with self.assertRaises(ValueError):
+            self.create_transaction(20, 200, 10, self.eur, self.account, account2)
+        # what is left after the withdrawal can still be used
+        self.create_trade(20, self.account, 1, btc, 150, self.eur)
+        self.create_transaction(15, 40, 10, self.eur, self.account, account2)
+        assert self.account.get_minimum_asset_from_date(self.eur, deposit.date) == 0
+
+    def test_forms_check_the_original_account_and_asset_of_an_edit(self):
+        btc = self.depot.assets.get(symbol="BTC")
+        eth = self.depot.assets.get(symbol="ETH")
+        account2 = Account.objects.create(depot=self.depot, name="acc2")
+        deposit = self.create_flow(30, 1000, self.account)
+        trade = self.create_trade(20, self.account, 1, btc, 100, self.eur)
+        self.create_trade(10, self.account, 100, self.eur, 1, btc)
+        # the later trades would not be covered on the original account
+        with self.assertRaises(ValueError):
+            FlowForm(
+                self.depot,
+                instance=deposit,
+                data={"date": deposit.date, "flow": 1000, "account": account2},
+            ).save()
+        # the bought btc is sold later, it can not become eth
+        data = {
+            "account": self.account,
+            "date": trade.date,
+            "buy_amount": 1,
+            "buy_asset": eth,
+            "sell_amount": 100,
+            "sell_asset": self.eur,
+        }
+        with self.assertRaises(ValueError):
+            TradeForm(self.depot, instance=trade, data=data).save()
+        data["buy_asset"] = btc
+        TradeForm(self.depot, instance=trade, data=data).save()
+
+
+class DepotResetTestCase(StandardSetUpTestCase):
+    def setUp(self):
+        super().setUp()
+        for symbol, price in [("BTC", 30000), ("ETH", 2000), ("LTC", 80)]:
+            Price.objects.create(symbol=symbol, price=price, date=timezone.now())
+
+    def get_values(self) -> dict:
+        stats = AccountAssetStats.objects.filter(account__depot=self.depot)
+        return {
+            "stats": {(s.account_id, s.asset_id): (s.amount, s.value) for s in stats},
+            "assets": {
+                a.pk: (a.amount, a.price, a.value, a.top_price)
+                for a in self.depot.assets.all()
+            },
+            "accounts": {a.pk: a.value for a in self.depot.accounts.all()},
+            "depot": self.get_depot().value,
+        }
+
+    def test_reset_all_matches_the_single_resets(self):
+        for asset in self.depot.assets.all():
+            asset.reset()
+        for account in self.depot.accounts.all():
+            account.reset()
+        for stats in AccountAssetStats.objects.filter(account__depot=self.depot):
+            stats.reset()
+        for account in self.depot.accounts.all():
+            account.reset()
+        expected = self.get_values()
+        assert expected["depot"] > 0
+
+        AccountAssetStats.objects.filter(account__depot=self.depot).update(
+            amount=None, value=None
+        )
+        self.depot.assets.update(amount=None, price=None, value=None, top_price=None)
+        self.depot.accounts.update(value=None)
+        self.get_depot().reset_all()
+        assert self.get_values() == expected
+
+    def test_old_prices_are_counted(self):
+        assert self.depot.count_old_prices() == 0
+        old = timezone.now() - timedelta(days=2)
+        Price.objects.create(symbol="XRP", price=1, date=old)
+        Asset.objects.create(depot=self.depot, symbol="XRP")
+        assert self.depot.count_old_prices() == 1
+
+    def count_queries(self) -> int:
+        depot = self.get_depot()
+        # the return of the depot reads the value series of every asset
+        with patch.object(Depot, "reset"), CaptureQueriesContext(connection) as c:
+            depot.reset_all()
+        return len(c.captured_queries)
+
+    def test_reset_all_queries_do_not_grow_with_the_assets(self):
+        queries = self.count_queries()
+        assert queries <= 10
+        for i in range(5):
+            asset = Asset.objects.create(depot=self.depot, symbol="A{}".format(i))
+            Account.objects.create(depot=self.depot, name="Account {}".format(i))
+            Flow.objects.create(
+                account=self.depot.accounts.first(),
+                asset=asset,
+                date=timezone.now() - timedelta(days=i),
+                flow=1,
+            )
+        self.get_depot().reset_all()
+        assert self.count_queries() == queries
@@ -1,8 +1,18 @@
+from django.utils.functional import SimpleLazyObject
 from django.views import generic
 
 from apps.core.functional import list_sort
 from apps.core.mixins import TabContextMixin
-from apps.crypto.models import Account, Asset, Depot, Flow, Price, Trade, Transaction
+from apps.crypto.models import (
+    Account,
+    Asset,
+    Depot,
+    Flow,
+    Price,
+    Trade,
+    Transaction,
+    prefetch_latest_prices,
+)
 from apps.users.mixins import GetUserMixin
 from apps.users.models import StandardUser
 
@@ -16,12 +26,18 @@ class IndexView(GetUserMixin, TabContextMixin, generic.DetailView):
         user: StandardUser = self.get_user()  # type: ignore
         return user.get_active_crypto_depot()
 
+    def get_assets(self) -> list[Asset]:
+        assets = list(
+            self.object.assets.order_by("-value", "symbol").select_related("bucket")
+        )
+        prefetch_latest_prices(assets)
+        return assets
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["stats"] = self.object.get_stats()
-        context["assets"] = self.object.assets.order_by(
-            "-value", "symbol"
-        ).select_related("bucket")
+        # the stats are only calculated if they are not in the fragment cache
+        context["stats"] = SimpleLazyObject(self.object.get_stats)
+        context["assets"] = SimpleLazyObject(self.get_assets)
         context["accounts"] = self.object.accounts.order_by("-value")
         context["trades"] = Trade.objects.filter(
             account__in=self.object.accounts.all()
@@ -46,9 +62,12 @@ class AccountView(GetUserMixin, TabContextMixin, generic.DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["stats"] = self.object.get_stats()
-        assets = self.object.depot.assets.prefetch_related("account_stats").order_by(
-            "symbol"
+        assets = list(
+            self.object.depot.assets.prefetch_related("account_stats").order_by(
+                "symbol"
+            )
         )
+        prefetch_latest_prices(assets)
         context["assets"] = list_sort(
             list(assets), lambda a: a._get_value_account(self.object) or 0, reverse=True
         )
@@ -96,6 +115,6 @@ class AssetView(GetUserMixin, TabContextMixin, generic.DetailView):
             .order_by("-date")
             .select_related("from_account", "to_account", "asset")
         )
-        context["fetchers"] = self.object.price_fetchers.all()
+        context["fetchers"] = self.object.price_fetchers.prefetch_related("attempts")
         context["asset"] = self.object
         return context
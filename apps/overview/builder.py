@@ -1,18 +1,45 @@
+from collections import defaultdict
 from typing import Any
 
 from django.db import models
+from django.db.models import OuterRef, Subquery
 
+from apps.alternative.models import Alternative, Value
+from apps.banking.models import Account
 from apps.core.functional import list_map
-from apps.overview.domain import VBucket, combine_paths, get_percentage, get_total
+from apps.crypto.models import Asset
+from apps.overview.domain import BucketTrie, VBucket, get_percentage
 from apps.overview.models import Bucket
+from apps.stocks.models import Bank, Stock
 from apps.users.models import StandardUser
 
 
-def calc_total(user: StandardUser) -> float:
-    buckets = Bucket.objects.filter(user=user)
-    dbuckets = list_map(list(buckets), lambda x: x.dbucket)
-    total = get_total(dbuckets)
-    return total
+def get_bucket_values(user: StandardUser) -> dict[int, float]:
+    """
+    Returns the value of every bucket of the user that has items. Runs one
+    query per item type, no matter how many buckets or items there are.
+    """
+    latest_value = Value.objects.filter(alternative=OuterRef("pk")).order_by("-date")
+    querysets: list[models.QuerySet] = [
+        Account.objects.values_list("bucket_id", "balance"),
+        Asset.objects.values_list("bucket_id", "value"),
+        Alternative.objects.annotate(
+            value=Subquery(latest_value.values("value")[:1])
+        ).values_list("bucket_id", "value"),
+        Stock.objects.values_list("bucket_id", "value"),
+        Bank.objects.values_list("bucket_id", "balance"),
+    ]
+    values: dict[int, float] = defaultdict(float)
+    for queryset in querysets:
+        for bucket_id, value in queryset.filter(bucket__user=user):
+            values[bucket_id] += float(value or 0)
+    return dict(values)
+
+
+def calc_total(user: StandardUser, values: dict[int, float] | None = None) -> float:
+    if values is None:
+        values = get_bucket_values(user)
+    return sum(values.values(), 0.0)
 
 
 def build_vtotal(buckets: list[VBucket], total: float) -> dict[str, str]:
@@ -28,11 +55,19 @@ def build_vtotal(buckets: list[VBucket], total: float) -> dict[str, str]:
 
 
 def build_context_from_buckets(
-    total: float, buckets: models.QuerySet[Bucket], layers=1
+    total: float,
+    buckets: models.QuerySet[Bucket],
+    path: str = "",
+    values: dict[int, float] | None = None,
 ) -> dict[str, Any]:
-    dbuckets_all = list_map(list(buckets), lambda x: x.dbucket)
-    dbuckets = combine_paths(dbuckets_all, layers)
-    percentage = get_percentage(dbuckets)
-    vbuckets = list_map(dbuckets, lambda x: x.to_vbucket(total, percentage))
+    if values is None:
+        dbuckets = list_map(list(buckets), lambda x: x.dbucket)
+    else:
+        dbuckets = list_map(
+            list(buckets), lambda x: x.get_dbucket(values.get(x.pk, 0.0))
+        )
+    totals = BucketTrie(dbuckets).get_children(path)
+    percentage = get_percentage(totals)
+    vbuckets = list_map(totals, lambda x: x.to_vbucket(total, percentage))
     vtotal = build_vtotal(vbuckets, total)
     return {"buckets": vbuckets, "total": vtotal}
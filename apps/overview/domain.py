@@ -1,8 +1,8 @@
-import os
+from typing import Iterable, Sequence
 
 from pydantic import BaseModel
 
-from apps.core.functional import dict_map, group_by, list_map, list_sum
+from apps.core.functional import list_map
 
 
 class DBucket(BaseModel):
@@ -11,21 +11,27 @@ class DBucket(BaseModel):
     value: float
     wanted_percentage: float
 
-    def __add__(self, other) -> "DBucket":
-        if not isinstance(other, DBucket):
-            return NotImplemented
-        common_name = os.path.commonprefix([self.path, other.path])
-        common_name = common_name.strip().rstrip("/").strip()
-        if common_name == "":
-            raise ValueError("buckets must have a common prefix")
-        wanted_percentage = self.wanted_percentage + other.wanted_percentage
-        value = self.value + other.value
-        return DBucket(
-            pk=None, path=common_name, value=value, wanted_percentage=wanted_percentage
-        )
 
-    def __radd__(self, other) -> "DBucket":
-        return self.__add__(other)
+class BucketTotal:
+    """
+    The summed up value and wanted percentage of a bucket or of a group of
+    buckets that share a path.
+    """
+
+    __slots__ = ("pk", "path", "value", "wanted_percentage")
+
+    def __init__(
+        self, pk: int | None, path: str, value: float, wanted_percentage: float
+    ):
+        self.pk = pk
+        self.path = path
+        self.value = value
+        self.wanted_percentage = wanted_percentage
+
+    def __repr__(self) -> str:
+        return "BucketTotal(pk={}, path={!r}, value={}, wanted_percentage={})".format(
+            self.pk, self.path, self.value, self.wanted_percentage
+        )
 
     def to_vbucket(self, total: float, percentage: float) -> "VBucket":
         return VBucket(
@@ -38,18 +44,80 @@ class DBucket(BaseModel):
         )
 
 
-def combine_paths(buckets: list[DBucket], layers: int) -> list[DBucket]:
-    grouped = group_by(buckets, lambda x: "/".join(x.path.split("/")[:layers]))
-    added = dict_map(grouped, lambda x: list_sum(x))
-    return list(added.values())
-
-
-def get_total(buckets: list[DBucket]) -> float:
-    values = list_map(buckets, lambda x: x.value)
-    return sum(values, 0.0)
-
-
-def get_percentage(buckets: list[DBucket]) -> float:
+class BucketNode:
+    __slots__ = ("path", "bucket", "children", "total")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.bucket: DBucket | None = None
+        self.children: dict[str, BucketNode] = {}
+        self.total = BucketTotal(None, path, 0.0, 0.0)
+
+
+class BucketTrie:
+    """
+    Stores the buckets by the segments of their path. The totals of every
+    node are calculated once in a single traversal, afterwards every layer
+    can be read without adding up the buckets again.
+    """
+
+    def __init__(self, buckets: Iterable[DBucket]):
+        self.root = BucketNode("")
+        for bucket in buckets:
+            node = self.root
+            for segment in bucket.path.split("/"):
+                if segment not in node.children:
+                    path = segment if node is self.root else node.path + "/" + segment
+                    node.children[segment] = BucketNode(path)
+                node = node.children[segment]
+            node.bucket = bucket
+        self.__calculate_totals(self.root)
+
+    def __calculate_totals(self, node: BucketNode) -> BucketTotal:
+        value, wanted_percentage = 0.0, 0.0
+        if node.bucket is not None:
+            value += node.bucket.value
+            wanted_percentage += node.bucket.wanted_percentage
+        child_totals = [self.__calculate_totals(c) for c in node.children.values()]
+        for child_total in child_totals:
+            value += child_total.value
+            wanted_percentage += child_total.wanted_percentage
+        if node.bucket is None and len(child_totals) == 1:
+            # a node without a bucket of its own and only one child does not
+            # group anything, the child is shown instead
+            node.total = child_totals[0]
+        elif not child_totals and node.bucket is not None:
+            node.total = BucketTotal(
+                node.bucket.pk, node.bucket.path, value, wanted_percentage
+            )
+        else:
+            node.total = BucketTotal(None, node.path, value, wanted_percentage)
+        return node.total
+
+    def get_node(self, path: str = "") -> BucketNode | None:
+        node = self.root
+        if path == "":
+            return node
+        for segment in path.split("/"):
+            if segment not in node.children:
+                return None
+            node = node.children[segment]
+        return node
+
+    def get_children(self, path: str = "") -> list[BucketTotal]:
+        """
+        Returns the totals one layer below the path. A bucket without sub
+        buckets is returned itself.
+        """
+        node = self.get_node(path)
+        if node is None:
+            return []
+        if not node.children:
+            return [node.total] if node.bucket is not None else []
+        return [child.total for child in node.children.values()]
+
+
+def get_percentage(buckets: Sequence[DBucket | BucketTotal]) -> float:
     values = list_map(buckets, lambda x: x.wanted_percentage)
     return sum(values, 0.0)
 
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
+from apps.core.models import DataVersionMixin
 from apps.overview.domain import DBucket
 from apps.users.models import StandardUser
 
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
     from apps.stocks.models import Bank, Stock
 
 
-class Bucket(models.Model):
+class Bucket(DataVersionMixin, models.Model):
     name = models.CharField(max_length=255)
     user = models.ForeignKey(
         StandardUser, on_delete=models.CASCADE, related_name="buckets"
@@ -40,12 +41,18 @@ class Bucket(models.Model):
     def __str__(self):
         return self.name
 
+    def get_owner_id(self) -> int:
+        return self.user_id  # type: ignore
+
     @property
     def dbucket(self) -> DBucket:
+        return self.get_dbucket(self.__get_amount())
+
+    def get_dbucket(self, value: float) -> DBucket:
         return DBucket(
             pk=self.pk,
             path=self.name,
-            value=self.__get_amount(),
+            value=value,
             wanted_percentage=self.wanted_percentage,
         )
 
@@ -0,0 +1,48 @@
+from django.test import SimpleTestCase
+
+from apps.overview.domain import BucketTrie, DBucket
+
+
+def create_bucket(pk: int, path: str, value: float, wanted: float = 0) -> DBucket:
+    return DBucket(pk=pk, path=path, value=value, wanted_percentage=wanted)
+
+
+class BucketTrieTestCase(SimpleTestCase):
+    def setUp(self):
+        self.trie = BucketTrie(
+            [
+                create_bucket(1, "Cash", 100, 10),
+                create_bucket(2, "Stocks/ETF/World", 300, 50),
+                create_bucket(3, "Stocks/ETF/Emerging", 50, 10),
+                create_bucket(4, "Stocks/Single", 150, 20),
+                create_bucket(5, "Crypto/Bitcoin/Cold", 20, 10),
+            ]
+        )
+
+    def test_first_layer_sums_up_the_groups(self):
+        totals = {t.path: t for t in self.trie.get_children()}
+        assert list(totals.keys()) == ["Cash", "Stocks", "Crypto/Bitcoin/Cold"]
+        assert totals["Stocks"].value == 500
+        assert totals["Stocks"].wanted_percentage == 80
+        assert totals["Stocks"].pk is None
+        # a group with a single bucket is the bucket itself
+        assert totals["Cash"].pk == 1
+        assert totals["Crypto/Bitcoin/Cold"].pk == 5
+
+    def test_deeper_layers(self):
+        totals = self.trie.get_children("Stocks")
+        assert [(t.path, t.value) for t in totals] == [
+            ("Stocks/ETF", 350),
+            ("Stocks/Single", 150),
+        ]
+        totals = self.trie.get_children("Stocks/ETF")
+        assert [t.pk for t in totals] == [2, 3]
+
+    def test_leaf_and_unknown_paths(self):
+        assert [t.pk for t in self.trie.get_children("Cash")] == [1]
+        assert self.trie.get_children("Bonds") == []
+
+    def test_bucket_with_sub_buckets_is_grouped(self):
+        trie = BucketTrie([create_bucket(1, "A", 1), create_bucket(2, "A/B", 2)])
+        (total,) = trie.get_children()
+        assert (total.pk, total.path, total.value) == (None, "A", 3)
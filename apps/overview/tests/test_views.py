@@ -0,0 +1,149 @@
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+import apps.core.utils as utils
+from apps.alternative.models import Alternative
+from apps.banking.models import Account, Change
+from apps.overview.builder import get_bucket_values
+from apps.overview.models import Bucket
+from apps.users.models import StandardUser as User
+
+
+class ValueCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user: User = User.objects.create_user(username="dummy")  # type: ignore
+        self.user.set_password("test")
+        self.user.save()
+        self.user.create_random_banking_data()
+        self.client = Client()
+        self.client.login(username="dummy", password="test")
+        self.url = reverse_lazy("overview:api_data")
+
+    def create_change(self):
+        depot = self.user.get_active_banking_depot()
+        assert depot is not None
+        Change.objects.create(
+            account=depot.accounts.first(),
+            category=depot.categories.first(),
+            date=timezone.now(),
+            change=100,
+        )
+
+    def get_data(self, **params) -> dict:
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(b"".join(response.streaming_content))
+
+    def get_total(self) -> float:
+        return self.get_data()["series"]["Total"][-1]
+
+    def test_response_is_compressed(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+        assert response["Content-Encoding"] == "gzip"
+        data = json.loads(gzip.decompress(b"".join(response.streaming_content)))
+        assert set(data.keys()) == {"date", "series"}
+
+    def test_second_request_is_served_from_the_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    def test_change_invalidates_the_cache(self):
+        total = self.get_total()
+        version = User.objects.get(pk=self.user.pk).data_version
+        self.create_change()
+        assert User.objects.get(pk=self.user.pk).data_version > version
+        assert self.get_total() == total + 100
+
+    def test_points_and_dates_are_respected(self):
+        data = self.get_data(points=3)
+        assert len(data["date"]) <= 3
+        assert len(data["series"]["Total"]) == len(data["date"])
+        assert self.get_data(**{"from": "2999-01-01"})["date"] == []
+        response = self.client.get(self.url, {"points": "a"})
+        assert response.status_code == 400
+
+    def test_values_tab_is_paginated(self):
+        url = reverse_lazy("overview:index")
+        response = self.client.get(url, {"tab": "values", "page": 2})
+        self.assertEqual(response.status_code, 200)
+
+    def test_other_users_are_not_invalidated(self):
+        other: User = User.objects.create_user(username="other")  # type: ignore
+        other.create_random_banking_data()
+        version = User.objects.get(pk=other.pk).data_version
+        self.get_total()
+        self.create_change()
+        assert User.objects.get(pk=other.pk).data_version == version
+
+
+class BucketValuationTestCase(TestCase):
+    def setUp(self):
+        self.user: User = User.objects.create_user(username="dummy")  # type: ignore
+        self.user.set_password("test")
+        self.user.save()
+        self.user.create_random_banking_data()
+        self.user.create_random_alternative_data()
+        self.client = Client()
+        self.client.login(username="dummy", password="test")
+        self.cash = Bucket.objects.create(user=self.user, name="Cash")
+        self.other = Bucket.objects.create(user=self.user, name="Other/Alternative")
+        Account.objects.filter(depot__user=self.user).update(bucket=self.cash)
+        Alternative.objects.filter(depot__user=self.user).update(bucket=self.other)
+        for account in Account.objects.filter(depot__user=self.user):
+            account.get_balance()
+            account.save()
+
+    def count_queries(self, url, params=None) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_values_match_the_items(self):
+        values = get_bucket_values(self.user)
+        for bucket in Bucket.objects.filter(user=self.user):
+            assert values.get(bucket.pk, 0) == bucket.dbucket.value
+
+    def test_queries_do_not_grow_with_the_buckets(self):
+        index = reverse_lazy("overview:index")
+        bucket = reverse_lazy("overview:bucket", args=["Other"])
+        queries = self.count_queries(index, {"tab": "buckets"})
+        bucket_queries = self.count_queries(bucket)
+        for i in range(5):
+            Bucket.objects.create(user=self.user, name="Other/Empty {}".format(i))
+        assert self.count_queries(index, {"tab": "buckets"}) == queries
+        assert self.count_queries(bucket) == bucket_queries
+
+
+class DownsamplingTestCase(TestCase):
+    def test_lttb_keeps_the_extremes(self):
+        x = np.arange(1000)
+        y = np.sin(x / 50) * 100
+        y[500] = 1000
+        indices = utils.get_lttb_indices(x, y, 50)
+        assert len(indices) == 50
+        assert indices[0] == 0 and indices[-1] == 999
+        assert 500 in indices
+        assert np.all(np.diff(indices) > 0)
+
+    def test_short_series_are_not_downsampled(self):
+        indices = utils.get_lttb_indices(np.arange(10), np.arange(10), 50)
+        assert list(indices) == list(range(10))
+
+    def test_downsampled_df_keeps_all_columns(self):
+        index = pd.date_range("2020-01-01 12:00", periods=500, freq="D")
+        df = pd.DataFrame({"A": np.arange(500), "Total": np.arange(500) * 2}, index)
+        df = utils.downsample_df(df, 20, "Total")
+        assert len(df) == 20
+        assert (df.loc[:, "Total"] == df.loc[:, "A"] * 2).all()
@@ -1,19 +1,32 @@
-import json
 from typing import Protocol, Sequence
 
+import numpy as np
+import pandas as pd
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import JsonResponse
+from django.core.paginator import Paginator
+from django.http import HttpResponseBadRequest
+from django.utils.decorators import method_decorator
 from django.views import View, generic
+from django.views.decorators.gzip import gzip_page
 
+from apps.core.cache import get_or_set_for_user
+from apps.core.charts import ChartDataResponse, get_chart_data_from_df
 from apps.core.mixins import TabContextMixin
 from apps.core.utils import (
     change_time_of_date_index_in_df,
+    downsample_df,
     get_merged_value_df_from_queryset,
+    parse_date,
     sum_up_columns_in_a_dataframe,
 )
-from apps.overview.builder import build_context_from_buckets, calc_total
+from apps.overview.builder import (
+    build_context_from_buckets,
+    calc_total,
+    get_bucket_values,
+)
 from apps.overview.models import Bucket
 from apps.users.mixins import GetUserMixin
+from apps.users.models import StandardUser
 
 
 class PDepot(Protocol):
@@ -61,10 +74,43 @@ def get_stats(depots: Sequence[PDepot]) -> tuple[dict[str, str], str]:
     return stats, format_number(total)
 
 
+def calculate_value_df(user: StandardUser) -> pd.DataFrame:
+    active_depots = user.get_all_active_depots()
+    # get the df with all values
+    df = get_merged_value_df_from_queryset(active_depots)
+    # make the date normal
+    df = change_time_of_date_index_in_df(df, 12)
+    # sums up all the values
+    df = df.ffill().fillna(0)
+    df = sum_up_columns_in_a_dataframe(df, drop=False)
+    # remove all the rows where the value is 0 as it
+    # doesn't make sense in the calculations
+    assert df is not None
+    df = df.loc[df.loc[:, "value"] != 0]
+    # remove duplicate dates and keep the last
+    df = df.loc[~df.index.duplicated(keep="last")]
+    # rename the columns
+    column_names = dict(
+        zip(df.columns, ["Total", *[depot.name for depot in active_depots]])
+    )
+    df = df.rename(columns=column_names)
+    # reorder the df
+    new_column_order = list(df.columns[1:]) + list([df.columns[0]])
+    df = df.loc[:, new_column_order]
+    return df
+
+
+def get_value_df(user: StandardUser) -> pd.DataFrame:
+    return get_or_set_for_user(
+        user, "overview_value_df", lambda: calculate_value_df(user)
+    )
+
+
 class IndexView(
     GetUserMixin, LoginRequiredMixin, TabContextMixin, generic.TemplateView
 ):
     template_name = "overview/index.j2"
+    values_per_page = 100
 
     def get_queryset(self):
         return self.get_user().banking_depots.all()
@@ -79,39 +125,27 @@ class IndexView(
         depots = user.get_all_active_depots()
         context["stats"], total = get_stats(depots)
         if context["tab"] == "values":
-            context["value_df"] = self.get_value_df()
+            df = self.get_value_df()
+            context["value_df"] = df
+            # paginate the row numbers, a df is not a valid object list
+            paginator = Paginator(range(len(df)), self.values_per_page)
+            page = paginator.get_page(self.request.GET.get("page"))
+            context["value_page"] = page
+            context["value_rows"] = df.iloc[
+                page.object_list.start : page.object_list.stop
+            ]
         if context["tab"] == "charts":
             context["active_depots"] = self.get_user().get_all_active_depots()
         if context["tab"] == "buckets":
-            total = calc_total(user)
-            context.update(**build_context_from_buckets(total, self.get_buckets()))
+            values = get_bucket_values(user)
+            total = calc_total(user, values)
+            context.update(
+                **build_context_from_buckets(total, self.get_buckets(), values=values)
+            )
         return context
 
     def get_value_df(self):
-        active_depots = self.get_user().get_all_active_depots()
-        # get the df with all values
-        df = get_merged_value_df_from_queryset(active_depots)
-        # make the date normal
-        df = change_time_of_date_index_in_df(df, 12)
-        # sums up all the values
-        df = df.ffill().fillna(0)
-        df = sum_up_columns_in_a_dataframe(df, drop=False)
-        # remove all the rows where the value is 0 as it
-        # doesn't make sense in the calculations
-        assert df is not None
-        df = df.loc[df.loc[:, "value"] != 0]
-        # remove duplicate dates and keep the last
-        df = df.loc[~df.index.duplicated(keep="last")]
-        # rename the columns
-        column_names = dict(
-            zip(df.columns, ["Total", *[depot.name for depot in active_depots]])
-        )
-        df = df.rename(columns=column_names)
-        # reorder the df
-        new_column_order = list(df.columns[1:]) + list([df.columns[0]])
-        df = df.loc[:, new_column_order]
-        # set the df
-        return df
+        return get_value_df(self.get_user())
 
 
 class BucketView(GetUserMixin, LoginRequiredMixin, generic.TemplateView):
@@ -128,39 +162,37 @@ class BucketView(GetUserMixin, LoginRequiredMixin, generic.TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         path: str = self.kwargs.get("path")
-        layers = path.count("/") + 2
-        total = calc_total(self.get_user())
-        context.update(**build_context_from_buckets(total, self.get_buckets(), layers))
+        values = get_bucket_values(self.get_user())
+        total = calc_total(self.get_user(), values)
+        context.update(
+            **build_context_from_buckets(total, self.get_buckets(), path, values)
+        )
         return context
 
 
+@method_decorator(gzip_page, name="dispatch")
 class DataApiView(GetUserMixin, View):
-    def get(self, *args, **kwargs):
-        active_depots = self.get_user().get_all_active_depots()
-        # get the df with all values
-        df = get_merged_value_df_from_queryset(active_depots)
-        # make the date normal
-        df = change_time_of_date_index_in_df(df, 12)
-        # sums up all the values
-        df = df.ffill().fillna(0)
-        df = sum_up_columns_in_a_dataframe(df, drop=False)
-        # remove all the rows where the value is 0 as it
-        # doesn't make sense in the calculations
-        assert df is not None
-        df = df.loc[df.loc[:, "value"] != 0]
-        # remove duplicate dates and keep the last
-        df = df.loc[~df.index.duplicated(keep="last")]
-        # rename the columns
-        column_names = dict(
-            zip(df.columns, ["Total", *[depot.name for depot in active_depots]])
-        )
-        df = df.rename(columns=column_names)
-        # reorder the df
-        new_column_order = list(df.columns[1:]) + list([df.columns[0]])
-        df = df.loc[:, new_column_order]
-        # reset the index for json
-        df.reset_index(inplace=True)
-        # make a json object
-        json_df = json.loads(df.to_json(orient="records"))
-        # return the df
-        return JsonResponse(json_df, safe=False)
+    # more points than this can not be displayed by the chart anyways
+    default_points = 1000
+
+    def get(self, request, *args, **kwargs):
+        try:
+            points = int(request.GET.get("points", self.default_points))
+            date_from = parse_date(request.GET.get("from"))
+            date_to = parse_date(request.GET.get("to"))
+        except ValueError:
+            return HttpResponseBadRequest("points, from or to is invalid.")
+        if points < 3:
+            return HttpResponseBadRequest("points needs to be at least 3.")
+        df = get_value_df(self.get_user())
+        # compare days, this includes the whole last day and works for dates
+        # that are out of the nanosecond timestamp bounds
+        days = df.index.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+        mask = np.ones(len(days), dtype=bool)
+        if date_from is not None:
+            mask &= days >= np.datetime64(date_from)
+        if date_to is not None:
+            mask &= days <= np.datetime64(date_to)
+        df = df.loc[mask]
+        df = downsample_df(df, points, "Total")
+        return ChartDataResponse(get_chart_data_from_df(df))
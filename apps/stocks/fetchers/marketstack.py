@@ -1,19 +1,122 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Iterable, Iterator
 
 import requests
 from django.conf import settings
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 
-from apps.core.fetchers.base import Fetcher
+from apps.core.fetchers.base import Fetcher, FetchStats
 
 logger = logging.getLogger(__name__)
 
+# marketstack accepts at most 100 symbols per request and returns at most
+# 1000 rows per page
+CHUNK_SIZE = 100
+PAGE_SIZE = 1000
+
 
 class MarketstackFetcherInput(BaseModel):
     symbol: str
 
 
+class MarketstackError(Exception):
+    pass
+
+
+def chunks(items: list[str], size: int) -> Iterator[list[str]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
 class MarketstackFetcher(Fetcher):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        page_size: int = PAGE_SIZE,
+        workers: int = 4,
+        timeout: float = 30,
+    ):
+        super().__init__()
+        self.base_url = (base_url or settings.MARKETSTACK_URL).rstrip("/")
+        self.chunk_size = chunk_size
+        self.page_size = page_size
+        self.workers = max(workers, 1)
+        self.timeout = timeout
+        # one session for all chunks, the pool is as large as the number of
+        # workers so that every thread can keep its connection alive
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __get(
+        self, endpoint: str, params: dict, stats: FetchStats | None = None
+    ) -> dict:
+        stats = stats or FetchStats()
+        params = {"access_key": settings.MARKETSTACK_API_KEY, **params}
+        url = f"{self.base_url}/{endpoint}"
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            stats.duration = time.perf_counter() - start
+            stats.bytes = len(response.content)
+            start = time.perf_counter()
+            api_response = response.json()
+            stats.parse_duration = time.perf_counter() - start
+        except (requests.RequestException, ValueError) as e:
+            stats.duration = stats.duration or time.perf_counter() - start
+            raise MarketstackError(f"Could not connect to marketstack: {e}.")
+        if "error" in api_response:
+            raise MarketstackError(
+                "Could not fetch prices from marketstack: "
+                f"'{api_response['error']['message']}'."
+            )
+        return api_response
+
+    def __fetch_latest(
+        self, symbols: list[str]
+    ) -> tuple[dict[str, float] | str, FetchStats]:
+        logger.info(f"fetching prices from marketstack for '{','.join(symbols)}'")
+        stats = FetchStats()
+        try:
+            api_response = self.__get(
+                "eod/latest", {"symbols": ",".join(symbols)}, stats
+            )
+        except MarketstackError as e:
+            return str(e), stats
+        finally:
+            # the request is shared by the chunk, every symbol gets its share
+            stats.bytes //= len(symbols)
+            stats.parse_duration /= len(symbols)
+        prices = {
+            price["symbol"]: round(price["close"], 2) for price in api_response["data"]
+        }
+        return prices, stats
+
+    def __fetch_history(
+        self, symbols: list[str], date_from: date, date_to: date
+    ) -> list[dict]:
+        params = {
+            "symbols": ",".join(symbols),
+            "date_from": date_from.isoformat(),
+            "date_to": date_to.isoformat(),
+            "limit": self.page_size,
+        }
+        rows: list[dict] = []
+        offset = 0
+        while True:
+            api_response = self.__get("eod", {**params, "offset": offset})
+            rows += api_response["data"]
+            pagination = api_response.get("pagination", {})
+            offset += pagination.get("count", len(api_response["data"]))
+            if not api_response["data"] or offset >= pagination.get("total", 0):
+                return rows
+
     def fetch_single(self, data: MarketstackFetcherInput) -> tuple[bool, str | float]:
         return self.fetch_multiple({"": MarketstackFetcherInput(symbol=data.symbol)})[
             ""
@@ -22,36 +125,57 @@ class MarketstackFetcher(Fetcher):
     def fetch_multiple(
         self, data: dict[str, MarketstackFetcherInput]
     ) -> dict[str, tuple[bool, str | float]]:
-        symbols = []
-        for fetcher, input in data.items():
-            symbols.append(input.symbol)
+        symbols = list(dict.fromkeys(input.symbol for input in data.values()))
 
-        symbols = ",".join(symbols)
-        params = {"access_key": settings.MARKETSTACK_API_KEY}
-        url = "http://api.marketstack.com/v1/eod/latest?symbols={}".format(symbols)
-        logger.info(f"fetching prices from marketstack for '{symbols}'")
-        api_result = requests.get(url, params)
-        api_response = api_result.json()
+        prices: dict[str, float] = {}
+        errors: dict[str, str] = {}
+        stats: dict[str, FetchStats] = {}
+        with ThreadPoolExecutor(self.workers) as executor:
+            chunked = list(chunks(symbols, self.chunk_size))
+            for chunk, (result, chunk_stats) in zip(
+                chunked, executor.map(self.__fetch_latest, chunked)
+            ):
+                stats.update({symbol: chunk_stats for symbol in chunk})
+                if isinstance(result, str):
+                    errors.update({symbol: result for symbol in chunk})
+                else:
+                    prices.update(result)
 
-        results = {}
+        results: dict[str, tuple[bool, str | float]] = {}
+        for fetcher, input in data.items():
+            self.stats[fetcher] = stats[input.symbol]
+            if input.symbol in prices:
+                results[fetcher] = (True, prices[input.symbol])
+            elif input.symbol in errors:
+                results[fetcher] = (False, errors[input.symbol])
+            else:
+                results[fetcher] = (False, "Price not found in response.")
+        return results
 
-        if "error" in api_response:
-            for fetcher in data:
-                results[fetcher] = (
-                    False,
-                    (
-                        "Could not fetch prices from marketstack: "
-                        f"'{api_response['error']['message']}'."
-                    ),
-                )
-            return results
+    def fetch_history(
+        self, symbols: Iterable[str], date_from: date, date_to: date
+    ) -> dict[str, list[tuple[datetime, float]]]:
+        """
+        Fetches the end of day prices of the symbols between date_from and
+        date_to. Raises a MarketstackError if any chunk could not be fetched.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        chunked = list(chunks(symbols, self.chunk_size))
 
-        for fetcher, input in data.items():
-            symbol = input.symbol
-            results[fetcher] = (False, "Price not found in response.")
-            for price in api_response["data"]:
-                if price["symbol"] == symbol:
-                    results[fetcher] = (True, round(price["close"], 2))
-                    break
+        results: dict[str, list[tuple[datetime, float]]] = {
+            symbol: [] for symbol in symbols
+        }
+        with ThreadPoolExecutor(self.workers) as executor:
+            pages = executor.map(
+                lambda chunk: self.__fetch_history(chunk, date_from, date_to), chunked
+            )
+            for rows in pages:
+                for row in rows:
+                    if row["symbol"] not in results:
+                        continue
+                    day = datetime.fromisoformat(row["date"].replace("Z", "+00:00"))
+                    results[row["symbol"]].append((day, round(row["close"], 2)))
 
+        for prices in results.values():
+            prices.sort()
         return results
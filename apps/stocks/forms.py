@@ -146,6 +146,11 @@ class PriceFetcherForm(forms.ModelForm):
             raise forms.ValidationError("This type is not supported.")
         return type
 
+    def save(self, commit=True):
+        # the fetcher was changed, so give it a fresh start
+        self.instance.close_circuit()
+        return super().save(commit)
+
 
 ###
 # Flow
@@ -0,0 +1,100 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stocks", "0049_pricefetcher_failures_pricefetcher_next_attempt_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="dividend",
+            name="bank",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="dividends",
+                to="stocks.bank",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="dividend",
+            name="stock",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="dividends",
+                to="stocks.stock",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="flow",
+            name="bank",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="flows",
+                to="stocks.bank",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="trade",
+            name="bank",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="trades",
+                to="stocks.bank",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="trade",
+            name="stock",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="trades",
+                to="stocks.stock",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dividend",
+            index=models.Index(
+                fields=["bank", "date"], name="stocks_divi_bank_id_84bd42_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dividend",
+            index=models.Index(
+                fields=["stock", "date"], name="stocks_divi_stock_i_9a90b6_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="flow",
+            index=models.Index(
+                fields=["bank", "date"], name="stocks_flow_bank_id_acaf99_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="price",
+            index=models.Index(
+                fields=["isin", "date"], name="stocks_pric_isin_1ba02d_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trade",
+            index=models.Index(
+                fields=["bank", "date"], name="stocks_trad_bank_id_95a25b_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trade",
+            index=models.Index(
+                fields=["stock", "date"], name="stocks_trad_stock_i_94b0bf_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FILL = """
+    insert into {table} ({key}, day, open, high, low, close,
+        first_date, last_date, count)
+    select distinct
+        {key},
+        date(date),
+        first_value(price) over w,
+        max(price) over w,
+        min(price) over w,
+        last_value(price) over w,
+        min(date) over w,
+        max(date) over w,
+        count(*) over w
+    from {prices}
+    where {key} is not null
+    window w as (
+        partition by {key}, date(date) order by date, id
+        rows between unbounded preceding and unbounded following
+    )
+"""
+
+
+def clear_top_prices(apps, schema_editor):
+    # the top price points to a rollup now, it is recalculated on reset
+    Stock = apps.get_model("stocks", "Stock")
+    Stock.objects.update(top_price=None)
+
+
+def fill_rollups(apps, schema_editor):
+    schema_editor.execute(
+        FILL.format(table="stocks_pricerollup", key="isin", prices="stocks_price")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stocks", "0050_time_series_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PriceRollup",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("open", models.DecimalField(decimal_places=2, max_digits=20)),
+                ("high", models.DecimalField(decimal_places=2, max_digits=20)),
+                ("low", models.DecimalField(decimal_places=2, max_digits=20)),
+                ("close", models.DecimalField(decimal_places=2, max_digits=20)),
+                ("first_date", models.DateTimeField()),
+                ("last_date", models.DateTimeField()),
+                ("count", models.IntegerField(default=0)),
+                ("isin", models.CharField(max_length=12, verbose_name="ISIN")),
+            ],
+            options={
+                "ordering": ["-day"],
+                "abstract": False,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("isin", "day"), name="stocks_pricerollup_unique"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(clear_top_prices, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="stock",
+            name="top_price",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="top_price_stocks",
+                to="stocks.pricerollup",
+            ),
+        ),
+        migrations.RunPython(fill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,122 @@
+import zoneinfo
+
+from django.conf import settings
+from django.db import migrations, models
+
+MODELS = ["Price", "Trade", "Flow", "Dividend"]
+
+
+def fill_local_dates(apps, schema_editor):
+    time_zone = zoneinfo.ZoneInfo(settings.TIME_ZONE)
+    for name in MODELS:
+        model = apps.get_model("stocks", name)
+        objs = list(model.objects.only("date"))
+        for obj in objs:
+            obj.local_date = obj.date.astimezone(time_zone).date()
+        model.objects.bulk_update(objs, ["local_date"], batch_size=1000)
+
+
+REFILL = """
+    insert into stocks_pricerollup (isin, day, open, high, low, close,
+        first_date, last_date, count)
+    select distinct
+        isin,
+        local_date,
+        first_value(price) over w,
+        max(price) over w,
+        min(price) over w,
+        last_value(price) over w,
+        min(date) over w,
+        max(date) over w,
+        count(*) over w
+    from stocks_price
+    where isin is not null
+    window w as (
+        partition by isin, local_date order by date, id
+        rows between unbounded preceding and unbounded following
+    )
+"""
+
+
+def refill_rollups(apps, schema_editor):
+    # the rollups were grouped by the utc day before, the top prices are
+    # recalculated on reset
+    schema_editor.execute("update stocks_stock set top_price_id = null")
+    schema_editor.execute("delete from stocks_pricerollup")
+    schema_editor.execute(REFILL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stocks", "0051_pricerollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="price",
+            name="local_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="trade",
+            name="local_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="flow",
+            name="local_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="dividend",
+            name="local_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(fill_local_dates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="price",
+            name="local_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name="trade",
+            name="local_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name="flow",
+            name="local_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name="dividend",
+            name="local_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="dividend",
+            index=models.Index(
+                fields=["stock", "local_date"], name="stocks_divi_stock_i_11ab18_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="flow",
+            index=models.Index(
+                fields=["bank", "local_date"], name="stocks_flow_bank_id_a55b30_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="price",
+            index=models.Index(
+                fields=["isin", "local_date"], name="stocks_pric_isin_f6c210_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trade",
+            index=models.Index(
+                fields=["stock", "local_date"], name="stocks_trad_stock_i_9ccbf5_idx"
+            ),
+        ),
+        migrations.RunPython(refill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+def fill_top_prices(apps, schema_editor):
+    schema_editor.execute("""
+        update stocks_stock
+        set top_price = (
+            select max(high)
+            from stocks_pricerollup r
+            where r.isin = stocks_stock.isin and r.day > date('now', '-730 days')
+        )
+        """)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stocks", "0052_local_date"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="stock",
+            name="top_price",
+        ),
+        migrations.AddField(
+            model_name="stock",
+            name="top_price",
+            field=models.DecimalField(decimal_places=2, max_digits=20, null=True),
+        ),
+        migrations.RunPython(fill_top_prices, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,11 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterable, Union
 
 from django.core.validators import MinLengthValidator
 from django.db import models
-from django.db.models import QuerySet, Sum
+from django.db.models import F, Max, QuerySet, Sum, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 
 import apps.core.return_calculation as rc
@@ -12,6 +13,11 @@ from apps.core import utils
 from apps.core.fetchers.base import Fetcher
 from apps.core.fetchers.selenium import SeleniumFetcher, SeleniumFetcherInput
 from apps.core.fetchers.website import WebsiteFetcher, WebsiteFetcherInput
+from apps.core.models import CircuitBreakerMixin, DataVersionMixin
+from apps.core.models import FetchAttempt as CoreFetchAttempt
+from apps.core.models import FetcherStatsMixin, LocalDateMixin, LocalDateQuerySet
+from apps.core.models import PriceRollup as CorePriceRollup
+from apps.core.models import RolledUpPriceMixin
 from apps.core.utils import get_df_from_database
 from apps.overview.models import Bucket
 from apps.stocks.fetchers.marketstack import MarketstackFetcher, MarketstackFetcherInput
@@ -24,7 +30,18 @@ ISIN = models.CharField(
 )
 
 
-class Depot(models.Model):
+class Depot(DataVersionMixin, models.Model):
+    # a recompute of the totals that ends with the same values keeps the cache
+    DATA_VERSION_FIELDS = (
+        "name",
+        "is_active",
+        "balance",
+        "value",
+        "invested_capital",
+        "inflow_total",
+        "outflow_total",
+    )
+
     name = models.CharField(max_length=200)
     is_active = models.BooleanField(default=False)
     user = models.ForeignKey(
@@ -52,11 +69,16 @@ class Depot(models.Model):
     def __str__(self):
         return "{}".format(self.name)
 
+    def get_owner_id(self) -> int:
+        return self.user_id  # type: ignore
+
     # setters
     def reset_all(self):
         for bank in list(self.banks.all()):
             bank.reset()
-        for stock in list(self.stocks.all()):
+        stocks = list(self.stocks.all())
+        prefetch_latest_prices(stocks)
+        for stock in stocks:
             stock.reset()
         self.reset()
 
@@ -137,6 +159,12 @@ class Depot(models.Model):
     def get_total_value(self) -> float:
         return float(self.value or 0) + float(self.balance or 0)
 
+    def count_old_prices(self) -> int:
+        # a price turns old without a change of the data, the count is part of
+        # the keys of the fragments that show the prices
+        since = timezone.now() - timedelta(days=1)
+        return self.stocks.filter(price__date__lt=since).count()
+
     def get_value(self) -> float | None:
         return self.value
 
@@ -199,12 +227,12 @@ class Depot(models.Model):
         if not hasattr(self, "flow_df"):
             statement = """
                 select 
-                    date(date) as date,
+                    local_date as date,
                     sum(flow) as flow
                 from stocks_flow f
                 join stocks_bank b on f.bank_id=b.id
                 where b.depot_id = {}
-                group by date(date)
+                group by local_date
             """.format(
                 self.pk
             )
@@ -221,7 +249,7 @@ class Depot(models.Model):
         return self.value_df
 
 
-class Bank(models.Model):
+class Bank(DataVersionMixin, models.Model):
     TYPE = "Stocks"
     name = models.CharField(max_length=200)
     depot = models.ForeignKey(
@@ -416,14 +444,14 @@ class Bank(models.Model):
         return self.value_df
 
 
-class Stock(models.Model):
+class Stock(DataVersionMixin, models.Model):
     name = models.CharField(max_length=50)
     depot = models.ForeignKey(Depot, on_delete=models.CASCADE, related_name="stocks")
     isin = ISIN
     # query optimization
-    top_price = models.ForeignKey(
-        "Price", null=True, on_delete=models.SET_NULL, related_name="top_price_stocks"
-    )
+    # the highest daily high of the last two years, stored as a value as the
+    # rollups are rewritten whenever their prices change
+    top_price = models.DecimalField(max_digits=20, decimal_places=2, null=True)
     price = models.ForeignKey(
         "Price", null=True, on_delete=models.SET_NULL, related_name="price_stocks"
     )
@@ -486,7 +514,7 @@ class Stock(models.Model):
         self.calculate_value()
 
     def calculate_price(self):
-        new_price = self.__get_latest_price()
+        new_price = self.get_latest_price()
         if new_price is None:
             return
         if self.price is None or new_price.date > self.price.date:
@@ -494,12 +522,9 @@ class Stock(models.Model):
 
     def calculate_top_price(self):
         date = timezone.now() - timedelta(days=365 * 2)
-        top_price = (
-            Price.objects.filter(isin=self.isin, date__gt=date)
-            .order_by("-price")
-            .first()
-        )
-        self.top_price = top_price
+        self.top_price = PriceRollup.objects.filter(
+            isin=self.isin, day__gt=date.date()
+        ).aggregate(Max("high"))["high__max"]
 
     def calculate_invested_capital(self):
         df = rc.get_current_return_df(self.get_flow_df(), self.get_value_df())
@@ -542,8 +567,10 @@ class Stock(models.Model):
     def get_bucket_value(self) -> float:
         return float(self.value or 0)
 
-    def __get_latest_price(self) -> Union["Price", None]:
-        return Price.objects.filter(isin=self.isin).order_by("-date").first()
+    def get_latest_price(self) -> Union["Price", None]:
+        if not hasattr(self, "_latest_price"):
+            self._latest_price = get_latest_prices([self.isin]).get(self.isin)
+        return self._latest_price
 
     def get_stats(self):
         return {
@@ -621,7 +648,7 @@ class Stock(models.Model):
         if self.top_price is None or self.price is None:
             return "404"
         return "{:.2f}/{:.2f}".format(
-            self.top_price.price, self.top_price.price - self.price.price
+            self.top_price, self.top_price - self.price.price
         )
 
     def get_price_display(self) -> str:
@@ -644,26 +671,27 @@ class Stock(models.Model):
         # thogether. dividends count as negative flows and
         # so do trades that are no buy trades.
         statement = """
-            select date(date), sum(dividend + money) as flow
+            select local_date, sum(dividend + money) as flow
             from (
                 select 
-                    stock_id,
                     date,
+                    local_date,
                     case when buy_or_sell = 'BUY' then money_amount 
                     else money_amount * -1 end as money,
                     0 as dividend
                 from stocks_trade t
+                where stock_id = {0}
                 union
                 select 
-                    stock_id, 
                     date, 
+                    local_date,
                     0 as money, 
                     dividend * -1 as dividend
                 from stocks_dividend s
+                where stock_id = {0}
             )
-            where stock_id = {}
-            group by date(date)
-            order by date
+            group by local_date
+            order by local_date
         """.format(
             self.pk
         )
@@ -682,16 +710,16 @@ class Stock(models.Model):
                 sum(amount) over (order by date rows between 
                 unbounded preceding and current row) as amount
                 from (
-                select date(date) as date, sum(amount) as amount
+                select local_date as date, sum(amount) as amount
                 from (
                     select 
-                        date,
+                        local_date,
                         case when buy_or_sell = 'BUY' then stock_amount 
                         else stock_amount * -1 end as amount
                     from stocks_trade
                     where stock_id = {}
                 )
-                group by date(date)
+                group by local_date
             )
         """.format(
             self.pk
@@ -701,14 +729,12 @@ class Stock(models.Model):
         return df
 
     def get_price_df(self):
-        # this statement retreives all prices and groups them by date.
+        # the close of every day from the rollup of the prices.
         statement = """
-            select 
-                date(date) as date, 
-                max(price) as price 
-            from stocks_price
+            select day as date, close as price
+            from stocks_pricerollup
             where isin='{}'
-            group by date(date)
+            order by day
         """.format(
             self.isin
         )
@@ -720,7 +746,7 @@ class Stock(models.Model):
         return utils.create_value_df_from_amount_and_price(self)
 
 
-class PriceFetcher(models.Model):
+class PriceFetcher(CircuitBreakerMixin, FetcherStatsMixin, models.Model):
     stock = models.ForeignKey(
         Stock, on_delete=models.CASCADE, related_name="price_fetchers"
     )
@@ -732,6 +758,9 @@ class PriceFetcher(models.Model):
     fetcher_type = models.CharField(max_length=250, choices=PRICE_FETCHER_TYPES)
     data = models.JSONField(default=dict)
     error = models.CharField(max_length=1000, blank=True)
+    # circuit breaker
+    failures = models.PositiveIntegerField(default=0, editable=False)
+    next_attempt_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     class Meta:
         verbose_name = "Price Fetcher"
@@ -772,7 +801,7 @@ class PriceFetcher(models.Model):
 
     @property
     def has_a_current_price(self) -> bool:
-        price = Price.objects.filter(isin=self.stock.isin).order_by("-date").first()
+        price = self.stock.get_latest_price()
         if price and not price.is_almost_old:
             return True
         return False
@@ -780,6 +809,7 @@ class PriceFetcher(models.Model):
     def run(self):
         fetcher: Fetcher = self.fetcher_class()
         success, result = fetcher.fetch_single(self.fetcher_input)
+        self.record_attempt(success, fetcher.stats.get(""))
         if success:
             assert isinstance(result, float)
             self.save_price(result)
@@ -793,23 +823,46 @@ class PriceFetcher(models.Model):
         price = Price(isin=stock.isin, date=timezone.now(), price=price)
         price.save()
         self.error = ""
+        self.close_circuit()
         self.save()
 
     def set_error(self, error: str):
         self.error = error
+        self.register_failure()
         self.save()
 
 
-class Flow(models.Model):
-    bank = models.ForeignKey(Bank, related_name="flows", on_delete=models.CASCADE)
+class FetchAttempt(CoreFetchAttempt):
+    fetcher = models.ForeignKey(
+        PriceFetcher, on_delete=models.CASCADE, related_name="attempts"
+    )
+
+    class Meta(CoreFetchAttempt.Meta):
+        verbose_name = "Fetch Attempt"
+        verbose_name_plural = "Fetch Attempts"
+        indexes = [models.Index(fields=["fetcher", "-created_at"])]
+
+
+class Flow(LocalDateMixin, models.Model):
+    bank = models.ForeignKey(
+        Bank, related_name="flows", on_delete=models.CASCADE, db_index=False
+    )
     date = models.DateTimeField()
+    local_date = models.DateField(editable=False)
     flow = models.DecimalField(max_digits=20, decimal_places=2)
     short_description = models.CharField(max_length=200, blank=True)
 
+    objects = LocalDateQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Depot"
         verbose_name_plural = "Depots"
         ordering = ["-date"]
+        # the composite index replaces the single column index of the bank
+        indexes = [
+            models.Index(fields=["bank", "date"]),
+            models.Index(fields=["bank", "local_date"]),
+        ]
 
     def __str__(self):
         return "{} - {} - {}".format(self.get_date(), self.bank, self.flow)
@@ -831,16 +884,28 @@ class Flow(models.Model):
         return timezone.localtime(self.date).strftime("%d.%m.%Y %H:%M")
 
 
-class Dividend(models.Model):
-    stock = models.ForeignKey(Stock, on_delete=models.CASCADE, related_name="dividends")
-    bank = models.ForeignKey(Bank, on_delete=models.CASCADE, related_name="dividends")
+class Dividend(LocalDateMixin, models.Model):
+    stock = models.ForeignKey(
+        Stock, on_delete=models.CASCADE, related_name="dividends", db_index=False
+    )
+    bank = models.ForeignKey(
+        Bank, on_delete=models.CASCADE, related_name="dividends", db_index=False
+    )
     date = models.DateTimeField()
+    local_date = models.DateField(editable=False)
     dividend = models.DecimalField(decimal_places=2, max_digits=20)
 
+    objects = LocalDateQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Dividend"
         verbose_name_plural = "Dividends"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["bank", "date"]),
+            models.Index(fields=["stock", "date"]),
+            models.Index(fields=["stock", "local_date"]),
+        ]
 
     def __str__(self):
         return "{} - {} - {}".format(self.stock, self.get_date(), self.dividend)
@@ -863,19 +928,31 @@ class Dividend(models.Model):
         return timezone.localtime(self.date).strftime("%d.%m.%Y %H:%M")
 
 
-class Trade(models.Model):
-    bank = models.ForeignKey(Bank, on_delete=models.CASCADE, related_name="trades")
-    stock = models.ForeignKey(Stock, on_delete=models.CASCADE, related_name="trades")
+class Trade(LocalDateMixin, models.Model):
+    bank = models.ForeignKey(
+        Bank, on_delete=models.CASCADE, related_name="trades", db_index=False
+    )
+    stock = models.ForeignKey(
+        Stock, on_delete=models.CASCADE, related_name="trades", db_index=False
+    )
     date = models.DateTimeField()
+    local_date = models.DateField(editable=False)
     money_amount = models.DecimalField(max_digits=20, decimal_places=2)
     stock_amount = models.DecimalField(max_digits=10, decimal_places=4)
     TRADE_TYPES = (("BUY", "Buy"), ("SELL", "Sell"))
     buy_or_sell = models.CharField(max_length=50, choices=TRADE_TYPES)
 
+    objects = LocalDateQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Trade"
         verbose_name_plural = "Trades"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["bank", "date"]),
+            models.Index(fields=["stock", "date"]),
+            models.Index(fields=["stock", "local_date"]),
+        ]
 
     def __str__(self):
         return "{} - {} - {}".format(self.get_date(), self.bank, self.stock)
@@ -906,15 +983,38 @@ class Trade(models.Model):
         return timezone.localtime(self.date).strftime("%d.%m.%Y %H:%M")
 
 
-class Price(models.Model):
+class PriceRollup(CorePriceRollup):
+    KEY = "isin"
+    PRICE_TABLE = "stocks_price"
+
+    isin = models.CharField(max_length=12, verbose_name="ISIN")
+
+    class Meta(CorePriceRollup.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["isin", "day"], name="stocks_pricerollup_unique"
+            )
+        ]
+
+
+class Price(LocalDateMixin, RolledUpPriceMixin, models.Model):
+    ROLLUP = PriceRollup
+
     date = models.DateTimeField()
+    local_date = models.DateField(editable=False)
     isin = ISIN
     price = models.DecimalField(max_digits=20, decimal_places=2)
 
+    objects = LocalDateQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Price"
         verbose_name_plural = "Prices"
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["isin", "date"]),
+            models.Index(fields=["isin", "local_date"]),
+        ]
 
     def __str__(self):
         return "{} - {} - {}".format(self.isin, self.get_date(), self.price)
@@ -936,12 +1036,13 @@ class Price(models.Model):
         self.reset()
 
     def reset(self):
-        affected_stocks = (
+        affected_stocks = list(
             Stock.objects.filter(isin=self.isin)
             .select_related("depot")
             .prefetch_related("depot__banks")
         )
-        for stock in list(affected_stocks):
+        prefetch_latest_prices(affected_stocks)
+        for stock in affected_stocks:
             stock.reset(self)
             stock.depot.reset()
             [bank.reset() for bank in list(stock.depot.banks.all())]
@@ -949,3 +1050,27 @@ class Price(models.Model):
     # getters
     def get_date(self):
         return timezone.localtime(self.date).strftime("%d.%m.%Y %H:%M")
+
+
+def get_latest_prices(isins: Iterable[str]) -> dict[str, Price]:
+    # one query for the latest price of every isin instead of one query per isin
+    prices = (
+        Price.objects.filter(isin__in=set(isins))
+        .annotate(
+            rank=Window(
+                RowNumber(), partition_by=[F("isin")], order_by=F("date").desc()
+            )
+        )
+        .filter(rank=1)
+        # the window is served by the (isin, date) index, the default
+        # ordering would only add a sort of the result
+        .order_by()
+    )
+    return {price.isin: price for price in prices}
+
+
+def prefetch_latest_prices(stocks: Iterable[Stock]):
+    stocks = list(stocks)
+    latest_prices = get_latest_prices([stock.isin for stock in stocks])
+    for stock in stocks:
+        stock._latest_price = latest_prices.get(stock.isin)
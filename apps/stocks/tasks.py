@@ -1,44 +1,123 @@
+from datetime import date
 from typing import Callable, Mapping
 
 from pydantic import BaseModel
 
+from apps.core import retention
+from apps.core.fetchers.base import FetchStats
 from apps.core.fetchers.selenium import SeleniumFetcher
 from apps.core.fetchers.website import WebsiteFetcher
 from apps.stocks.fetchers.marketstack import MarketstackFetcher
-from apps.stocks.models import PriceFetcher
+from apps.stocks.models import (
+    FetchAttempt,
+    Price,
+    PriceFetcher,
+    PriceRollup,
+    prefetch_latest_prices,
+)
 
 FETCHER_FUNCTION = Callable[[PriceFetcher], tuple[bool, str]]
 
 
 def get_fetchers_to_be_run(fetcher_type: str) -> dict[str, BaseModel]:
+    fetchers = list(
+        PriceFetcher.objects.filter(fetcher_type=fetcher_type)
+        .select_related("stock")
+        .prefetch_related("attempts")
+    )
+    prefetch_latest_prices([fetcher.stock for fetcher in fetchers])
     fetchers_to_be_run: list[PriceFetcher] = []
-    for fetcher in list(PriceFetcher.objects.filter(fetcher_type=fetcher_type)):
+    for fetcher in fetchers:
+        if not fetcher.is_due:
+            continue
         if fetcher.has_a_current_price:
             continue
         fetchers_to_be_run.append(fetcher)
+    # slow fetchers run last, this way they do not hold up the fast ones and
+    # are the ones that are cut off if the cron job runs into its timeout
+    fetchers_to_be_run.sort(key=lambda fetcher: fetcher.get_stats().p95 or 0)
     return {str(fetcher.pk): fetcher.fetcher_input for fetcher in fetchers_to_be_run}
 
 
-def save_prices(results: Mapping[str, tuple[bool, str | float]]):
+def save_prices(
+    results: Mapping[str, tuple[bool, str | float]],
+    stats: Mapping[str, FetchStats] | None = None,
+) -> int:
+    saved = 0
     for fetcher, result in results.items():
         fetcher = PriceFetcher.objects.get(pk=fetcher)
+        fetcher.record_attempt(result[0], (stats or {}).get(str(fetcher.pk)))
         if result[0]:
             assert isinstance(result[1], float)
             fetcher.save_price(result[1])
+            saved += 1
         else:
             assert isinstance(result[1], str)
             fetcher.set_error(result[1])
+    return saved
+
 
+def fetch_prices() -> int:
+    saved = 0
 
-def fetch_prices():
     data = get_fetchers_to_be_run("WEBSITE")
-    results = WebsiteFetcher().fetch_multiple(data)
-    save_prices(results)
+    fetcher = WebsiteFetcher()
+    results = fetcher.fetch_multiple(data)
+    saved += save_prices(results, fetcher.stats)
 
     data = get_fetchers_to_be_run("SELENIUM")
-    results = SeleniumFetcher().fetch_multiple(data)
-    save_prices(results)
+    fetcher = SeleniumFetcher()
+    results = fetcher.fetch_multiple(data)
+    saved += save_prices(results, fetcher.stats)
 
     data = get_fetchers_to_be_run("MARKETSTACK")
-    results = MarketstackFetcher().fetch_multiple(data)
-    save_prices(results)
+    fetcher = MarketstackFetcher()
+    results = fetcher.fetch_multiple(data)
+    saved += save_prices(results, fetcher.stats)
+
+    FetchAttempt.delete_old()
+    return saved
+
+
+def fetch_historical_prices(date_from: date, date_to: date) -> int:
+    fetchers = PriceFetcher.objects.filter(fetcher_type="MARKETSTACK").select_related(
+        "stock"
+    )
+    isins: dict[str, set[str]] = {}
+    for fetcher in fetchers:
+        symbol = fetcher.fetcher_input.symbol  # type: ignore
+        isins.setdefault(symbol, set()).add(fetcher.stock.isin)
+    if not isins:
+        return 0
+
+    history = MarketstackFetcher().fetch_history(isins.keys(), date_from, date_to)
+
+    all_isins = set().union(*isins.values())
+    existing = set(
+        Price.objects.filter(
+            isin__in=all_isins, local_date__gte=date_from, local_date__lte=date_to
+        ).values_list("isin", "local_date")
+    )
+    prices: list[Price] = []
+    for symbol, rows in history.items():
+        for isin in isins[symbol]:
+            for day, close in rows:
+                price = Price(isin=isin, date=day, price=close)
+                price.set_local_date()
+                if (isin, price.local_date) in existing:
+                    continue
+                existing.add((isin, price.local_date))
+                prices.append(price)
+    Price.objects.bulk_create(prices)
+
+    # bulk_create skips save, refresh the rollups and reset every affected isin
+    # once instead
+    for isin in {price.isin for price in prices}:
+        days = [price.local_date for price in prices if price.isin == isin]
+        PriceRollup.refresh(isin, min(days), max(days))
+        Price(isin=isin).reset()
+    return len(prices)
+
+
+def compact_prices() -> int:
+    return retention.compact_prices(Price).rows
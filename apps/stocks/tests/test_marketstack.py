@@ -0,0 +1,144 @@
+import json
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+
+from apps.stocks.fetchers.marketstack import (
+    MarketstackError,
+    MarketstackFetcher,
+    MarketstackFetcherInput,
+)
+from apps.stocks.models import Price, PriceFetcher, Stock
+from apps.stocks.tasks import fetch_historical_prices
+from apps.users.models import StandardUser
+
+HISTORY = {
+    "VAR1.XETRA": [
+        ("2024-01-02T00:00:00+0000", 10.123),
+        ("2024-01-03T00:00:00+0000", 11.0),
+        ("2024-01-04T00:00:00+0000", 12.0),
+    ],
+    "SAP.XETRA": [("2024-01-02T00:00:00+0000", 150.0)],
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    requests: list[dict] = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: value[0] for key, value in parse_qs(url.query).items()}
+        StubHandler.requests.append({"path": url.path, **query})
+        symbols = query["symbols"].split(",")
+        if "FAIL" in symbols:
+            body = {"error": {"message": "invalid symbol"}}
+        elif url.path.endswith("/eod/latest"):
+            body = {
+                "data": [
+                    {"symbol": symbol, "close": HISTORY[symbol][-1][1]}
+                    for symbol in symbols
+                    if symbol in HISTORY
+                ]
+            }
+        else:
+            rows = [
+                {"symbol": symbol, "date": day, "close": close}
+                for symbol in symbols
+                for day, close in HISTORY.get(symbol, [])
+                if query["date_from"] <= day[:10] <= query["date_to"]
+            ]
+            offset, limit = int(query["offset"]), int(query["limit"])
+            page = rows[offset : offset + limit]
+            body = {
+                "pagination": {"count": len(page), "total": len(rows)},
+                "data": page,
+            }
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class MarketstackTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/v1"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        StubHandler.requests = []
+
+    def get_fetcher(self, **kwargs) -> MarketstackFetcher:
+        return MarketstackFetcher(base_url=self.url, **kwargs)
+
+    def test_symbols_are_fetched_in_chunks(self):
+        data = {
+            "1": MarketstackFetcherInput(symbol="VAR1.XETRA"),
+            "2": MarketstackFetcherInput(symbol="SAP.XETRA"),
+            "3": MarketstackFetcherInput(symbol="VAR1.XETRA"),
+            "4": MarketstackFetcherInput(symbol="MISSING"),
+        }
+        fetcher = self.get_fetcher(chunk_size=2)
+        results = fetcher.fetch_multiple(data)
+        assert results["1"] == (True, 12.0)
+        assert results["2"] == (True, 150.0)
+        assert results["3"] == (True, 12.0)
+        assert results["4"] == (False, "Price not found in response.")
+        assert len(StubHandler.requests) == 2
+        assert fetcher.stats["1"].bytes > 0 and fetcher.stats["1"].duration > 0
+
+    def test_error_only_affects_its_chunk(self):
+        data = {
+            "1": MarketstackFetcherInput(symbol="FAIL"),
+            "2": MarketstackFetcherInput(symbol="SAP.XETRA"),
+        }
+        results = self.get_fetcher(chunk_size=1).fetch_multiple(data)
+        assert results["1"][0] is False
+        assert "invalid symbol" in str(results["1"][1])
+        assert results["2"] == (True, 150.0)
+
+    def test_history_is_paginated(self):
+        history = self.get_fetcher(page_size=2).fetch_history(
+            ["VAR1.XETRA"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+        assert [close for _, close in history["VAR1.XETRA"]] == [10.12, 11.0, 12.0]
+        assert len(StubHandler.requests) == 2
+
+    def test_history_raises_on_error(self):
+        with self.assertRaises(MarketstackError):
+            self.get_fetcher().fetch_history(
+                ["FAIL"], date(2024, 1, 1), date(2024, 1, 31)
+            )
+
+    def test_historical_prices_are_saved_once(self):
+        user = StandardUser.objects.create_user(username="Dummy")  # type: ignore
+        depot = user.create_random_stocks_data()
+        stock = Stock.objects.get(depot=depot)
+        PriceFetcher.objects.create(
+            stock=stock, fetcher_type="MARKETSTACK", data={"symbol": "VAR1.XETRA"}
+        )
+        Price.objects.filter(isin=stock.isin).delete()
+        with self.settings(MARKETSTACK_URL=self.url):
+            saved = fetch_historical_prices(date(2024, 1, 3), date(2024, 1, 4))
+            assert saved == 2
+            saved = fetch_historical_prices(date(2024, 1, 2), date(2024, 1, 4))
+            assert saved == 1
+        assert Price.objects.filter(isin=stock.isin).count() == 3
+        stock.refresh_from_db()
+        assert stock.price is not None and float(stock.price.price) == 12.0
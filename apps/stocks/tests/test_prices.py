@@ -0,0 +1,236 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.admin import site
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.core.fetchers.base import FetchStats
+from apps.core.models import CIRCUIT_FAILURES
+from apps.core.retention import compact_prices
+from apps.stocks.admin import PriceFetcherAdmin
+from apps.stocks.models import (
+    FetchAttempt,
+    Price,
+    PriceFetcher,
+    PriceRollup,
+    Stock,
+    get_latest_prices,
+)
+from apps.stocks.tasks import get_fetchers_to_be_run
+from apps.users.models import StandardUser
+
+
+class LatestPriceTestCase(TestCase):
+    def setUp(self):
+        self.user = StandardUser.objects.create_user(username="Dummy")  # type: ignore
+        self.depot = self.user.create_random_stocks_data()
+        self.stock = Stock.objects.get(depot=self.depot)
+        self.other = Stock.objects.create(
+            depot=self.depot, name="Other", isin="DE0000000002"
+        )
+
+    def test_latest_price_is_returned_for_every_isin(self):
+        now = timezone.now()
+        Price.objects.create(
+            isin=self.stock.isin, date=now - timedelta(days=2), price=1
+        )
+        latest = Price.objects.create(isin=self.stock.isin, date=now, price=2)
+        other = Price.objects.create(isin=self.other.isin, date=now, price=3)
+        prices = get_latest_prices([self.stock.isin, self.other.isin, "unknown"])
+        assert prices == {self.stock.isin: latest, self.other.isin: other}
+
+    def test_fetcher_selection_uses_a_constant_number_of_queries(self):
+        data = {"website": "https://example.com", "target": "span"}
+        for stock in [self.stock, self.other]:
+            PriceFetcher.objects.create(stock=stock, fetcher_type="WEBSITE", data=data)
+        Price.objects.create(isin=self.stock.isin, date=timezone.now(), price=1)
+        with self.assertNumQueries(3):
+            to_be_run = get_fetchers_to_be_run("WEBSITE")
+        assert list(to_be_run.keys()) == [
+            str(PriceFetcher.objects.get(stock=self.other).pk)
+        ]
+
+
+class FetcherStatsTestCase(TestCase):
+    def setUp(self):
+        self.user = StandardUser.objects.create_user(username="Dummy")  # type: ignore
+        self.depot = self.user.create_random_stocks_data()
+        self.stock = Stock.objects.get(depot=self.depot)
+
+    def create_fetcher(self) -> PriceFetcher:
+        data = {"website": "https://example.com", "target": "span"}
+        return PriceFetcher.objects.create(
+            stock=self.stock, fetcher_type="WEBSITE", data=data
+        )
+
+    def test_stats_are_aggregated(self):
+        fetcher = self.create_fetcher()
+        for duration in range(1, 11):
+            stats = FetchStats(duration=duration, bytes=100)
+            fetcher.record_attempt(duration != 10, stats)
+        stats = PriceFetcher.objects.prefetch_related("attempts").get().get_stats()
+        assert stats.attempts == 10
+        assert stats.success_rate == 0.9
+        assert stats.p50 == 5.5
+        assert stats.p95 is not None and 9 < stats.p95 < 10
+        assert stats.last_success is not None
+
+    def test_admin_calculates_the_stats_once_per_fetcher(self):
+        self.create_fetcher().record_attempt(True, FetchStats(duration=2))
+        admin = PriceFetcherAdmin(PriceFetcher, site)
+        fetcher = PriceFetcher.objects.prefetch_related("attempts").get()
+        with patch.object(PriceFetcher, "get_stats", wraps=fetcher.get_stats) as mock:
+            columns = [admin.p50, admin.p95, admin.success_rate, admin.last_success]
+            assert [column(fetcher) for column in columns][:3] == [2, 2, 1]
+        assert mock.call_count == 1
+
+    def test_old_attempts_are_deleted(self):
+        fetcher = self.create_fetcher()
+        fetcher.record_attempt(True, None)
+        fetcher.attempts.update(created_at=timezone.now() - timedelta(days=30))
+        fetcher.record_attempt(False, None)
+        assert FetchAttempt.delete_old() == 1
+        assert fetcher.get_stats().success_rate == 0
+
+    def test_slow_fetchers_run_last(self):
+        slow = self.create_fetcher()
+        fast = self.create_fetcher()
+        slow.record_attempt(True, FetchStats(duration=30))
+        fast.record_attempt(True, FetchStats(duration=1))
+        assert list(get_fetchers_to_be_run("WEBSITE").keys()) == [
+            str(fast.pk),
+            str(slow.pk),
+        ]
+
+
+class CircuitBreakerTestCase(TestCase):
+    def setUp(self):
+        self.user = StandardUser.objects.create_user(username="Dummy")  # type: ignore
+        self.depot = self.user.create_random_stocks_data()
+        self.stock = Stock.objects.get(depot=self.depot)
+        data = {"website": "https://example.com", "target": "span"}
+        self.fetcher = PriceFetcher.objects.create(
+            stock=self.stock, fetcher_type="WEBSITE", data=data
+        )
+
+    def test_backoff_grows_until_the_circuit_opens(self):
+        pauses = []
+        for _ in range(CIRCUIT_FAILURES):
+            assert self.fetcher.circuit_state == "CLOSED"
+            self.fetcher.set_error("broken")
+            assert self.fetcher.next_attempt_at is not None
+            pauses.append(self.fetcher.next_attempt_at - timezone.now())
+        assert pauses == sorted(pauses)
+        assert self.fetcher.circuit_state == "OPEN"
+        assert str(self.fetcher.pk) not in get_fetchers_to_be_run("WEBSITE")
+
+    def test_half_open_fetcher_is_probed_and_closed_on_success(self):
+        for _ in range(CIRCUIT_FAILURES):
+            self.fetcher.set_error("broken")
+        PriceFetcher.objects.update(next_attempt_at=timezone.now())
+        self.fetcher.refresh_from_db()
+        assert self.fetcher.circuit_state == "HALF_OPEN"
+        assert str(self.fetcher.pk) in get_fetchers_to_be_run("WEBSITE")
+        self.fetcher.save_price(10.0)
+        self.fetcher.refresh_from_db()
+        assert self.fetcher.circuit_state == "CLOSED"
+        assert self.fetcher.failures == 0
+
+
+class PriceRollupTestCase(TestCase):
+    def setUp(self):
+        self.user = StandardUser.objects.create_user(username="Dummy")  # type: ignore
+        self.depot = self.user.create_random_stocks_data()
+        self.isin = "DE0000000003"
+        self.day = timezone.now().replace(hour=8, minute=0, second=0, microsecond=0)
+        self.day -= timedelta(days=3)
+
+    def create(self, hours: int, price: float) -> Price:
+        return Price.objects.create(
+            isin=self.isin, date=self.day + timedelta(hours=hours), price=price
+        )
+
+    def get_rollup(self) -> tuple:
+        rollup = PriceRollup.objects.get(isin=self.isin)
+        return (rollup.open, rollup.high, rollup.low, rollup.close, rollup.count)
+
+    def test_prices_of_a_day_are_rolled_up(self):
+        self.create(2, 10)
+        self.create(0, 12)
+        self.create(4, 8)
+        self.create(1, 15)
+        assert self.get_rollup() == (12, 15, 8, 8, 4)
+
+    def test_changed_and_deleted_prices_are_refreshed(self):
+        self.create(0, 10)
+        price = self.create(1, 20)
+        price.price = 5
+        price.save()
+        assert self.get_rollup() == (10, 10, 5, 5, 2)
+        price.date -= timedelta(days=1)
+        price.save()
+        assert PriceRollup.objects.filter(isin=self.isin).count() == 2
+        price.delete()
+        assert self.get_rollup() == (10, 10, 10, 10, 1)
+
+    def test_prices_of_the_top_price_day_can_be_changed(self):
+        stock = Stock.objects.create(depot=self.depot, name="Top", isin=self.isin)
+        price = self.create(0, 30)
+        self.create(1, 20)
+        stock.calculate_top_price()
+        stock.save()
+        assert stock.top_price == 30
+        price.price = 40
+        price.save()
+        price.delete()
+        PriceRollup.rebuild()
+        stock.calculate_top_price()
+        assert stock.top_price == 20
+
+    def test_rebuild_matches_the_upserts(self):
+        for hours, price in [(0, 3), (5, 1), (26, 7), (27, 2)]:
+            self.create(hours, price)
+        fields = ["day", "open", "high", "low", "close", "last_date", "count"]
+        rollups = PriceRollup.objects.filter(isin=self.isin).values_list(*fields)
+        upserted = list(rollups)
+        PriceRollup.rebuild()
+        assert len(upserted) == 2
+        assert list(rollups) == upserted
+
+
+class PriceCompactionTestCase(TestCase):
+    def setUp(self):
+        self.isin = "DE0000000004"
+        now = timezone.now().replace(hour=8, minute=0, second=0, microsecond=0)
+        for days in [100, 90, 2]:
+            for hours, price in [(0, 10), (1, 30), (2, 20), (3, 25), (4, 15)]:
+                Price.objects.create(
+                    isin=self.isin,
+                    date=now - timedelta(days=days, hours=-hours),
+                    price=price,
+                )
+
+    def test_old_days_keep_their_open_high_low_and_close(self):
+        fields = ["day", "open", "high", "low", "close"]
+        rollups = list(PriceRollup.objects.values_list(*fields))
+        stats = compact_prices(Price, keep_days=30, chunk_size=1)
+        assert (stats.days, stats.rows) == (2, 4)
+        assert list(PriceRollup.objects.values_list(*fields)) == rollups
+        prices = Price.objects.filter(isin=self.isin).order_by("date")
+        assert [p.price for p in prices] == [10, 30, 15] * 2 + [10, 30, 20, 25, 15]
+
+    def test_refresh_of_compacted_days_keeps_their_rollups(self):
+        fields = ["day", "open", "high", "low", "close", "first_date", "last_date"]
+        rollups = list(PriceRollup.objects.values_list(*fields))
+        compact_prices(Price, keep_days=30)
+        PriceRollup.rebuild()
+        assert list(PriceRollup.objects.values_list(*fields)) == rollups
+        price = Price.objects.filter(isin=self.isin).order_by("date").first()
+        price.save()
+        assert list(PriceRollup.objects.values_list(*fields)) == rollups
+
+    def test_compaction_can_be_repeated(self):
+        compact_prices(Price, keep_days=30)
+        stats = compact_prices(Price, keep_days=30)
+        assert (stats.days, stats.rows) == (0, 0)
@@ -4,6 +4,7 @@ from django.contrib import messages
 from django.http import HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
 from django.views import generic
 from django.views.generic.detail import SingleObjectMixin
 
@@ -51,12 +52,13 @@ class IndexView(GetUserMixin, TabContextMixin, generic.DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["stats"] = self.object.get_stats()
+        # the stats are only calculated if they are not in the fragment cache
+        context["stats"] = SimpleLazyObject(self.object.get_stats)
         context["banks"] = self.object.banks.select_related("bucket").order_by(
             "-value", "name"
         )
         context["stocks"] = self.object.stocks.select_related(
-            "price", "top_price", "bucket"
+            "price", "bucket"
         ).order_by("-value", "name")
         context["values"] = self.object.get_values()
         context["flows"] = self.object.get_flows()
@@ -140,7 +142,7 @@ class StockView(GetUserMixin, TabContextMixin, generic.DetailView):
         context["dividends"] = self.object.dividends.all()
         context["values"] = self.object.get_values()
         context["flows"] = self.object.get_flows()
-        context["fetchers"] = self.object.price_fetchers.all()
+        context["fetchers"] = self.object.price_fetchers.prefetch_related("attempts")
         return context
 
 
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0021_alter_standarduser_front_page"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="standarduser",
+            name="data_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
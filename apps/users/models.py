@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Union
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
 from django.db import models
+from django.db.models import F
 from django.utils import timezone
 
 from apps.core.functional import list_filter
@@ -28,6 +29,8 @@ class StandardUser(AbstractUser):
     date_format = models.CharField(max_length=20, choices=DATE_FORMAT_CHOICES)
     front_page = models.CharField(max_length=200, default="/overview/dashboard/")
     rounded_numbers = models.BooleanField(default=True)
+    # bumped whenever data of the user changes, used as the cache version
+    data_version = models.PositiveIntegerField(default=0, editable=False)
 
     if TYPE_CHECKING:
         crypto_depots: QuerySet[CryptoDepto]
@@ -36,6 +39,13 @@ class StandardUser(AbstractUser):
         banking_depots: QuerySet[BankingDepot]
         buckets: QuerySet["Bucket"]
 
+    # cache
+    @staticmethod
+    def bump_data_version(user_id: int):
+        StandardUser.objects.filter(pk=user_id).update(
+            data_version=F("data_version") + 1
+        )
+
     # getters
     def get_active_crypto_depot(self):
         try:
@@ -94,7 +104,13 @@ class StandardUser(AbstractUser):
 
     # create
     def create_random_banking_data(self):
-        from apps.banking.models import Account, Category, Change, Depot
+        from apps.banking.models import (
+            Account,
+            Category,
+            Change,
+            ChangeRollup,
+            Depot,
+        )
 
         name = "Depot {}".format(random.randrange(100, 999))
         depot = Depot.objects.create(name=name, user=self, is_active=True)
@@ -148,6 +164,7 @@ class StandardUser(AbstractUser):
                 )
             )
         Change.objects.bulk_create(changes)
+        ChangeRollup.rebuild([account1, account2])
         # return the depot that was created and contains the test data
         return depot
 
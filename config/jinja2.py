@@ -2,10 +2,39 @@ from django.contrib import messages
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.urls import reverse
 from django.utils.timezone import localtime
-from jinja2 import Environment
+from jinja2 import Environment, nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from apps.core.cache import get_or_set_fragment
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Caches the rendered body per depot and name until the data of the user
+    changes:
+
+        {% cache depot, "stats" %}...{% endcache %}
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        obj = parser.parse_expression()
+        parser.stream.expect("comma")
+        name = parser.parse_expression()
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        call = self.call_method("_render", [obj, name])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(self, obj, name, caller):
+        # the body is already escaped, it must not be escaped again
+        return Markup(get_or_set_fragment(obj, name, lambda: str(caller())))
 
 
 def environment(**options):
+    options["extensions"] = [*options.get("extensions", []), FragmentCacheExtension]
     env = Environment(**options)
     env.globals.update(
         {
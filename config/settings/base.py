@@ -81,10 +81,33 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "config.wsgi.application"
 
+# the web and the cron container share the database file. with the write
+# ahead log readers are not blocked by a long cron transaction and writers
+# wait for the lock instead of failing with "database is locked".
+SQLITE_PRAGMAS = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "busy_timeout": 20000,
+    "cache_size": -16000,  # in kib
+    "mmap_size": 64 * 1024 * 1024,
+    "temp_store": "memory",
+}
+
+
+def get_sqlite_init_command(pragmas: dict) -> str:
+    return ";".join("PRAGMA {}={}".format(key, value) for key, value in pragmas.items())
+
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": os.path.join(BASE_DIR, "tmp/db.sqlite3"),
+        "OPTIONS": {
+            "init_command": get_sqlite_init_command(SQLITE_PRAGMAS),
+            # take the write lock when the transaction starts, a read lock
+            # that is upgraded later can not wait for the busy timeout
+            "transaction_mode": "IMMEDIATE",
+        },
     }
 }
 
@@ -138,14 +161,75 @@ EMAIL_HOST_PASSWORD = get_secret("EMAIL_PWD")
 EMAIL_PORT = 587
 
 MARKETSTACK_API_KEY = get_secret("MARKETSTACK_API_KEY")
+MARKETSTACK_URL = "http://api.marketstack.com/v1"
 
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
+# entries are versioned per user, so outdated entries are never read but stay
+# until the least recently used ones are culled once MAX_ENTRIES is reached
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "finance",
+        "TIMEOUT": 60 * 60 * 24,
+        "OPTIONS": {"MAX_ENTRIES": 500, "CULL_FREQUENCY": 4},
+    }
+}
+
+# timeout and interval are in seconds, jobs with a higher priority start first
 CRONJOBS = [
-    "apps.banking.tasks.calculate_change_counts",
-    "apps.stocks.tasks.fetch_prices",
-    "apps.crypto.tasks.fetch_prices",
+    {
+        "path": "apps.crypto.tasks.fetch_prices",
+        "timeout": 120,
+        "priority": 2,
+    },
+    {
+        "path": "apps.banking.tasks.calculate_change_counts",
+        "timeout": 120,
+        "interval": 60 * 60 * 6,
+        "priority": 1,
+    },
+    {
+        "path": "apps.stocks.tasks.fetch_prices",
+        "timeout": 230,
+        "priority": 0,
+    },
+    {
+        "path": "apps.stocks.tasks.compact_prices",
+        "timeout": 120,
+        "interval": 60 * 60 * 24,
+        "priority": -1,
+    },
+    {
+        "path": "apps.crypto.tasks.compact_prices",
+        "timeout": 120,
+        "interval": 60 * 60 * 24,
+        "priority": -1,
+    },
+    {
+        "path": "apps.core.tasks.backup_database",
+        "timeout": 230,
+        "interval": 60 * 60 * 24,
+        "priority": -2,
+    },
+    {
+        "path": "apps.core.tasks.optimize_database",
+        "timeout": 120,
+        "interval": 60 * 60 * 24,
+        "priority": -1,
+    },
 ]
+CRON_WORKERS = 2
+
+# the chunks and snapshots of the backupdatabase command
+BACKUP_DIR = os.path.join(BASE_DIR, "tmp/backups")
+BACKUP_KEEP = 30
+
+# prices older than this are compacted to the open, high, low and close of
+# their day
+PRICE_RETENTION_DAYS = 60
+# days that are compacted in one transaction
+PRICE_COMPACTION_CHUNK = 200
 
 SESSION_COOKIE_AGE = 60 * 60 * 24 * 365  # 1 year
 
@@ -16,14 +16,13 @@ ready(function () {
     .forEach((modal) => document.body.appendChild(modal));
 });
 
-ready(function () {
-  document.querySelectorAll(".modal-button").forEach((button) => {
-    button.addEventListener("click", function (event) {
-      const url = event.target.dataset.action;
-      const modal = document.querySelector(event.target.dataset.bsTarget);
-      insertFormIntoModal(modal, url);
-    });
-  });
+// listen on the document so that buttons added later get the handler as well
+document.addEventListener("click", function (event) {
+  const button = event.target.closest(".modal-button");
+  if (button === null) return;
+  const url = button.dataset.action;
+  const modal = document.querySelector(button.dataset.bsTarget);
+  insertFormIntoModal(modal, url);
 });
 
 function insertFormIntoModal(modal, url) {